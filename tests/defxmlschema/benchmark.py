@@ -0,0 +1,74 @@
+import importlib
+import timeit
+from pathlib import Path
+from typing import Iterator
+from typing import Tuple
+from typing import Type
+
+from tests.conftest import read_root_name
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.handlers import ExpatEventHandler
+from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import LxmlTargetHandler
+
+here = Path(__file__).parent
+tests = here.parent.parent
+fixtures = here.parent.joinpath("fixtures")
+
+handlers = (LxmlEventHandler, LxmlTargetHandler, ExpatEventHandler)
+
+
+def find_class(instance: Path) -> Type:
+    name = read_root_name(instance)
+    for module_path in sorted(instance.parent.glob("*.py")):
+        module_name = ".".join(module_path.relative_to(tests).with_suffix("").parts)
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+
+        if hasattr(module, name):
+            return getattr(module, name)
+
+    raise ModuleNotFoundError(f"Class `{name}` not found.")
+
+
+def samples() -> Iterator[Tuple[Path, Type, bytes]]:
+    for instance in sorted(fixtures.glob("defxmlschema/*/chapter*.xml")):
+        if instance.name.endswith(".xsdata.xml"):
+            continue
+
+        try:
+            clazz = find_class(instance)
+            source = instance.read_bytes()
+            XmlParser().from_bytes(source, clazz)
+        except Exception:
+            continue
+
+        yield instance, clazz, source
+
+
+def benchmark(number: int = 200):
+    header = "".join(f"{handler.__name__:>20}" for handler in handlers)
+    print(f"{'fixture':<20}{header}")
+
+    totals = [0.0] * len(handlers)
+    for instance, clazz, source in samples():
+        timings = []
+        for index, handler in enumerate(handlers):
+            parser = XmlParser(handler=handler())
+            timing = timeit.timeit(
+                lambda: parser.from_bytes(source, clazz), number=number
+            )
+            totals[index] += timing
+            timings.append(timing)
+
+        row = "".join(f"{timing:>19.4f}s" for timing in timings)
+        print(f"{instance.name:<20}{row}")
+
+    row = "".join(f"{timing:>19.4f}s" for timing in totals)
+    print(f"{'total':<20}{row}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -3,6 +3,8 @@ import unittest
 from abc import ABC
 from abc import abstractmethod
 
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
 from xsdata.models.codegen import Attr
 from xsdata.models.codegen import AttrType
 from xsdata.models.codegen import Class
@@ -313,3 +315,17 @@ class PackageFactory(Factory):
             source=source or "target",
             alias=alias or None,
         )
+
+
+class BooksFactory:
+    @classmethod
+    def create(cls, index: int) -> Books:
+        return Books(book=[BookForm(id=f"bk{index}", author=f"author {index}")])
+
+    @classmethod
+    def source(cls, index: int, prefix: str = "brk") -> bytes:
+        return (
+            f'<{prefix}:books xmlns:{prefix}="urn:books">'
+            f'<book id="bk{index}"><author>author {index}</author></book>'
+            f"</{prefix}:books>"
+        ).encode()
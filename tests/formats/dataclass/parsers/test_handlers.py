@@ -0,0 +1,121 @@
+import io
+from unittest.case import TestCase
+
+from tests.fixtures.books import Books
+from xsdata.formats.dataclass.parsers.handlers import EventCollector
+from xsdata.formats.dataclass.parsers.handlers import ExpatEventHandler
+from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import LxmlTargetHandler
+from xsdata.formats.dataclass.parsers.handlers import TargetElement
+from xsdata.formats.dataclass.parsers.xml import XmlParser
+from xsdata.models.enums import EventType
+
+xml = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<brk:books xmlns:brk="urn:books">\n'
+    '  <book id="bk001">\n'
+    "    <author>Hightower, Kim</author>\n"
+    "    <title>The First Book</title>\n"
+    "    <genre>Fiction</genre>\n"
+    "    <price>44.95</price>\n"
+    "    <pub_date>2000-10-01</pub_date>\n"
+    "    <!-- comment -->\n"
+    "    <review>An amazing story of nothing.</review>\n"
+    "  </book>\n"
+    "</brk:books>\n"
+).encode()
+
+
+class TargetElementTests(TestCase):
+    def test_element_api(self):
+        root = TargetElement("root", {}, {"a": "b"})
+        child = TargetElement("child", {"a": "1"}, {"a": "b"}, root, 3)
+        child.text = "foo"
+        child.tail = "bar"
+
+        self.assertIsNone(root.getparent())
+        self.assertIs(root, child.getparent())
+        self.assertIsNone(child.getprevious())
+        self.assertEqual({"a": "b"}, child.nsmap)
+        self.assertIsNot(child.nsmap, child.nsmap)
+        self.assertEqual(3, child.sourceline)
+
+        child.clear()
+        self.assertEqual({}, child.attrib)
+        self.assertIsNone(child.text)
+        self.assertIsNone(child.tail)
+
+
+class EventCollectorTests(TestCase):
+    def test_collect(self):
+        collector = EventCollector()
+        collector.start_ns(None, "foo")
+        collector.start("{foo}a", {"b": "1"})
+        collector.data("one")
+        collector.start_ns("x", "bar")
+        collector.start("{bar}c", {})
+        collector.data("two")
+        collector.end("{bar}c")
+        collector.data("three")
+        collector.data("four")
+
+        events = list(collector.drain())
+        root = events[1][1]
+        child = events[3][1]
+        self.assertEqual(
+            [
+                (EventType.START_NS, ("", "foo")),
+                (EventType.START, root),
+                (EventType.START_NS, ("x", "bar")),
+                (EventType.START, child),
+            ],
+            events,
+        )
+        self.assertEqual("one", root.text)
+        self.assertEqual("two", child.text)
+        self.assertEqual("threefour", child.tail)
+        self.assertEqual({None: "foo"}, root.nsmap)
+        self.assertEqual({None: "foo", "x": "bar"}, child.nsmap)
+
+        collector.end("{foo}a")
+        self.assertEqual([(EventType.END, child)], list(collector.drain()))
+        self.assertEqual([(EventType.END, root)], list(collector.drain(final=True)))
+        self.assertEqual([], list(collector.drain(final=True)))
+
+
+class XmlHandlerTests(TestCase):
+    def test_handlers_bind_the_same_objects(self):
+        expected = XmlParser(handler=LxmlEventHandler()).from_bytes(xml, Books)
+        handlers = [
+            LxmlTargetHandler(),
+            LxmlTargetHandler(chunk_size=5),
+            ExpatEventHandler(),
+            ExpatEventHandler(chunk_size=5),
+        ]
+
+        for handler in handlers:
+            parser = XmlParser(handler=handler)
+            self.assertEqual(expected, parser.from_bytes(xml, Books))
+            self.assertEqual({"brk": "urn:books"}, parser.namespaces.ns_map)
+
+    def test_expat_event_handler_source_lines(self):
+        handler = ExpatEventHandler()
+        lines = [
+            element.sourceline
+            for event, element in handler.events(io.BytesIO(xml))
+            if event == EventType.START
+        ]
+        self.assertEqual([2, 3, 4, 5, 6, 7, 8, 10], lines)
+
+    def test_lxml_target_handler_source_lines(self):
+        handler = LxmlTargetHandler()
+        lines = [
+            element.sourceline
+            for event, element in handler.events(io.BytesIO(xml))
+            if event == EventType.START
+        ]
+        self.assertEqual([None] * 8, lines)
+
+    def test_clark_notation(self):
+        self.assertEqual("{foo}bar", ExpatEventHandler.clark_notation("foo}bar"))
+        self.assertEqual("bar", ExpatEventHandler.clark_notation("bar"))
@@ -1,13 +1,19 @@
+import gc
+import io
 import json
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import make_dataclass
 from unittest.case import TestCase
 
-from lxml.etree import QName
-
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
-from xsdata.formats.dataclass.models.elements import XmlElement
-from xsdata.formats.dataclass.models.elements import XmlText
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.parsers.json import JSON_DECODERS
+from xsdata.formats.dataclass.parsers.json import JSON_STATIC_DECODERS
+from xsdata.formats.dataclass.parsers.json import JsonDecoder
 from xsdata.formats.dataclass.parsers.json import JsonParser
+from xsdata.formats.dataclass.parsers.json import JsonStream
 
 
 class JsonParserTests(TestCase):
@@ -67,14 +73,145 @@ class JsonParserTests(TestCase):
             books.book[1],
         )
 
-    def test_get_value(self):
-        data = dict(foo="bar", bar="foo")
+    def test_iterparse(self):
+        parser = JsonParser()
+        books = self.data["book"]
+        expected = parser.from_string(json.dumps(self.data), Books).book
+
+        source = io.BytesIO(json.dumps(books).encode())
+        self.assertEqual(expected, list(parser.iterparse(source, BookForm)))
+
+        lines = "\n".join(json.dumps(book) for book in books)
+        source = io.BytesIO(lines.encode())
+        self.assertEqual(expected, list(parser.iterparse(source, BookForm)))
+
+        lines = "\n".join(json.dumps([book]) for book in books)
+        source = io.BytesIO(lines.encode())
+        actual = list(parser.iterparse(source, BookForm, lines=True))
+        self.assertEqual(expected, actual)
+
+    def test_decoder(self):
+        parser = JsonParser()
+        decoder = parser.decoder(Books)
+
+        self.assertIsInstance(decoder, JsonDecoder)
+        self.assertIs(decoder, parser.decoder(Books))
+        self.assertIs(decoder, JsonParser().decoder(Books))
+        self.assertIsNot(decoder, JsonParser(name_generator=str).decoder(Books))
+
+        name, keys, is_list, decode = decoder.fields[0]
+        self.assertEqual(("book", ("book", "book"), True), (name, keys, is_list))
+        self.assertEqual(parser.decoder(BookForm).decode, decode)
+
+    def test_decoder_cache_does_not_keep_classes_alive(self):
+        parser = JsonParser()
+        item = make_dataclass("Item", [("value", str)])
+        inner = make_dataclass("Inner", [("item", item)])
 
-        foo_field = XmlText(name="foo", qname=QName("foo"), types=[str])
-        bar_field = XmlElement(
-            name="bar", qname=QName("bar"), types=[str], default=list
+        self.assertEqual(
+            inner(item("a")), parser.from_string('{"item": {"value": "a"}}', inner)
+        )
+
+        decoders = JSON_DECODERS[parser.name_generator]
+        self.assertIn(inner, decoders)
+        self.assertIn(item, decoders)
+
+        size = len(decoders)
+        del parser, inner, item
+        gc.collect()
+        self.assertEqual(size - 2, len(decoders))
+
+    def test_decoder_with_builtin_name_generator(self):
+        parser = JsonParser(name_generator=str.lower)
+        self.assertEqual(
+            BookForm(author="a"), parser.from_string('{"author": "a"}', BookForm)
         )
+        self.assertIn(BookForm, JSON_STATIC_DECODERS[str.lower])
+
+    def test_decoder_decode(self):
+        decoder = JsonParser().decoder(BookForm)
+
+        actual = decoder.decode([{"author": "Kim", "price": "1.5", "title": None}])
+        self.assertEqual(BookForm(author="Kim", price=1.5), actual)
+
+        decoder = JsonParser().decoder(Books)
+        actual = decoder.decode({"book": {"id": "bk001"}})
+        self.assertEqual(Books(book=[BookForm(id="bk001")]), actual)
+
+    def test_decoder_decode_with_multiple_keys(self):
+        @dataclass
+        class Item:
+            value: str = field(metadata=dict(name="Value"))
+
+        decoder = JsonParser().decoder(Item)
+        self.assertEqual(Item("a"), decoder.decode({"Value": "a", "value": "b"}))
+        self.assertEqual(Item("b"), decoder.decode({"value": "b"}))
+
+    def test_decoder_decode_raises_parser_error(self):
+        @dataclass
+        class Item:
+            value: str = field(metadata=dict(type="Element"))
+
+        decoder = JsonParser().decoder(Item)
+
+        with self.assertRaises(ParserError) as cm:
+            decoder.decode({"unknown": 1})
+
+        self.assertEqual("Parsing failed", str(cm.exception))
+
+
+class JsonStreamTests(TestCase):
+    def test_iter_array(self):
+        values = [{"a": "é" * 10}, 123, [1, 2], "x", None, 1.5e10, {}]
+        source = io.BytesIO(json.dumps(values, ensure_ascii=False).encode())
+
+        self.assertEqual(values, list(JsonStream(source, read_size=3)))
+        self.assertEqual([], list(JsonStream(io.BytesIO(b" [ ] "))))
+
+    def test_iter_documents(self):
+        values = [{"a": 1}, 1234, "a", {"b": [1, 2]}]
+        text = "\n".join(json.dumps(value) for value in values) + "\n"
+        data = "\ufeff".encode() + text.encode()
+
+        self.assertEqual(values, list(JsonStream(io.StringIO(text), read_size=2)))
+        self.assertEqual(values, list(JsonStream(io.BytesIO(data), read_size=2)))
+        self.assertEqual([], list(JsonStream(io.BytesIO(b""))))
+
+    def test_iter_documents_with_lines(self):
+        values = [[1, 2], [{"a": 1}], []]
+        text = "\n".join(json.dumps(value) for value in values)
+
+        stream = JsonStream(io.StringIO(text), read_size=2, lines=True)
+        self.assertEqual(values, list(stream))
+
+        stream = JsonStream(io.StringIO(json.dumps(values)), lines=True)
+        self.assertEqual([values], list(stream))
+
+    def test_iter_keeps_the_buffer_bounded(self):
+        record = {"id": "a" * 100}
+        source = io.BytesIO(json.dumps([record] * 1000).encode())
+        stream = JsonStream(source, read_size=64)
+
+        sizes = set()
+        for value in stream:
+            self.assertEqual(record, value)
+            sizes.add(len(stream.buffer))
+
+        self.assertTrue(max(sizes) < 300)
+
+    def test_iter_raises_errors(self):
+        with self.assertRaises(ParserError) as cm:
+            list(JsonStream(io.BytesIO(b'[{"a": 1} {"b": 2}]')))
+
+        self.assertEqual("Expected `,` or `]` at position 10", str(cm.exception))
+
+        with self.assertRaises(ParserError) as cm:
+            list(JsonStream(io.BytesIO(b"[1] 2")))
+
+        self.assertEqual("Unexpected data at position 4", str(cm.exception))
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(JsonStream(io.BytesIO(b'[{"a": 1}, {"b": 2'), read_size=4))
 
-        self.assertEqual("bar", JsonParser.get_value(data, foo_field))
-        self.assertEqual(["foo"], JsonParser.get_value(data, bar_field))
-        self.assertIsNone(JsonParser.get_value({}, bar_field))
+        with self.assertRaises(ParserError):
+            list(JsonStream(io.BytesIO(b"[1, 2")))
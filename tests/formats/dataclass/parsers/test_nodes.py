@@ -43,6 +43,21 @@ class XmlNodeTests(TestCase):
         with self.assertRaises(NotImplementedError):
             XmlNode(0).parse_element(ele, [])
 
+    def test_nodes_are_slotted(self):
+        var = XmlText(name="foo", qname=QName("foo"))
+        nodes = [
+            XmlNode(0),
+            RootNode(0, XmlContext().build(Foo), None, ParserConfig(), None),
+            WildcardNode(0, "foo"),
+            PrimitiveNode(0, var),
+            SkipNode(0),
+        ]
+        for node in nodes:
+            self.assertFalse(hasattr(node, "__dict__"))
+
+        with self.assertRaises(TypeError):
+            ElementNode(0, XmlContext().build(Foo), None, ParserConfig())
+
 
 class ElementNodeTests(TestCase):
     @mock.patch.object(ParserUtils, "bind_element_wild_text")
@@ -79,7 +94,9 @@ class ElementNodeTests(TestCase):
         ele = Element("foo")
         pool = [1, 2, 3]
 
-        node = ElementNode(position=0, meta=meta, default=None, config=ParserConfig())
+        node = ElementNode(
+            position=0, meta=meta, default=None, config=ParserConfig(), projection=None
+        )
         qname, obj = node.parse_element(ele, pool)
 
         self.assertEqual(QName(ele.tag), qname)
@@ -113,7 +130,9 @@ class ElementNodeTests(TestCase):
         namespace = meta.qname.namespace
         mock_ctx_fetch.return_value = replace(meta)
         mock_element_xsi_type.return_value = xsi_type
-        node = ElementNode(position=0, meta=meta, default=None, config=cfg)
+        node = ElementNode(
+            position=0, meta=meta, default=None, config=cfg, projection=None
+        )
 
         actual = node.next_node(ele, 10, ctx)
         self.assertIsInstance(actual, ElementNode)
@@ -135,7 +154,9 @@ class ElementNodeTests(TestCase):
             nillable=False,
             vars=[var],
         )
-        node = ElementNode(position=0, meta=meta, default=None, config=cfg)
+        node = ElementNode(
+            position=0, meta=meta, default=None, config=cfg, projection=None
+        )
 
         actual = node.next_node(ele, 10, ctx)
         self.assertIsInstance(actual, WildcardNode)
@@ -155,14 +176,14 @@ class ElementNodeTests(TestCase):
             nillable=False,
             vars=[var],
         )
-        node = ElementNode(position=0, meta=meta, default=None, config=cfg)
+        node = ElementNode(
+            position=0, meta=meta, default=None, config=cfg, projection=None
+        )
 
         actual = node.next_node(ele, 10, ctx)
         self.assertIsInstance(actual, PrimitiveNode)
         self.assertEqual(10, actual.position)
-        self.assertEqual([int], actual.types)
-        self.assertEqual(100, actual.default)
-        self.assertEqual(var.is_tokens, actual.tokens)
+        self.assertIs(var, actual.var)
 
     def test_next_node_when_given_qname_does_not_match_any_var(self):
         ele = Element("nope")
@@ -175,7 +196,9 @@ class ElementNodeTests(TestCase):
             source_qname=QName("foo"),
             nillable=False,
         )
-        node = ElementNode(position=0, meta=meta, default=None, config=cfg)
+        node = ElementNode(
+            position=0, meta=meta, default=None, config=cfg, projection=None
+        )
 
         with self.assertRaises(XmlContextError) as cm:
             node.next_node(ele, 10, ctx)
@@ -193,7 +216,9 @@ class ElementNodeTests(TestCase):
             source_qname=QName("foo"),
             nillable=False,
         )
-        node = ElementNode(position=0, meta=meta, default=None, config=cfg)
+        node = ElementNode(
+            position=0, meta=meta, default=None, config=cfg, projection=None
+        )
         actual = node.next_node(ele, 10, ctx)
         self.assertEqual(SkipNode(position=10), actual)
 
@@ -204,7 +229,9 @@ class RootNodeTests(TestCase):
         ctx = XmlContext()
         cfg = ParserConfig()
         meta = ctx.build(Foo)
-        node = RootNode(position=0, meta=meta, default=None, config=cfg)
+        node = RootNode(
+            position=0, meta=meta, default=None, config=cfg, projection=None
+        )
         self.assertIs(node, node.next_node(ele, 0, ctx))
 
     def test_next_node_return_next_node(self):
@@ -214,7 +241,9 @@ class RootNodeTests(TestCase):
         ctx = XmlContext()
         cfg = ParserConfig()
         meta = ctx.build(Foo)
-        node = RootNode(position=0, meta=meta, default=None, config=cfg)
+        node = RootNode(
+            position=0, meta=meta, default=None, config=cfg, projection=None
+        )
         actual = node.next_node(ele, 0, ctx)
 
         self.assertIsInstance(actual, PrimitiveNode)
@@ -249,22 +278,20 @@ class WildcardNodeTests(TestCase):
 
 
 class PrimitiveNodeTests(TestCase):
-    @mock.patch.object(ParserUtils, "parse_value")
-    def test_parse_element(self, mock_parse_value):
-        mock_parse_value.return_value = 13
-        node = PrimitiveNode(position=0, types=[int], default=100)
+    @mock.patch.object(ParserUtils, "parse_var")
+    def test_parse_element(self, mock_parse_var):
+        mock_parse_var.return_value = 13
+        var = XmlText(name="foo", qname=QName("foo"), types=[int], default=100)
+        node = PrimitiveNode(position=0, var=var)
         ele = Element("foo", nsmap={"foo": "bar"})
         ele.text = "13"
 
         self.assertEqual((QName("foo"), 13), node.parse_element(ele, []))
-        self.assertFalse(node.tokens)
-        mock_parse_value.assert_called_once_with(
-            node.types, ele.text, 100, ele.nsmap, node.tokens
-        )
+        mock_parse_var.assert_called_once_with(var, ele.text, ele)
 
     def test_next_node(self):
         ele = Element("foo")
-        node = PrimitiveNode(position=0, types=[])
+        node = PrimitiveNode(position=0, var=XmlText(name="foo", qname=QName("foo")))
 
         with self.assertRaises(XmlContextError):
             node.next_node(ele, 10, XmlContext())
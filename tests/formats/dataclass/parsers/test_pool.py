@@ -0,0 +1,107 @@
+import multiprocessing
+from concurrent.futures import Future
+from functools import partial
+from unittest.case import TestCase
+
+from tests.factories import BooksFactory
+from tests.fixtures.books import Books
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.parsers.pool import __worker__
+from xsdata.formats.dataclass.parsers.pool import init_worker
+from xsdata.formats.dataclass.parsers.pool import parse_chunk
+from xsdata.formats.dataclass.parsers.pool import ParserPool
+from xsdata.formats.dataclass.parsers.projection import Projection
+from xsdata.formats.dataclass.parsers.xml import XmlParser
+
+
+class ParserPoolTests(TestCase):
+    def tearDown(self):
+        __worker__.clear()
+
+    def test_init_worker_and_parse_chunk(self):
+        init_worker(partial(XmlParser))
+        parser = __worker__["parser"]
+        self.assertIsInstance(parser, XmlParser)
+
+        actual = parse_chunk(
+            [BooksFactory.source(1), b"", BooksFactory.source(2)], Books
+        )
+        self.assertEqual(BooksFactory.create(1), actual[0])
+        self.assertIsInstance(actual[1], ParserError)
+        self.assertTrue(str(actual[1]).startswith("XMLSyntaxError: "))
+        self.assertEqual(BooksFactory.create(2), actual[2])
+
+        init_worker(partial(XmlParser))
+        self.assertIsNot(parser, __worker__["parser"])
+
+    def test_chunks(self):
+        pool = ParserPool(XmlParser, chunksize=2)
+        actual = list(pool.chunks(iter("abcde")))
+        expected = [(0, ["a", "b"]), (2, ["c", "d"]), (4, ["e"])]
+        self.assertEqual(expected, actual)
+
+        pool = ParserPool(XmlParser, chunksize=0)
+        self.assertEqual(1, pool.chunksize)
+
+    def test_results(self):
+        future: Future = Future()
+        future.set_result(["a", "b"])
+        self.assertEqual([(3, "a"), (4, "b")], list(ParserPool.results(future, 3, 2)))
+
+        error = ParserError("broken")
+        future = Future()
+        future.set_exception(error)
+        expected = [(3, error), (4, error)]
+        self.assertEqual(expected, list(ParserPool.results(future, 3, 2)))
+
+    def test_completed(self):
+        first: Future = Future()
+        second: Future = Future()
+        first.set_result(["a"])
+        pending = {first: (0, 1), second: (1, 1)}
+
+        self.assertEqual([(0, "a")], list(ParserPool.completed(pending)))
+        self.assertEqual({second: (1, 1)}, pending)
+
+
+class XmlParserParseManyTests(TestCase):
+    def test_parse_many(self):
+        sources = [BooksFactory.source(i) for i in range(10)]
+        sources[3] = b""
+        parser = XmlParser()
+
+        actual = list(parser.parse_many(iter(sources), Books, workers=2, chunksize=3))
+        self.assertEqual(list(range(10)), [index for index, _ in actual])
+        for index, result in actual:
+            if index == 3:
+                self.assertIsInstance(result, ParserError)
+            else:
+                self.assertEqual(BooksFactory.create(index), result)
+
+        actual = parser.parse_many(sources, Books, workers=2, ordered=False)
+        actual = dict(actual)
+        self.assertEqual(set(range(10)), set(actual))
+        self.assertEqual(BooksFactory.create(9), actual[9])
+
+    def test_parse_many_with_projection(self):
+        sources = [BooksFactory.source(i) for i in range(4)]
+        projection = Projection.from_paths(["book.id"])
+        parser = XmlParser(projection=projection)
+
+        actual = dict(parser.parse_many(sources, Books, workers=2))
+        for index, source in enumerate(sources):
+            expected = parser.from_bytes(source, Books)
+            self.assertIsNone(expected.book[0].author)
+            self.assertEqual(expected, actual[index])
+
+    def test_parse_many_with_spawn_start_method(self):
+        sources = [BooksFactory.source(i) for i in range(2)]
+        method = multiprocessing.get_start_method()
+        multiprocessing.set_start_method("spawn", force=True)
+        try:
+            actual = dict(XmlParser().parse_many(sources, Books, workers=1))
+        finally:
+            multiprocessing.set_start_method(method, force=True)
+
+        self.assertEqual(BooksFactory.create(0), actual[0])
+        self.assertEqual(BooksFactory.create(1), actual[1])
@@ -0,0 +1,91 @@
+import pickle
+from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+from unittest.case import TestCase
+
+from lxml.etree import Element
+from lxml.etree import QName
+
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.nodes import ElementNode
+from xsdata.formats.dataclass.parsers.nodes import SkipNode
+from xsdata.formats.dataclass.parsers.projection import Projection
+
+
+@dataclass
+class Item:
+    name: str = field(metadata=dict(type="Element"))
+    price: float = field(metadata=dict(type="Element"))
+    tags: List[str] = field(default_factory=list, metadata=dict(type="Element"))
+
+
+class ProjectionTests(TestCase):
+    def setUp(self):
+        self.ctx = XmlContext()
+
+    def test_from_paths(self):
+        projection = Projection.from_paths(["a.b.c", "a.d", "e", "e.f", "a.b"])
+
+        self.assertEqual(["a", "e"], list(projection.fields))
+        self.assertIsNone(projection.child("e"))
+        self.assertIsNone(projection.child("x"))
+
+        a = projection.child("a")
+        self.assertEqual(["b", "d"], list(a.fields))
+        self.assertIsNone(a.child("b"))
+        self.assertIsNone(a.child("d"))
+
+    def test_project(self):
+        meta = self.ctx.build(BookForm)
+        projection = Projection.from_paths(["title", "id"])
+
+        actual = projection.project(meta)
+        self.assertEqual(["title", "id"], [var.name for var in actual.vars])
+        self.assertIsNone(actual.find_child_var(QName("author")))
+        self.assertEqual({}, actual.cache)
+        self.assertIsNot(meta.cache, actual.cache)
+        self.assertIs(actual, projection.project(meta))
+        self.assertEqual({}, projection.defaults[BookForm])
+
+    def test_pickle(self):
+        projection = Projection.from_paths(["book.title"])
+        projection.project(self.ctx.build(Books))
+
+        actual = pickle.loads(pickle.dumps(projection))
+        self.assertEqual(["book"], list(actual.fields))
+        self.assertEqual(["title"], list(actual.child("book").fields))
+        self.assertEqual({}, actual.metas)
+        self.assertEqual({}, actual.defaults)
+
+    def test_bind_defaults(self):
+        meta = self.ctx.build(Item)
+        projection = Projection.from_paths(["tags"])
+        projection.project(meta)
+
+        params = {"tags": ["a"]}
+        projection.bind_defaults(params, Item)
+        self.assertEqual({"tags": ["a"], "name": None, "price": None}, params)
+        self.assertEqual(Item(None, None, ["a"]), Item(**params))
+
+    def test_element_node_next_node(self):
+        projection = Projection.from_paths(["book.title"])
+        meta = projection.project(self.ctx.build(Books))
+        config = ParserConfig(fail_on_unknown_properties=True)
+        node = ElementNode(
+            position=0, meta=meta, default=None, config=config, projection=projection
+        )
+
+        actual = node.next_node(Element("book"), 1, self.ctx)
+        self.assertIsInstance(actual, ElementNode)
+        self.assertIs(projection.child("book"), actual.projection)
+        self.assertEqual(["title"], [var.name for var in actual.meta.vars])
+
+        actual = actual.next_node(Element("author"), 2, self.ctx)
+        self.assertEqual(SkipNode(position=2), actual)
+
+        actual = node.next_node(Element("unknown"), 1, self.ctx)
+        self.assertEqual(SkipNode(position=1), actual)
@@ -4,7 +4,6 @@ from dataclasses import make_dataclass
 from dataclasses import replace
 from unittest import mock
 from unittest.case import TestCase
-from unittest.mock import MagicMock
 
 from lxml.etree import Element
 from lxml.etree import QName
@@ -12,11 +11,14 @@ from lxml.etree import QName
 from tests.fixtures.books import Books
 from tests.fixtures.defxmlschema.chapter08.example0803 import DressSize
 from tests.fixtures.defxmlschema.chapter12.chapter12 import ProductType
+from xsdata.formats.converters import TypeConverter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.constants import XmlType
 from xsdata.formats.dataclass.models.elements import FindMode
 from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlText
 from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.models.elements import XmlWildcard
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
 from xsdata.models.enums import Namespace
@@ -27,6 +29,17 @@ class ParserUtilsTests(TestCase):
     def setUp(self) -> None:
         self.ctx = XmlContext()
 
+    @staticmethod
+    def make_meta(*vars: XmlVar) -> XmlMeta:
+        return XmlMeta(
+            name="foo",
+            clazz=None,
+            qname=QName("foo"),
+            source_qname=QName("foo"),
+            nillable=False,
+            vars=list(vars),
+        )
+
     def test_parse_xsi_type(self):
         ele = Element("foo")
         self.assertIsNone(ParserUtils.parse_xsi_type(ele))
@@ -69,6 +82,59 @@ class ParserUtilsTests(TestCase):
             ]
         )
 
+    def test_parse_var(self):
+        var = XmlVar(
+            name="a",
+            qname=QName("a"),
+            types=[int],
+            default=100,
+            converter=TypeConverter([int]),
+        )
+        self.assertEqual(100, ParserUtils.parse_var(var, None))
+        self.assertEqual(1, ParserUtils.parse_var(var, "1"))
+
+        var = replace(var, default=lambda: 1)
+        self.assertIsNone(ParserUtils.parse_var(var, None))
+
+    def test_parse_var_with_tokens(self):
+        var = XmlText(
+            name="a",
+            qname=QName("a"),
+            types=[int],
+            default=list,
+            converter=TypeConverter([int]),
+        )
+        self.assertEqual([1, 2, 3], ParserUtils.parse_var(var, " 1 2 3"))
+        self.assertEqual([1, 2, 3], ParserUtils.parse_var(var, ["1", "2", "3"]))
+
+    def test_parse_var_resolves_ns_map_only_for_qualified_types(self):
+        element = mock.Mock(nsmap={"foo": "bar"})
+        var = XmlVar(
+            name="a", qname=QName("a"), types=[QName], converter=TypeConverter([QName])
+        )
+        actual = ParserUtils.parse_var(var, "foo:x", element)
+        self.assertEqual(QName("bar", "x"), actual)
+
+        element = mock.Mock(spec=["text"])
+        var = XmlVar(
+            name="a", qname=QName("a"), types=[int], converter=TypeConverter([int])
+        )
+        self.assertEqual(1, ParserUtils.parse_var(var, "1", element))
+
+    @mock.patch.object(ParserUtils, "parse_value", return_value=2)
+    def test_parse_var_without_converter(self, mock_parse_value):
+        element = Element("foo", nsmap={"foo": "bar"})
+        var = XmlVar(name="a", qname=QName("a"), types=[int], default=1)
+
+        self.assertEqual(2, ParserUtils.parse_var(var, "1", element))
+        self.assertEqual(2, ParserUtils.parse_var(var, "1"))
+        mock_parse_value.assert_has_calls(
+            [
+                mock.call([int], "1", 1, element.nsmap, False),
+                mock.call([int], "1", 1, None, False),
+            ]
+        )
+
     @mock.patch.object(ParserUtils, "bind_element_wildcard_param")
     @mock.patch.object(ParserUtils, "find_eligible_wildcard")
     @mock.patch.object(ParserUtils, "bind_element_param")
@@ -123,10 +189,11 @@ class ParserUtilsTests(TestCase):
     def test_fetch_any_children(self):
         objects = [(x, x) for x in "abc"]
         self.assertEqual(["b", "c"], ParserUtils.fetch_any_children(1, objects))
+        self.assertEqual([("a", "a")], objects)
 
-    @mock.patch.object(ParserUtils, "parse_value")
-    def test_bind_element_attrs(self, mock_parse_value):
-        mock_parse_value.return_value = "2020-03-02"
+    @mock.patch.object(ParserUtils, "parse_var")
+    def test_bind_element_attrs(self, mock_parse_var):
+        mock_parse_var.return_value = "2020-03-02"
         metadata = self.ctx.build(ProductType)
         eff_date = metadata.find_var("effDate")
         element = Element("foo")
@@ -137,13 +204,7 @@ class ParserUtilsTests(TestCase):
         ParserUtils.bind_element_attrs(params, metadata, element)
         expected = {"eff_date": "2020-03-02", "other_attributes": {"whatever": "foo"}}
         self.assertEqual(expected, params)
-        mock_parse_value.assert_called_once_with(
-            eff_date.types,
-            "2020-03-01",
-            eff_date.default,
-            element.nsmap,
-            eff_date.is_list,
-        )
+        mock_parse_var.assert_called_once_with(eff_date, "2020-03-01", element)
 
     def test_bind_element_attrs_doesnt_overwrite_values(self):
         metadata = self.ctx.build(ProductType)
@@ -159,8 +220,12 @@ class ParserUtilsTests(TestCase):
     def test_bind_elements_attrs_ignore_init_false_vars(self):
         metadata = self.ctx.build(ProductType)
         eff_date = metadata.find_var("effDate")
-        metadata.vars.remove(eff_date)
-        metadata.vars.append(replace(eff_date, init=False))
+        metadata = replace(
+            metadata,
+            vars=[var for var in metadata.vars if var is not eff_date]
+            + [replace(eff_date, init=False)],
+            cache={},
+        )
 
         element = Element("foo")
         element.set("effDate", "2020-03-01")
@@ -178,8 +243,8 @@ class ParserUtilsTests(TestCase):
         ParserUtils.bind_element_text(params, metadata, element)
         self.assertEqual({}, params)
 
-    @mock.patch.object(ParserUtils, "parse_value", return_value="yes!")
-    def test_bind_element_text_with_text_var(self, mock_parse_value):
+    @mock.patch.object(ParserUtils, "parse_var", return_value="yes!")
+    def test_bind_element_text_with_text_var(self, mock_parse_var):
         element = Element("foo")
         params = dict()
         metadata = self.ctx.build(DressSize)
@@ -190,9 +255,7 @@ class ParserUtilsTests(TestCase):
         element.text = "foo"
         ParserUtils.bind_element_text(params, metadata, element)
         self.assertEqual({"value": "yes!"}, params)
-        mock_parse_value.assert_called_once_with(
-            var.types, element.text, var.default, element.nsmap, var.is_list,
-        )
+        mock_parse_var.assert_called_once_with(var, element.text, element)
 
     def test_bind_element_param(self):
         var = XmlVar(name="a", qname=QName("a"))
@@ -252,18 +315,16 @@ class ParserUtilsTests(TestCase):
         self.assertEqual(dict(a=foo), params)
         self.assertEqual(qname, foo.qname)
 
-    def test_bind_element_wild_text_when_find_var_returns_none(self):
-        meta = mock.Mock(XmlMeta)
-        meta.find_var = MagicMock(return_value=None)
+    def test_bind_element_wild_text_when_meta_has_no_wildcard(self):
+        meta = self.make_meta()
         elem = Element("foo")
         params = dict()
         ParserUtils.bind_element_wild_text(params, meta, elem)
         self.assertEqual(0, len(params))
 
     def test_bind_element_wild_text_when_element_has_no_text_and_tail(self):
-        var = XmlVar(name="a", qname=QName("a"))
-        meta = mock.Mock(XmlMeta)
-        meta.find_var = MagicMock(return_value=var)
+        var = XmlWildcard(name="a", qname=QName("a"))
+        meta = self.make_meta(var)
         elem = Element("foo")
         params = dict()
 
@@ -271,9 +332,8 @@ class ParserUtilsTests(TestCase):
         self.assertEqual(0, len(params))
 
     def test_bind_element_wild_text(self):
-        var = XmlVar(name="a", qname=QName("a"))
-        meta = mock.Mock(XmlMeta)
-        meta.find_var = MagicMock(return_value=var)
+        var = XmlWildcard(name="a", qname=QName("a"))
+        meta = self.make_meta(var)
         elem = Element("foo")
         elem.text = "txt"
         elem.tail = "tail"
@@ -290,9 +350,8 @@ class ParserUtilsTests(TestCase):
         self.assertEqual(dict(a=expected), params)
 
     def test_bind_element_wild_text_when_var_is_list(self):
-        var = XmlVar(name="a", qname=QName("a"), default=list)
-        meta = mock.Mock(XmlMeta)
-        meta.find_var = MagicMock(return_value=var)
+        var = XmlWildcard(name="a", qname=QName("a"), default=list)
+        meta = self.make_meta(var)
         elem = Element("foo")
         elem.text = "txt"
         elem.tail = "tail"
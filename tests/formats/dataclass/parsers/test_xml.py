@@ -1,23 +1,80 @@
+import asyncio
+import io
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Iterator
 from typing import List
 from unittest import mock
+from unittest.case import skipIf
 from unittest.case import TestCase
 
 from lxml.etree import Element
 from lxml.etree import QName
+from lxml.etree import SubElement
 
+from tests.factories import BooksFactory
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
 from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.elements import XmlText
+from xsdata.formats.dataclass.models.generics import Namespaces
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.nodes import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes import RootNode
 from xsdata.formats.dataclass.parsers.nodes import SkipNode
+from xsdata.formats.dataclass.parsers.projection import Projection
 from xsdata.formats.dataclass.parsers.xml import XmlParser
 from xsdata.models.enums import EventType
 
+low_memory_script = """
+import sys
+
+from tests.fixtures.books import Books
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.projection import Projection
+
+
+class Source:
+    def __init__(self, size):
+        record = (
+            b'<book id="bk001"><author>a</author><title>t</title><genre>g</genre>'
+            b"<review>r</review></book>"
+        ) * 10
+        self.chunks = iter(
+            [b'<brk:books xmlns:brk="urn:books">']
+            + [record] * (int(sys.argv[1]) // len(record))
+            + [b"</brk:books>"]
+        )
+
+    def read(self, size=-1):
+        return next(self.chunks, b"")
+
+
+parser = XmlParser(
+    config=ParserConfig(low_memory=sys.argv[2] == "True"),
+    projection=Projection.from_paths([]),
+)
+
+
+def peak():
+    with open("/proc/self/status") as status:
+        line = next(line for line in status if line.startswith("VmHWM:"))
+        return int(line.split()[1])
+
+
+before = peak()
+parser.parse(Source(sys.argv[1]), Books)
+print(peak() - before)
+"""
+
 
 class XmlParserTests(TestCase):
     def setUp(self):
@@ -33,13 +90,15 @@ class XmlParserTests(TestCase):
         self.assertEqual("Failed to create target class `Books`", str(cm.exception))
 
     def test_add_namespace(self):
-        self.parser.add_namespace(("foo", "bar"))
-        self.assertEqual({"foo": "bar"}, self.parser.namespaces.ns_map)
+        namespaces = Namespaces()
+        self.parser.add_namespace(("foo", "bar"), namespaces)
+        self.assertEqual({"foo": "bar"}, namespaces.ns_map)
 
     @mock.patch.object(RootNode, "next_node")
     @mock.patch.object(XmlParser, "emit_event")
     def test_queue(self, mock_emit_event, mock_next_node):
-        primitive_node = PrimitiveNode(position=1, types=[int])
+        var = XmlText(name="foo", qname=QName("foo"), types=[int])
+        primitive_node = PrimitiveNode(position=1, var=var)
         mock_next_node.return_value = primitive_node
         element = Element("{urn:books}books")
         config = ParserConfig()
@@ -48,6 +107,7 @@ class XmlParserTests(TestCase):
             meta=self.parser.context.build(Books),
             default=None,
             config=config,
+            projection=None,
         )
 
         objects = list()
@@ -58,7 +118,11 @@ class XmlParserTests(TestCase):
         self.assertEqual(2, len(queue))
         self.assertEqual(root_queue_item, queue[0])
         self.assertEqual(primitive_node, queue[1])
+        self.assertEqual(0, mock_emit_event.call_count)
 
+        queue.pop()
+        self.parser.hooks = {EventType.START: {"books": "start_books"}}
+        self.parser.queue(element, queue, objects)
         mock_emit_event.assert_called_once_with(
             EventType.START, element.tag, item=root_queue_item, element=element
         )
@@ -71,13 +135,19 @@ class XmlParserTests(TestCase):
 
         objects = list()
         queue = list()
-        queue.append(PrimitiveNode(position=0, types=[str], default=None))
+        var = XmlText(name="foo", qname=QName("foo"), types=[str])
+        queue.append(PrimitiveNode(position=0, var=var))
+        queue.append(PrimitiveNode(position=1, var=var))
 
         result = self.parser.dequeue(element, queue, objects)
         self.assertEqual("result", result)
-        self.assertEqual(0, len(queue))
+        self.assertEqual(1, len(queue))
         self.assertEqual(("q", result), objects[-1])
         mock_parse_element.assert_called_once_with(element, objects)
+        self.assertEqual(0, mock_emit_event.call_count)
+
+        self.parser.hooks = {EventType.END: {"author": "end_author"}}
+        self.parser.dequeue(element, queue, objects)
         mock_emit_event.assert_called_once_with(
             EventType.END, element.tag, obj=result, element=element
         )
@@ -97,14 +167,44 @@ class XmlParserTests(TestCase):
         self.assertEqual(0, len(objects))
         self.assertEqual(0, mock_emit_event.call_count)
 
+    def test_find_hooks(self):
+        @dataclass
+        class HookedParser(XmlParser):
+            start_value = None
+
+            def start_bar_element(self, **kwargs: Any):
+                pass
+
+            def end_foo(self, **kwargs: Any):
+                pass
+
+        self.assertEqual({}, self.parser.hooks)
+        expected = {
+            EventType.START: {"bar_element": "start_bar_element"},
+            EventType.END: {"foo": "end_foo"},
+        }
+        self.assertEqual(expected, HookedParser().hooks)
+
     def test_emit_event(self):
         mock_func = mock.Mock()
         self.parser.foo_bar_element = mock_func
+        self.parser.hooks = {"foo": {"bar_element": "foo_bar_element"}}
 
         self.parser.emit_event("foo", "{tns}barElement", a=1, b=2)
+        self.parser.emit_event("foo", "{tns}thing", a=1, b=2)
+        self.parser.emit_event("bar", "{tns}barElement", a=1, b=2)
 
         mock_func.assert_called_once_with(a=1, b=2)
-        self.assertEqual({"{tns}barElement": "bar_element"}, self.parser.event_names)
+        expected = {"{tns}barElement": "bar_element", "{tns}thing": "thing"}
+        self.assertEqual(expected, self.parser.event_names)
+
+    @mock.patch("xsdata.formats.dataclass.parsers.xml.EVENT_NAMES_SIZE", 2)
+    def test_emit_event_bounds_event_names(self):
+        self.parser.hooks = {"foo": {"bar": "foo_bar"}}
+        for name in "abc":
+            self.parser.emit_event("foo", name)
+
+        self.assertEqual({"c": "c"}, self.parser.event_names)
 
 
 class XmlParserIntegrationTest(TestCase):
@@ -157,6 +257,179 @@ class XmlParserIntegrationTest(TestCase):
         self.assertEqual(self.books, actual)
         self.assertEqual({"brk": "urn:books"}, parser.namespaces.ns_map)
 
+    def test_iterparse(self):
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<brk:books xmlns:brk="urn:books">\n'
+            '  <book id="bk001">\n'
+            "    <author>Hightower, Kim</author>\n"
+            "    <title>The First Book</title>\n"
+            "    <genre>Fiction</genre>\n"
+            "    <price>44.95</price>\n"
+            "    <pub_date>2000-10-01</pub_date>\n"
+            "    <review>An amazing story of nothing.</review>\n"
+            "  </book>\n"
+            '  <book id="bk002">\n'
+            "    <author>Nagata, Suanne</author>\n"
+            "    <title>Becoming Somebody</title>\n"
+            "    <genre>Biography</genre>\n"
+            "    <review>A masterpiece of the fine art of gossiping.</review>\n"
+            "  </book>\n"
+            "</brk:books>\n"
+        )
+
+        parser = XmlParser()
+        actual = parser.iterparse(io.BytesIO(xml.encode()), Books, ["book"])
+        self.assertIsInstance(actual, Iterator)
+        self.assertEqual(self.books.book, list(actual))
+        self.assertEqual({"brk": "urn:books"}, parser.namespaces.ns_map)
+
+    def test_parse_async(self):
+        xml = (
+            '<brk:books xmlns:brk="urn:books">'
+            '<book id="bk001"><author>Hightower, Kim</author>'
+            "<title>The First Book</title><genre>Fiction</genre>"
+            "<price>44.95</price><pub_date>2000-10-01</pub_date>"
+            "<review>An amazing story of nothing.</review></book>"
+            '<book id="bk002"><author>Nagata, Suanne</author>'
+            "<title>Becoming Somebody</title><genre>Biography</genre>"
+            "<review>A masterpiece of the fine art of gossiping.</review></book>"
+            "</brk:books>"
+        ).encode()
+
+        async def chunks():
+            for i in range(0, len(xml), 10):
+                yield xml[i : i + 10]
+
+        async def reader():
+            stream = asyncio.StreamReader()
+            stream.feed_data(xml)
+            stream.feed_eof()
+            return await parser.parse_async(stream, Books, chunk_size=7)
+
+        parser = XmlParser()
+        self.assertEqual(self.books, asyncio.run(parser.parse_async(chunks(), Books)))
+        self.assertEqual({"brk": "urn:books"}, parser.namespaces.ns_map)
+        self.assertEqual(self.books, asyncio.run(reader()))
+
+    @mock.patch.object(XmlParser, "dispatch_events", return_value=None)
+    def test_parse_async_raises_exception(self, *args):
+        async def chunks():
+            yield b"<books/>"
+
+        with self.assertRaises(ParserError) as cm:
+            asyncio.run(XmlParser().parse_async(chunks(), Books))
+
+        self.assertEqual("Failed to create target class `Books`", str(cm.exception))
+
+    def test_parse_async_ignores_child_objects(self):
+        async def chunks():
+            yield b'<books><book id="bk001"/>'
+            yield b"</books>"
+
+        parser = XmlParser()
+
+        def dequeue(element: Element, queue: List, objects: List) -> Any:
+            obj = XmlParser.dequeue(parser, element, queue, objects)
+            return None if len(queue) == 1 else obj
+
+        with mock.patch.object(parser, "dequeue", side_effect=dequeue):
+            with self.assertRaises(ParserError) as cm:
+                asyncio.run(parser.parse_async(chunks(), Books))
+
+        self.assertEqual("Failed to create target class `Books`", str(cm.exception))
+
+    def test_read_chunks(self):
+        async def chunks():
+            yield b"a" * 25
+            yield b""
+            yield b"b"
+
+        async def collect():
+            return [chunk async for chunk in XmlParser.read_chunks(chunks(), 10)]
+
+        expected = [b"a" * 10, b"a" * 10, b"a" * 5, b"b"]
+        self.assertEqual(expected, asyncio.run(collect()))
+
+    def test_release_siblings(self):
+        root = Element("root")
+        children = [SubElement(root, "child") for _ in range(3)]
+
+        XmlParser.release_siblings(children[2])
+        self.assertEqual([children[2]], list(root))
+
+        XmlParser.release_siblings(root)
+        self.assertEqual(1, len(root))
+
+    def test_parse_with_projection(self):
+        xml = (
+            '<brk:books xmlns:brk="urn:books">'
+            '<book id="bk001"><author>Hightower, Kim</author>'
+            "<title>The First Book</title><price>44.95</price></book>"
+            '<book id="bk002"><author>Nagata, Suanne</author>'
+            "<title>Becoming Somebody</title><unknown/></book>"
+            "</brk:books>"
+        )
+        projection = Projection.from_paths(["book.title", "book.id"])
+        parser = XmlParser(projection=projection)
+
+        actual = parser.from_string(xml, Books)
+        expected = Books(
+            book=[
+                BookForm(id="bk001", title="The First Book"),
+                BookForm(id="bk002", title="Becoming Somebody"),
+            ]
+        )
+        self.assertEqual(expected, actual)
+
+    def test_parse_with_low_memory(self):
+        xml = (
+            '<brk:books xmlns:brk="urn:books">'
+            + '<book id="bk001"><author>Hightower, Kim</author></book>' * 10
+            + "</brk:books>"
+        )
+        sizes = []
+
+        @dataclass
+        class LowMemoryParser(XmlParser):
+            def end_book(self, obj: Any, element: Element):
+                sizes.append(len(list(element.itersiblings(preceding=True))))
+
+        config = ParserConfig(low_memory=True)
+        actual = LowMemoryParser(config=config).from_string(xml, Books)
+        self.assertEqual(10, len(actual.book))
+        self.assertEqual([0] + [1] * 9, sizes)
+
+        sizes.clear()
+        LowMemoryParser().from_string(xml, Books)
+        self.assertEqual(list(range(10)), sizes)
+
+    @skipIf(not sys.platform.startswith("linux"), "requires the proc filesystem")
+    def test_parse_with_low_memory_peak_memory(self):
+        def peak(low_memory: bool) -> int:
+            result = subprocess.run(
+                [sys.executable, "-c", low_memory_script, str(size), str(low_memory)],
+                check=True,
+                stdout=subprocess.PIPE,
+                cwd=str(Path(__file__).parents[4]),
+            )
+            return int(result.stdout)
+
+        size = 10 * 1024 * 1024
+        self.assertLess(peak(True) * 4, peak(False), "Peak memory growth in KiB")
+
+    def test_parse_shared_across_threads(self):
+        def parse(index: int):
+            source = BooksFactory.source(index, prefix=f"p{index}")
+            return parser.from_bytes(source, Books), index
+
+        parser = XmlParser(context=XmlContext().warm(Books).freeze())
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for result, index in executor.map(parse, range(200)):
+                self.assertEqual(BooksFactory.create(index), result)
+
+        self.assertEqual(1, len(parser.namespaces.ns_map))
+
     def test_parse_with_fail_on_unknown_properties_false(self):
         xml = (
             '<?xml version="1.0" encoding="UTF-8"?>\n'
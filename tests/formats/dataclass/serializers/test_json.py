@@ -1,9 +1,48 @@
+import io
+import itertools
+import json
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
 from unittest.case import TestCase
 
+from lxml.etree import QName
+
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
 from xsdata.formats.dataclass.serializers import DictFactory
 from xsdata.formats.dataclass.serializers import DictSerializer
+from xsdata.formats.dataclass.serializers import JsonSerializer
+from xsdata.formats.dataclass.serializers.json import JsonEncoder
+
+
+class Code(Enum):
+    A = "a"
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@dataclass
+class Item:
+    name: Optional[str] = None
+    code: Optional[Code] = None
+    price: Optional[Decimal] = None
+    values: Tuple = field(default_factory=tuple)
+    point: Optional[Point] = None
+    items: List["Item"] = field(default_factory=list)
+    extra: Dict = field(default_factory=dict)
+    qname: Optional[QName] = None
 
 
 class DictSerializerTests(TestCase):
@@ -57,3 +96,126 @@ class DictSerializerTests(TestCase):
             ]
         }
         self.assertEqual(expected, actual)
+
+    def test_render_matches_asdict(self):
+        obj = Item(
+            code=Code.A,
+            price=Decimal("1.50"),
+            items=[Item(values=(1, "a"), point=Point(1, 2))],
+            extra={"a": [Item(extra={})]},
+        )
+        factories = [dict, DictFactory.FILTER_NONE, DictFactory.FILTER_EMPTY, list]
+
+        for factory in factories:
+            actual = DictSerializer(dict_factory=factory).render(obj)
+            self.assertEqual(asdict(obj, dict_factory=factory), actual)
+
+        actual = DictSerializer().render(obj)
+        self.assertIs(Code.A, actual["code"])
+        self.assertEqual(Point(1, 2), actual["items"][0]["point"])
+        self.assertIsInstance(actual["items"][0]["point"], Point)
+
+    def test_render_with_filter_empty(self):
+        obj = Item(name="", items=[Item(items=[], extra={})])
+        actual = DictSerializer(dict_factory=DictFactory.FILTER_EMPTY).render(obj)
+
+        self.assertEqual({"items": [{}]}, actual)
+
+
+class JsonSerializerTests(TestCase):
+    def test_render(self):
+        obj = Item(
+            code=Code.A,
+            price=Decimal("1.50"),
+            items=[Item(name="a", values=(1, "a"))],
+            qname=QName("{urn:books}book"),
+        )
+        serializer = JsonSerializer(dict_factory=DictFactory.FILTER_NONE, indent=2)
+        expected = json.dumps(
+            {
+                "name": None,
+                "code": "a",
+                "price": "1.50",
+                "values": [],
+                "point": None,
+                "items": [
+                    {
+                        "name": "a",
+                        "code": None,
+                        "price": None,
+                        "values": [1, "a"],
+                        "point": None,
+                        "items": [],
+                        "extra": {},
+                        "qname": None,
+                    }
+                ],
+                "extra": {},
+                "qname": "{urn:books}book",
+            }
+        )
+        self.assertEqual(expected, JsonSerializer().render(obj))
+
+        obj.qname = None
+        expected = json.dumps(
+            asdict(obj, dict_factory=DictFactory.FILTER_NONE),
+            cls=JsonEncoder,
+            indent=2,
+        )
+        self.assertEqual(expected, serializer.render(obj))
+
+    def test_render_with_custom_encoder(self):
+        class Encoder(JsonEncoder):
+            def default(self, obj: Any) -> Any:
+                if isinstance(obj, Decimal):
+                    return float(obj)
+
+                return super().default(obj)
+
+        serializer = JsonSerializer(encoder=Encoder)
+        actual = serializer.render(Item(code=Code.A, price=Decimal("1.5")))
+        self.assertEqual(1.5, json.loads(actual)["price"])
+        self.assertEqual("a", json.loads(actual)["code"])
+
+    def test_write(self):
+        obj = Item(
+            name="ä",
+            code=Code.A,
+            price=Decimal("1.50"),
+            values=(1.5, True, None),
+            point=Point(1, 2),
+            items=[Item(items=[Item()]), Item(extra={"a": [1, {}], 1: Code.A})],
+            extra={Code.A: "a", None: [], 2.5: Item(name="")},
+            qname=QName("{urn:books}book"),
+        )
+        factories = [dict, DictFactory.FILTER_NONE, DictFactory.FILTER_EMPTY]
+
+        for factory, indent in itertools.product(factories, [None, 0, 2]):
+            serializer = JsonSerializer(dict_factory=factory, indent=indent)
+            output = io.StringIO()
+            serializer.write(obj, output)
+            self.assertEqual(serializer.render(obj), output.getvalue())
+
+        obj = Item(items=[Item(extra={})])
+        serializer = JsonSerializer(dict_factory=DictFactory.FILTER_EMPTY)
+        self.assertEqual('{"items": [{}]}', "".join(serializer.iterencode(obj)))
+
+    def test_write_with_iterators(self):
+        items = [Item(name=str(i)) for i in range(3)]
+        serializer = JsonSerializer(dict_factory=DictFactory.FILTER_EMPTY, indent=2)
+        expected = serializer.render(Item(items=items, values=(1,)))
+
+        obj = Item(items=(item for item in items), values=iter([1]))
+        self.assertEqual(expected, "".join(serializer.iterencode(obj)))
+
+        obj = Item(items=(item for item in []), values=iter([]))
+        self.assertEqual("{}", "".join(serializer.iterencode(obj)))
+
+    def test_write_with_custom_dict_factory(self):
+        def factory(pairs: List) -> Dict:
+            return {key.upper(): value for key, value in pairs if value}
+
+        obj = Item(name="a", items=[Item(name="b", price=Decimal("1.5"))])
+        serializer = JsonSerializer(dict_factory=factory, indent=2)
+
+        self.assertEqual(serializer.render(obj), "".join(serializer.iterencode(obj)))
@@ -0,0 +1,76 @@
+from collections import deque
+from concurrent.futures import Future
+from functools import partial
+from typing import List
+from typing import Optional
+from unittest.case import TestCase
+
+from lxml.etree import Element
+from lxml.etree import tostring
+
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.pool import __worker__
+from xsdata.formats.dataclass.serializers.pool import FragmentSlot
+from xsdata.formats.dataclass.serializers.pool import init_worker
+from xsdata.formats.dataclass.serializers.pool import render_chunk
+from xsdata.formats.dataclass.serializers.pool import SerializerPool
+
+
+def join_chunk(values: List[str]) -> Optional[bytes]:
+    if "x" in values:
+        return None
+
+    return "".join(values).encode()
+
+
+class SerializerPoolTests(TestCase):
+    def tearDown(self):
+        __worker__.clear()
+
+    def test_init_worker_and_render_chunk(self):
+        init_worker(partial(XmlSerializer, xml_declaration=False))
+        serializer = __worker__["serializer"]
+        self.assertIsInstance(serializer, XmlSerializer)
+
+        nsmap = {"ns0": "urn:books"}
+        books = [BookForm(id="bk1"), BookForm(id="bk2")]
+        actual = render_chunk("{urn:books}books", Books, "book", nsmap, nsmap, books)
+        self.assertEqual(
+            b'<book id="bk1" lang="en"/><book id="bk2" lang="en"/>', actual
+        )
+
+        init_worker(partial(XmlSerializer))
+        self.assertIsNot(serializer, __worker__["serializer"])
+
+    def test_fragment_slot(self):
+        root = Element("root")
+        slot = FragmentSlot(root)
+        self.assertEqual([], slot)
+        self.assertEqual(0, len(root))
+
+        self.assertEqual([], list(slot))
+        self.assertEqual(b"<root><_/><_/></root>", tostring(root))
+
+    def test_render(self):
+        pool = SerializerPool(XmlSerializer, workers=2, chunksize=2)
+        self.assertEqual([b"ab", b"cd", b"e"], pool.render(join_chunk, list("abcde")))
+        self.assertIsNone(pool.render(join_chunk, list("abcdexfghijkl")))
+        self.assertEqual([], pool.render(join_chunk, []))
+
+        pool = SerializerPool(XmlSerializer, chunksize=0)
+        self.assertEqual(1, pool.chunksize)
+
+    def test_collect(self):
+        first: Future = Future()
+        second: Future = Future()
+        first.set_result(b"a")
+        second.set_result(None)
+        queue = deque([first, second])
+        results: List[bytes] = []
+
+        self.assertTrue(SerializerPool.collect(queue, results))
+        self.assertFalse(SerializerPool.collect(queue, results))
+        self.assertEqual([b"a"], results)
+        self.assertEqual(0, len(queue))
@@ -0,0 +1,62 @@
+import io
+from unittest.case import TestCase
+
+from lxml.etree import Element
+from lxml.etree import SubElement
+from lxml.etree import tostring
+
+from xsdata.formats.dataclass.serializers.writer import XmlWriter
+
+
+class XmlWriterTests(TestCase):
+    def test_write(self):
+        for pretty_print in (True, False):
+            expected = Element("{urn:a}root", nsmap={"a": "urn:a"})
+            SubElement(expected, "{urn:a}empty", id="1")
+            items = SubElement(expected, "items", id="é")
+            for i in range(3):
+                SubElement(SubElement(items, "{urn:b}item"), "value").text = f"<{i}>"
+
+            output = io.BytesIO()
+            writer = XmlWriter(output, encoding="ascii", pretty_print=pretty_print)
+            writer.write_declaration()
+
+            writer.start(Element("{urn:a}root", nsmap={"a": "urn:a"}))
+            self.assertTrue(writer.empty)
+            writer.start(SubElement(writer.container(), "{urn:a}empty", id="1"))
+            writer.end()
+            self.assertFalse(writer.empty)
+
+            writer.start(SubElement(writer.container(), "items", id="é"))
+            for i in range(3):
+                item = SubElement(writer.container(), "{urn:b}item")
+                SubElement(item, "value").text = f"<{i}>"
+                writer.flush()
+                self.assertEqual(0, len(writer.container()))
+
+            writer.end()
+            writer.end()
+
+            actual = output.getvalue()
+            self.assertEqual(
+                tostring(
+                    expected,
+                    encoding="ascii",
+                    xml_declaration=True,
+                    pretty_print=pretty_print,
+                ),
+                actual,
+            )
+
+    def test_write_empty_root(self):
+        output = io.BytesIO()
+        writer = XmlWriter(output, encoding="UTF-8", pretty_print=True)
+        writer.start(Element("root", a="b"))
+        writer.end()
+
+        self.assertEqual(b'<root a="b"/>\n', output.getvalue())
+
+    def test_supports(self):
+        self.assertTrue(XmlWriter.supports("UTF-8"))
+        self.assertTrue(XmlWriter.supports("iso-8859-1"))
+        self.assertFalse(XmlWriter.supports("UTF-16"))
@@ -1,14 +1,24 @@
+import io
+import itertools
+import multiprocessing
+import sys
+import tempfile
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import replace
+from pathlib import Path
+from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
 from unittest import mock
 from unittest.case import TestCase
 
+from lxml.etree import cleanup_namespaces
 from lxml.etree import Element
 from lxml.etree import QName
+from lxml.etree import SubElement
+from lxml.etree import tostring
 
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
@@ -23,11 +33,56 @@ from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import FindMode
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.models.generics import Namespaces
+from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.pool import SerializerPool
 from xsdata.formats.dataclass.serializers.utils import SerializeUtils
 from xsdata.models.enums import QNames
 
 
+@dataclass
+class Part:
+    id: Optional[str] = field(default=None, metadata=dict(type="Attribute"))
+    parts: List["Part"] = field(default_factory=list, metadata=dict(type="Element"))
+
+
+@dataclass(frozen=True)
+class Shelf:
+    parts: List[Part] = field(default_factory=list, metadata=dict(type="Element"))
+
+
+@dataclass
+class Bundle:
+    items: List[object] = field(
+        default_factory=list, metadata=dict(type="Wildcard", namespace="##any")
+    )
+
+
+@dataclass
+class Entry:
+    a: Optional[str] = field(
+        default=None, metadata=dict(type="Element", namespace="urn:a")
+    )
+    b: Optional[str] = field(
+        default=None, metadata=dict(type="Element", namespace="urn:b")
+    )
+
+
+@dataclass
+class Feed:
+    class Meta:
+        namespace = "urn:c"
+
+    entry: List[Entry] = field(default_factory=list, metadata=dict(type="Element"))
+
+
+@dataclass
+class Values:
+    values: List[str] = field(
+        default_factory=list, metadata=dict(type="Element", nillable=True)
+    )
+
+
 class XmlSerializerTests(TestCase):
     def setUp(self):
         super(XmlSerializerTests, self).setUp()
@@ -103,6 +158,245 @@ class XmlSerializerTests(TestCase):
         )
         self.assertEqual(expected, actual)
 
+        element = Element("{urn:books}books")
+        self.assertEqual({"ns0": "urn:books"}, element.nsmap)
+
+    def test_render_bytes(self):
+        actual = self.serializer.render_bytes(self.books)
+        self.assertEqual(self.serializer.render(self.books).encode(), actual)
+
+        self.books.book[0].author = "Hightower, Kím"
+        serializer = XmlSerializer(encoding="ISO-8859-1", xml_declaration=False)
+        actual = serializer.render_bytes(self.books)
+        self.assertTrue(actual.startswith(b"<ns0:books"))
+        self.assertIn("Kím".encode("ISO-8859-1"), actual)
+        self.assertEqual(actual.decode("ISO-8859-1"), serializer.render(self.books))
+
+        serializer = XmlSerializer(encoding="UTF-16")
+        actual = serializer.render(self.books)
+        self.assertTrue(actual.startswith("<?xml version='1.0' encoding='UTF-16'?>"))
+        self.assertIn("Kím", actual)
+
+    def test_render_parallel(self):
+        self.books.book.extend(
+            replace(self.books.book[i % 2], id=f"bk{i}") for i in range(3, 8)
+        )
+        for pretty_print in (False, True):
+            serializer = XmlSerializer(pretty_print=pretty_print)
+            with mock.patch.object(
+                SerializerPool,
+                "render",
+                autospec=True,
+                side_effect=SerializerPool.render,
+            ) as render:
+                actual = serializer.render_parallel(
+                    self.books, "book", workers=2, chunksize=2
+                )
+
+            self.assertIs(self.books.book, render.call_args[0][2])
+            self.assertEqual(serializer.render_bytes(self.books), actual)
+
+        namespaces = Namespaces()
+        namespaces.add("urn:books", "brk")
+        expected = self.serializer.render_bytes(self.books, namespaces)
+        namespaces = Namespaces()
+        namespaces.add("urn:books", "brk")
+        actual = self.serializer.render_parallel(
+            self.books, "book", workers=2, chunksize=3, namespaces=namespaces
+        )
+        self.assertEqual(expected, actual)
+        self.assertTrue(actual.startswith(b"<?xml version='1.0' encoding='UTF-8'?>"))
+        self.assertIn(b"<brk:books", actual)
+
+    def test_render_parallel_with_frozen_dataclass(self):
+        shelf = Shelf(parts=[Part(id=str(i)) for i in range(4)])
+        with mock.patch.object(
+            SerializerPool, "render", autospec=True, side_effect=SerializerPool.render
+        ) as render:
+            actual = self.serializer.render_parallel(
+                shelf, "parts", workers=2, chunksize=2
+            )
+
+        self.assertEqual(1, render.call_count)
+        self.assertEqual(self.serializer.render_bytes(shelf), actual)
+
+    def test_render_parallel_with_spawn_start_method(self):
+        shelf = Shelf(parts=[Part(id=str(i)) for i in range(4)])
+        method = multiprocessing.get_start_method()
+        multiprocessing.set_start_method("spawn", force=True)
+        try:
+            actual = self.serializer.render_parallel(
+                shelf, "parts", workers=1, chunksize=2
+            )
+        finally:
+            multiprocessing.set_start_method(method, force=True)
+
+        self.assertEqual(self.serializer.render_bytes(shelf), actual)
+
+    def test_render_parallel_sequentially(self):
+        with self.assertRaises(SerializerError) as cm:
+            self.serializer.render_parallel(self.books, "books")
+
+        self.assertEqual("Books has no field `books`", str(cm.exception))
+
+        with mock.patch.object(SerializerPool, "render") as render:
+            with self.assertLogs("xsdata.logger", "DEBUG") as logs:
+                actual = self.serializer.render_parallel(
+                    self.books, "book", chunksize=2
+                )
+
+        self.assertEqual(0, render.call_count)
+        self.assertIn("sequentially: unsupported", logs.output[0])
+        self.assertEqual(self.serializer.render_bytes(self.books), actual)
+
+        foo = AnyElement(qname="{urn:foo}a", ns_map={"foo": "urn:foo"})
+        bundle = Bundle(items=[AnyElement(qname="b"), AnyElement(qname="c"), foo])
+        with mock.patch.object(SerializerPool, "render") as render:
+            actual = self.serializer.render_parallel(bundle, "items", chunksize=1)
+
+        self.assertEqual(0, render.call_count)
+        self.assertEqual(self.serializer.render_bytes(bundle), actual)
+        self.assertIn(b'xmlns:foo="urn:foo"', actual)
+
+        obj = Values(values=["a", "b", ""])
+        with mock.patch.object(
+            SerializerPool, "render", autospec=True, side_effect=SerializerPool.render
+        ) as render:
+            with self.assertLogs("xsdata.logger", "DEBUG") as logs:
+                actual = self.serializer.render_parallel(
+                    obj, "values", workers=2, chunksize=1
+                )
+
+        self.assertEqual(1, render.call_count)
+        self.assertIn("sequentially: unrenderable chunk", logs.output[0])
+        self.assertEqual(self.serializer.render_bytes(obj), actual)
+        self.assertIn(b'<values xsi:nil="true"/>', actual)
+
+    def test_render_fragment(self):
+        book = self.books.book[0]
+        nsmap = {"ns0": "urn:books"}
+        actual = self.serializer.render_fragment(
+            "{urn:books}books", Books, "book", nsmap, nsmap, [book, book]
+        )
+        output = self.serializer.render_bytes(replace(self.books, book=[book, book]))
+        start = output.index(b"<book ")
+        end = output.rindex(b"</book>") + len(b"</book>")
+        self.assertEqual(output[start:end], actual)
+
+        items = [AnyElement(text="text")]
+        self.assertIsNone(
+            self.serializer.render_fragment("bundle", Bundle, "items", {}, {}, items)
+        )
+
+        items = [AnyElement(qname="{urn:foo}a", ns_map={"foo": "urn:foo"})]
+        self.assertIsNone(
+            self.serializer.render_fragment("bundle", Bundle, "items", {}, {}, items)
+        )
+
+    def test_is_parallel(self):
+        meta = self.serializer.context.build(Books)
+        self.assertTrue(XmlSerializer.is_parallel(meta, "book"))
+
+        meta = self.serializer.context.build(BookForm)
+        self.assertFalse(XmlSerializer.is_parallel(meta, "author"))
+        self.assertFalse(XmlSerializer.is_parallel(meta, "id"))
+
+    def test_is_mixed(self):
+        element = Element("root")
+        self.assertFalse(XmlSerializer.is_mixed(element))
+
+        child = SubElement(element, "child")
+        self.assertFalse(XmlSerializer.is_mixed(element))
+
+        child.tail = ""
+        self.assertTrue(XmlSerializer.is_mixed(element))
+
+        element = Element("root")
+        element.text = "foo"
+        self.assertTrue(XmlSerializer.is_mixed(element))
+
+    def test_write_to_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath("books.xml")
+            self.serializer.write(self.books, path)
+            self.assertEqual(
+                self.serializer.render_bytes(self.books), path.read_bytes()
+            )
+
+            self.serializer.write(Books(), str(path))
+            self.assertEqual(self.serializer.render_bytes(Books()), path.read_bytes())
+
+    def test_render_tree_with_namespaces_plan(self):
+        serializer = XmlSerializer(xml_declaration=False)
+        first = Feed(entry=[Entry(b="x"), Entry(a="y")])
+        second = Feed(entry=[Entry(a="y"), Entry(b="x")])
+        with mock.patch(
+            "xsdata.formats.dataclass.serializers.xml.cleanup_namespaces",
+            wraps=cleanup_namespaces,
+        ) as mock_cleanup_namespaces:
+            expected = serializer.render(first)
+            self.assertEqual(1, mock_cleanup_namespaces.call_count)
+            plan = serializer.context.namespace_plan(Feed)
+            self.assertIsNotNone(plan)
+
+            self.assertEqual(expected, serializer.render(replace(first)))
+            self.assertEqual(1, mock_cleanup_namespaces.call_count)
+
+            with mock.patch.object(
+                XmlSerializer,
+                "render_node",
+                autospec=True,
+                side_effect=XmlSerializer.render_node,
+            ) as mock_render_node:
+                actual = serializer.render(second)
+
+            self.assertEqual(1, mock_render_node.call_count)
+            self.assertEqual(2, mock_cleanup_namespaces.call_count)
+            self.assertIs(plan, serializer.context.namespace_plan(Feed))
+
+            self.assertEqual(expected, serializer.render(first))
+            self.assertEqual(2, mock_cleanup_namespaces.call_count)
+
+        self.assertEqual(
+            '<ns0:Feed xmlns:ns0="urn:c" xmlns:ns2="urn:a" xmlns:ns1="urn:b">'
+            "<ns0:entry><ns1:b>x</ns1:b></ns0:entry>"
+            "<ns0:entry><ns2:a>y</ns2:a></ns0:entry>"
+            "</ns0:Feed>",
+            expected,
+        )
+        self.assertEqual(XmlSerializer(xml_declaration=False).render(second), actual)
+        self.assertIn('xmlns:ns1="urn:a" xmlns:ns2="urn:b"', actual)
+
+        obj = DescriptionType(www_w3_org_1999_xhtml_element=["foo"])
+        serializer.render(obj)
+        self.assertIsNone(serializer.context.namespace_plan(DescriptionType))
+        self.assertIn(DescriptionType, serializer.context.namespace_cache)
+
+    def test_render_deep_tree(self):
+        depth = sys.getrecursionlimit() + 200
+        obj = part = Part(id="0")
+        wildcard = AnyElement(qname="a")
+        child = wildcard
+        for index in range(1, depth):
+            part.parts.append(Part(id=str(index)))
+            part = part.parts[0]
+            child.children.append(AnyElement(qname="a"))
+            child = child.children[0]
+
+        root = self.serializer.render_tree(obj)
+        self.assertEqual(depth, len(list(root.iter("parts"))) + 1)
+
+        output = io.BytesIO()
+        self.serializer.write(obj, output)
+        expected = tostring(
+            root, xml_declaration=True, encoding="UTF-8", pretty_print=True
+        )
+        self.assertEqual(expected, output.getvalue())
+
+        obj = DescriptionType(www_w3_org_1999_xhtml_element=[wildcard])
+        root = self.serializer.render_tree(obj)
+        self.assertEqual(depth, len(list(root.iter("a"))))
+
     def test_render_no_dataclass(self):
         with self.assertRaises(XmlContextError) as cm:
             self.serializer.render(self)
@@ -110,55 +404,44 @@ class XmlSerializerTests(TestCase):
             f"Object {self.__class__} is not a dataclass.", str(cm.exception)
         )
 
-    @mock.patch.object(SerializeUtils, "set_nil_attribute")
-    @mock.patch.object(SerializeUtils, "set_text")
-    @mock.patch.object(SerializeUtils, "set_attributes")
-    @mock.patch.object(SerializeUtils, "set_attribute")
-    @mock.patch.object(XmlSerializer, "render_sub_node")
-    @mock.patch.object(XmlSerializer, "next_value")
-    def test_render_node(
-        self,
-        mock_next_value,
-        mock_render_sub_node,
-        mock_set_attribute,
-        mock_set_attributes,
-        mock_set_text,
-        mock_set_nil_attribute,
-    ):
+    def test_render_node(self):
+        @dataclass
+        class Mixed:
+            attr: Optional[int] = field(default=None, metadata=dict(type="Attribute"))
+            attrs: Dict = field(default_factory=dict, metadata=dict(type="Attributes"))
+            text: Optional[str] = field(
+                default=None, metadata=dict(type="Text", namespace="foo")
+            )
+            elem: List[int] = field(default_factory=list, metadata=dict(type="Element"))
+            empty: Optional[int] = field(default=None, metadata=dict(type="Element"))
+            wild: List[object] = field(
+                default_factory=list, metadata=dict(type="Wildcard")
+            )
+            a: List[int] = field(
+                default_factory=list, metadata=dict(type="Element", sequential=True)
+            )
+            b: List[int] = field(
+                default_factory=list, metadata=dict(type="Element", sequential=True)
+            )
+
         root = Element("root")
-        prod_meta = self.serializer.context.build(ProductType)
-        size_meta = self.serializer.context.build(SizeType)
-        obj = ProductType()
-
-        attribute = prod_meta.find_var("effDate")
-        attributes = prod_meta.find_var("{!}other_attributes")
-        text = replace(size_meta.find_var("value"), qname=QName("foo", "bar"))
-        sub_node = prod_meta.find_var("name")
-
-        mock_next_value.return_value = [
-            (attribute, None),
-            (attribute, 1),
-            (attributes, dict(a=1)),
-            (text, "txt"),
-            (sub_node, 1),
-            (sub_node, [2, 3]),
-        ]
+        obj = Mixed(
+            attr=1,
+            attrs={"c": "d"},
+            text="txt",
+            elem=[2, 3],
+            wild=[AnyElement(qname="w", text="x")],
+            a=[4, 5],
+            b=[6],
+        )
 
         self.serializer.render_node(root, obj, self.namespaces)
-        self.assertEqual({"ns0": "foo"}, self.namespaces.ns_map)
-        mock_set_attribute.assert_called_once_with(
-            root, attribute.qname, 1, self.namespaces
-        )
-        mock_set_attributes.assert_called_once_with(root, dict(a=1), self.namespaces)
-        mock_set_text.assert_called_once_with(root, "txt", self.namespaces)
-        mock_render_sub_node.assert_has_calls(
-            [
-                mock.call(root, 1, sub_node, self.namespaces),
-                mock.call(root, 2, sub_node, self.namespaces),
-                mock.call(root, 3, sub_node, self.namespaces),
-            ]
+        expected = (
+            '<root attr="1" c="d">txt<elem>2</elem><elem>3</elem><w>x</w>'
+            "<a>4</a><b>6</b><a>5</a></root>"
         )
-        mock_set_nil_attribute.assert_called_once_with(root, False, self.namespaces)
+        self.assertEqual(expected, tostring(root).decode())
+        self.assertEqual({"ns0": "foo"}, self.namespaces.ns_map)
 
     def test_render_node_without_dataclass(self):
         root = Element("root")
@@ -171,7 +454,9 @@ class XmlSerializerTests(TestCase):
         meta = self.serializer.context.build(ProductType)
         var = meta.find_var("number")
 
-        self.serializer.render_sub_nodes(root, [1, 2, 3], var, self.namespaces)
+        mock_render_sub_node.side_effect = [None, "node", None]
+        actual = self.serializer.render_sub_nodes(root, [1, 2, 3], var, self.namespaces)
+        self.assertEqual(["node"], list(actual))
         self.assertEqual(3, mock_render_sub_node.call_count)
         mock_render_sub_node.assert_has_calls(
             [
@@ -241,34 +526,49 @@ class XmlSerializerTests(TestCase):
 
     @mock.patch.object(SerializeUtils, "set_nil_attribute")
     @mock.patch.object(XmlSerializer, "set_xsi_type")
-    @mock.patch.object(XmlSerializer, "render_node")
+    @mock.patch.object(XmlSerializer, "render_complex_node")
     def test_render_element_node(
-        self, mock_render_node, mock_set_xsi_type, mock_set_nil_attribute
+        self, mock_render_complex_node, mock_set_xsi_type, mock_set_nil_attribute
     ):
         root = Element("root")
         value = SizeType()
-        meta = self.serializer.context.build(DescriptionType)
-        var = meta.find_var(mode=FindMode.WILDCARD)
+        meta = self.serializer.context.build(ProductType)
+        var = replace(meta.find_var("size"), nillable=True)
 
-        self.serializer.render_element_node(root, value, var, self.namespaces)
+        actual = self.serializer.render_element_node(root, value, var, self.namespaces)
 
         child = root[0]
-        mock_render_node.assert_called_once_with(child, value, self.namespaces)
-        mock_set_xsi_type.assert_called_once_with(child, value, var, self.namespaces)
-        mock_set_nil_attribute.assert_called_once_with(
-            child, var.nillable, self.namespaces
+        self.assertIs(mock_render_complex_node.return_value, actual)
+        mock_render_complex_node.assert_called_once_with(
+            child, value, self.namespaces, var
         )
+        self.assertEqual(var.qname, child.tag)
+
+        actual = self.serializer.render_element_node(root, "1", var, self.namespaces)
 
+        child = root[1]
+        self.assertIsNone(actual)
+        self.assertEqual("1", child.text)
+        mock_set_xsi_type.assert_called_once_with(child, "1", var, self.namespaces)
+        mock_set_nil_attribute.assert_called_once_with(child, True, self.namespaces)
+
+        meta = self.serializer.context.build(DescriptionType)
+        var = meta.find_var(mode=FindMode.WILDCARD)
+        actual = self.serializer.render_element_node(root, "foo", var, self.namespaces)
+
+        child = root[2]
+        self.assertIsNone(actual)
+        self.assertEqual(1, mock_render_complex_node.call_count)
+        self.assertEqual(1, mock_set_xsi_type.call_count)
+        self.assertEqual(1, mock_set_nil_attribute.call_count)
         self.assertEqual(var.qname, child.tag)
+        self.assertEqual("foo", child.text)
         self.assertEqual(
             {"ns0": "http://www.w3.org/1999/xhtml"}, self.namespaces.ns_map
         )
 
-    @mock.patch.object(SerializeUtils, "set_nil_attribute")
-    @mock.patch.object(XmlSerializer, "render_node")
-    def test_render_element_node_with_specific_qname(
-        self, mock_render_node, mock_set_nil_attribute
-    ):
+    @mock.patch.object(XmlSerializer, "render_complex_node")
+    def test_render_element_node_with_specific_qname(self, mock_render_complex_node):
         root = Element("root")
         value = SizeType()
         value.qname = "foo"
@@ -278,14 +578,30 @@ class XmlSerializerTests(TestCase):
         self.serializer.render_element_node(root, value, var, self.namespaces)
 
         child = root[0]
-        mock_render_node.assert_called_once_with(child, value, self.namespaces)
-        mock_set_nil_attribute.assert_called_once_with(
-            child, var.nillable, self.namespaces
+        mock_render_complex_node.assert_called_once_with(
+            child, value, self.namespaces, var
         )
-
         self.assertEqual("foo", child.tag)
         self.assertEqual(0, len(self.namespaces.ns_map))
 
+    def test_render_complex_node_with_var(self):
+        meta = self.serializer.context.build(ProductType)
+        var = replace(meta.find_var("size"), nillable=True)
+        element = Element("size")
+
+        node = self.serializer.render_complex_node(
+            element, SizeType(), self.namespaces, var
+        )
+        self.assertEqual([], list(node))
+        self.assertEqual({QNames.XSI_NIL: "true"}, element.attrib)
+
+        element = Element("size")
+        with self.assertRaises(SerializerError):
+            node = self.serializer.render_complex_node(
+                element, ColorType(), self.namespaces, var
+            )
+            list(node)
+
     @mock.patch.object(XmlSerializer, "render_sub_node")
     @mock.patch.object(SerializeUtils, "set_nil_attribute")
     @mock.patch.object(SerializeUtils, "set_attributes")
@@ -311,7 +627,9 @@ class XmlSerializerTests(TestCase):
         meta = self.serializer.context.build(DescriptionType)
         var = meta.find_var(mode=FindMode.WILDCARD)
 
-        self.serializer.render_wildcard_node(root, value, var, self.namespaces)
+        mock_render_sub_node.return_value = None
+        node = self.serializer.render_wildcard_node(root, value, var, self.namespaces)
+        self.assertEqual([], list(node))
 
         child = root[0]
         self.assertEqual({"foo": "bar"}, self.namespaces.ns_map)
@@ -352,7 +670,9 @@ class XmlSerializerTests(TestCase):
         meta = self.serializer.context.build(DescriptionType)
         var = meta.find_var(mode=FindMode.WILDCARD)
 
-        self.serializer.render_wildcard_node(root, value, var, self.namespaces)
+        mock_render_sub_node.return_value = None
+        node = self.serializer.render_wildcard_node(root, value, var, self.namespaces)
+        self.assertEqual([], list(node))
 
         self.assertEqual(0, len(self.namespaces.ns_map))
         self.assertEqual(0, len(root))
@@ -397,16 +717,16 @@ class XmlSerializerTests(TestCase):
 
         self.assertEqual("ColorType is not derived from SizeType", str(cm.exception))
 
-    @mock.patch.object(XmlContext, "is_derived", return_value=True)
-    def test_set_xsi_type_when_value_is_derived_from_var_clazz(self, *args):
-        elem = Element("foo")
+    @mock.patch.object(XmlContext, "xsi_type", return_value=QName("foo", "items"))
+    def test_set_xsi_type_when_value_is_derived_from_var_clazz(self, mock_xsi_type):
+        elem = Element("{bar}foo")
         value = Items()
         meta = self.serializer.context.build(ProductType)
-        items_meta = self.serializer.context.build(Items)
         var = meta.find_var("size")
 
         self.serializer.set_xsi_type(elem, value, var, self.namespaces)
-        self.assertEqual(items_meta.source_qname, elem.attrib[QNames.XSI_TYPE])
+        self.assertEqual("ns0:items", elem.attrib[QNames.XSI_TYPE])
+        mock_xsi_type.assert_called_once_with(Items, SizeType, "bar")
 
     def test_next_value(self):
         @dataclass
@@ -440,3 +760,112 @@ class XmlSerializerTests(TestCase):
 
         self.assertIsInstance(actual, Iterator)
         self.assertEqual(expected, list(actual))
+
+    def test_write(self):
+        for pretty_print, xml_declaration in itertools.product([True, False], repeat=2):
+            serializer = XmlSerializer(
+                pretty_print=pretty_print, xml_declaration=xml_declaration
+            )
+            output = io.BytesIO()
+            serializer.write(self.books, output)
+
+            self.assertEqual(serializer.render(self.books).encode(), output.getvalue())
+
+        output = io.BytesIO()
+        self.serializer.write(Books(), output)
+        self.assertEqual(self.serializer.render(Books()).encode(), output.getvalue())
+
+    def test_write_with_namespaces_found_while_rendering(self):
+        path = (
+            Path(__file__)
+            .parents[3]
+            .joinpath("fixtures/defxmlschema/chapter12/chapter12.xml")
+        )
+        obj = XmlParser().from_path(path, Items)
+        output = io.BytesIO()
+        self.serializer.write(obj, output)
+
+        actual = output.getvalue().decode()
+        self.assertNotEqual(self.serializer.render(obj), actual)
+        self.assertIn("<items>", actual)
+        self.assertIn('<description xmlns:oth="http://example.org/oth"', actual)
+
+        namespaces = Namespaces()
+        expected = self.serializer.render(obj, namespaces)
+        output = io.BytesIO()
+        self.serializer.write(obj, output, namespaces)
+        self.assertEqual(expected, output.getvalue().decode())
+
+    def test_write_with_iterators(self):
+        output = io.BytesIO()
+        sizes = []
+
+        def books() -> Iterator[BookForm]:
+            for book in self.books.book:
+                sizes.append(len(output.getvalue()))
+                yield book
+
+        self.serializer.write(Books(book=books()), output)
+
+        self.assertEqual(self.serializer.render(self.books).encode(), output.getvalue())
+        self.assertEqual(2, len(sizes))
+        self.assertLess(0, sizes[0])
+        self.assertLess(sizes[0], sizes[1])
+
+    def test_write_with_nested_containers(self):
+        @dataclass
+        class Inner:
+            id: Optional[str] = field(default=None, metadata=dict(type="Attribute"))
+            books: List[BookForm] = field(
+                default_factory=list, metadata=dict(type="Element")
+            )
+
+        @dataclass
+        class Outer:
+            inner: List[Inner] = field(
+                default_factory=list, metadata=dict(type="Element", nillable=True)
+            )
+
+        book = BookForm(id="bk001", title="The First Book")
+        obj = Outer(inner=[Inner(id="a"), Inner(books=[book]), Inner()])
+        output = io.BytesIO()
+        self.serializer.write(obj, output)
+
+        xsi = 'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+        expected = (
+            "<?xml version='1.0' encoding='UTF-8'?>\n"
+            "<Outer>\n"
+            f'  <inner {xsi} id="a" xsi:nil="true"/>\n'
+            f"  <inner {xsi}>\n"
+            '    <books id="bk001" lang="en">\n'
+            "      <title>The First Book</title>\n"
+            "    </books>\n"
+            "  </inner>\n"
+            f'  <inner {xsi} xsi:nil="true"/>\n'
+            "</Outer>\n"
+        )
+        self.assertEqual(expected, output.getvalue().decode())
+
+    def test_write_without_container_root(self):
+        obj = DescriptionType(
+            www_w3_org_1999_xhtml_element=["foo", AnyElement(qname="a")]
+        )
+        output = io.BytesIO()
+        self.serializer.write(obj, output)
+
+        self.assertEqual(self.serializer.render(obj).encode(), output.getvalue())
+
+        serializer = XmlSerializer(encoding="UTF-16")
+        output = io.BytesIO()
+        serializer.write(self.books, output)
+
+        tree = serializer.render_tree(self.books)
+        expected = tostring(tree, encoding="UTF-16", xml_declaration=True)
+        self.assertEqual(expected, output.getvalue())
+
+    def test_is_container(self):
+        context = self.serializer.context
+        self.assertTrue(self.serializer.is_container(context.build(Books)))
+        self.assertTrue(self.serializer.is_container(context.build(ProductType)))
+        self.assertFalse(self.serializer.is_container(context.build(SizeType)))
+        self.assertFalse(self.serializer.is_container(context.build(DescriptionType)))
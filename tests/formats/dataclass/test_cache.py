@@ -0,0 +1,134 @@
+import pickle
+import tempfile
+from dataclasses import make_dataclass
+from pathlib import Path
+from unittest import mock
+from unittest.case import TestCase
+
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
+from tests.fixtures.books import BooksForm
+from tests.fixtures.defxmlschema.chapter13.chapter13 import ItemsType
+from xsdata.formats.converters import TypeConverter
+from xsdata.formats.dataclass.cache import cache_version
+from xsdata.formats.dataclass.cache import entry_modules
+from xsdata.formats.dataclass.cache import generator_key
+from xsdata.formats.dataclass.cache import load_entries
+from xsdata.formats.dataclass.cache import ModuleHashes
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.utils import text
+
+
+class XmlContextCacheTests(TestCase):
+    def setUp(self):
+        self.ctx = XmlContext()
+        self.ctx.build(Books)
+        self.ctx.build(BookForm)
+        self.ctx.build(ItemsType)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name).joinpath("meta.cache")
+
+    def test_dump_and_load_cache(self):
+        self.ctx.dump_cache(self.path)
+
+        ctx = XmlContext()
+        self.assertEqual(3, ctx.load_cache(self.path))
+        self.assertEqual(self.ctx.cache, ctx.cache)
+        for meta in ctx.cache.values():
+            for var in meta.vars:
+                self.assertIsInstance(var.converter, TypeConverter)
+
+        self.assertEqual(0, ctx.load_cache(self.path))
+
+    def test_dump_cache_skips_local_classes(self):
+        self.ctx.build(make_dataclass("Local", fields=[("a", int)]))
+        self.ctx.dump_cache(self.path)
+
+        self.assertEqual(3, XmlContext().load_cache(self.path))
+
+    @mock.patch.object(ModuleHashes, "digest")
+    def test_load_cache_skips_modified_modules(self, mock_digest):
+        mock_digest.side_effect = lambda name: name
+        self.ctx.dump_cache(self.path)
+
+        mock_digest.side_effect = lambda name: (
+            "changed" if name == "tests.fixtures.books" else name
+        )
+        ctx = XmlContext()
+        self.assertEqual(1, ctx.load_cache(self.path))
+        self.assertEqual([ItemsType], list(ctx.cache))
+
+    def test_load_cache_with_other_name_generator(self):
+        self.ctx.dump_cache(self.path)
+
+        ctx = XmlContext(name_generator=str.upper)
+        self.assertEqual(0, ctx.load_cache(self.path))
+
+    def test_load_cache_invalidates_xsi_index(self):
+        self.ctx.dump_cache(self.path)
+
+        ctx = XmlContext()
+        ctx.xsi_cache[BooksForm] = {}
+        ctx.xsi_cache[BookForm] = {ctx.class_source_qname(BookForm): BookForm}
+        ctx.load_cache(self.path)
+        self.assertEqual([BookForm], list(ctx.xsi_cache))
+
+    def test_load_cache_with_invalid_file(self):
+        self.assertEqual(0, self.ctx.load_cache(self.path))
+
+        self.path.write_bytes(b"foo")
+        self.assertEqual(0, self.ctx.load_cache(self.path))
+
+        payload = {"version": (0, 0, 0), "entries": []}
+        self.path.write_bytes(pickle.dumps(payload))
+        self.assertEqual([], list(load_entries(self.path, str)))
+
+    def test_decode_meta(self):
+        meta = self.ctx.cache[Books]
+        entry = self.ctx.encode_meta(meta)
+        self.assertEqual(meta, self.ctx.decode_meta(entry))
+
+        self.assertIsNone(self.ctx.decode_meta((int,) + entry[1:]))
+
+        entry = entry[:5] + ([],)
+        self.assertIsNone(self.ctx.decode_meta(entry))
+
+        var_entry = ("foo",) * 9
+        self.assertIsNone(self.ctx.decode_meta(entry[:5] + ([var_entry],)))
+
+
+class EntryModulesTests(TestCase):
+    def test_entry_modules(self):
+        a = make_dataclass("A", fields=[("x", int)])
+        b = make_dataclass("B", fields=[("y", BookForm)], bases=(a,))
+        a.__module__ = "xsdata.utils.text"
+        b.__module__ = __name__
+
+        meta = XmlContext().build(b)
+        expected = ["tests.fixtures.books", __name__, "xsdata.utils.text"]
+        self.assertEqual(expected, sorted(set(entry_modules(meta))))
+
+    def test_generator_key(self):
+        self.assertEqual(
+            "xsdata.utils.text.pascal_case", generator_key(text.pascal_case)
+        )
+        self.assertEqual("None.str.upper", generator_key(str.upper))
+        self.assertEqual(
+            "xsdata.utils.text.identity", generator_key(XmlContext().name_generator)
+        )
+
+
+class ModuleHashesTests(TestCase):
+    def test_get(self):
+        hashes = ModuleHashes()
+        digest = hashes.get("tests.fixtures.books")
+        self.assertEqual(64, len(digest))
+        self.assertEqual({"tests.fixtures.books": digest}, hashes.hashes)
+
+        self.assertIsNone(hashes.get("sys"))
+        self.assertIsNone(hashes.get("xsdata.nope"))
+        self.assertIsNone(hashes.get("nope.nope"))
+
+    def test_cache_version(self):
+        self.assertEqual(3, len(cache_version()))
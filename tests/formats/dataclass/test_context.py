@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from dataclasses import field
 from dataclasses import make_dataclass
 from dataclasses import replace
+from typing import Dict
 from typing import Iterator
+from typing import List
 from unittest import mock
 from unittest import TestCase
 
@@ -14,15 +17,33 @@ from tests.fixtures.defxmlschema.chapter05.chapter05prod import ProductType
 from tests.fixtures.defxmlschema.chapter11.example1101 import TextType
 from tests.fixtures.defxmlschema.chapter13.chapter13 import ItemsType
 from xsdata.exceptions import XmlContextError
+from xsdata.formats.converters import TypeConverter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.constants import XmlType
 from xsdata.formats.dataclass.models.elements import XmlAttribute
 from xsdata.formats.dataclass.models.elements import XmlElement
 from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlNamespacePlan
 from xsdata.formats.dataclass.models.elements import XmlWildcard
 from xsdata.utils import text
 
 
+@dataclass
+class Node:
+    ref: str = field(metadata=dict(type="Attribute", namespace="urn:b"))
+    nodes: List["Node"] = field(default_factory=list, metadata=dict(type="Element"))
+
+
+@dataclass
+class Root:
+    class Meta:
+        namespace = "urn:root"
+
+    node: Node = field(metadata=dict(type="Element", namespace="urn:a"))
+    any: object = field(metadata=dict(type="Wildcard", namespace="urn:c"))
+    code: str = field(metadata=dict(type="Element", namespace="urn:d"))
+
+
 class XmlContextTests(TestCase):
     def setUp(self):
         self.ctx = XmlContext()
@@ -94,24 +115,141 @@ class XmlContextTests(TestCase):
         self.assertEqual(a, self.ctx.find_subclass(c, "A"))
         self.assertIsNone(self.ctx.find_subclass(c, "What"))
 
-    def test_match_class_name(self):
-        qname_foo = QName("qname_foo")
-        qname_items = QName("ItemsType")
-        qname_product = QName("http://datypic.com/prod", "product")
-        qname_object = QName("object")
-        qname_int = QName("int")
+    def test_find_subclass_index(self):
+        a = make_dataclass("A", fields=[])
+        b = make_dataclass("B", fields=[], bases=(a,))
+        c = make_dataclass("C", fields=[], bases=(b,))
+
+        self.assertEqual(c, self.ctx.find_subclass(a, QName("C")))
+        expected = {QName("A"): a, QName("B"): b, QName("C"): c}
+        self.assertEqual(expected, self.ctx.xsi_cache[a])
+
+        self.assertIsNone(self.ctx.find_subclass(c, QName("D")))
+        self.assertEqual(expected, self.ctx.xsi_cache[a])
+
+        d = make_dataclass("D", fields=[], bases=(c,))
+        self.assertEqual(d, self.ctx.find_subclass(c, QName("D")))
+        self.assertEqual(d, self.ctx.xsi_cache[a][QName("D")])
+
+        e = make_dataclass("E", fields=[], bases=(a,))
+        self.ctx.build(e)
+        self.assertNotIn(a, self.ctx.xsi_cache)
+        self.assertEqual(e, self.ctx.find_subclass(d, QName("E")))
+
+    def test_find_subclass_with_multiple_roots(self):
+        a = make_dataclass("A", fields=[])
+        x = make_dataclass("X", fields=[])
+        b = make_dataclass("B", fields=[], bases=(a, x))
+        y = make_dataclass("Y", fields=[], bases=(x,))
+
+        self.assertEqual(y, self.ctx.find_subclass(b, QName("Y")))
+        self.assertEqual(a, self.ctx.find_subclass(b, QName("A")))
+        self.assertEqual(b, self.ctx.find_subclass(y, QName("B")))
 
+    def test_hierarchy_roots(self):
+        a = make_dataclass("A", fields=[])
+        b = make_dataclass("B", fields=[], bases=(a,))
+        x = make_dataclass("X", fields=[])
+        c = make_dataclass("C", fields=[], bases=(b, x))
+
+        self.assertEqual([a], self.ctx.hierarchy_roots(b))
+        self.assertEqual([a], self.ctx.hierarchy_roots(a))
+        self.assertEqual([a, x], self.ctx.hierarchy_roots(c))
+        self.assertEqual([int], self.ctx.hierarchy_roots(int))
+
+    def test_warm(self):
+        a = make_dataclass("A", fields=[])
+        b = make_dataclass("B", fields=[("a", a)], bases=(a,))
+        c = make_dataclass("C", fields=[("b", b)])
+
+        self.assertIs(self.ctx, self.ctx.warm(c))
+        self.assertEqual([c, b, a], list(self.ctx.cache))
+        self.assertEqual({QName("A"): a, QName("B"): b}, self.ctx.xsi_cache[a])
+        self.assertEqual({QName("C"): c}, self.ctx.xsi_cache[c])
+
+    def test_freeze(self):
+        a = make_dataclass("A", fields=[])
+        b = make_dataclass("B", fields=[], bases=(a,))
+        self.ctx.build(a)
+
+        frozen = self.ctx.freeze()
+        self.assertTrue(frozen.frozen)
+        self.assertFalse(self.ctx.frozen)
+        self.assertEqual(self.ctx.cache, frozen.cache)
+        self.assertIsNot(self.ctx.cache, frozen.cache)
+
+        self.assertEqual(b, frozen.fetch(b).clazz)
+        self.assertEqual(b, frozen.find_subclass(a, QName("B")))
+        self.assertEqual([a], list(frozen.cache))
+        self.assertEqual({}, frozen.xsi_cache)
+        self.assertEqual([a], list(frozen.warm(b).cache))
+
+        with self.assertRaises(XmlContextError) as cm:
+            frozen.load_cache("foo")
+
+        self.assertEqual("Frozen context can't be modified.", str(cm.exception))
+
+    def test_namespace_plan(self):
+        plan = XmlNamespacePlan({}, {"ns0": "urn:a"}, {"ns0": "urn:a"})
+        self.assertIsNone(self.ctx.namespace_plan(Node))
+
+        self.ctx.save_namespace_plan(Node, plan)
+        self.assertIs(plan, self.ctx.namespace_plan(Node))
+
+        self.ctx.save_namespace_plan(Root, plan)
+        self.assertIsNone(self.ctx.namespace_plan(Root))
+        self.assertIn(Root, self.ctx.namespace_cache)
+
+        other = XmlNamespacePlan({}, {"ns0": "urn:b"}, {"ns0": "urn:b"})
+        self.ctx.save_namespace_plan(Node, other)
+        self.assertIs(plan, self.ctx.namespace_plan(Node))
+
+        ctx = XmlContext()
+        twice = XmlNamespacePlan({}, {}, {"a": "urn:a", "b": "urn:a"})
+        ctx.save_namespace_plan(Node, twice)
+        self.assertIsNone(ctx.namespace_plan(Node))
+
+        ctx.save_namespace_plan(Node, plan)
+        self.assertIsNone(ctx.namespace_plan(Node))
+
+        ctx = XmlContext()
+        ctx.save_namespace_plan(Node, XmlNamespacePlan({}, {}, {None: "urn:a"}))
+        self.assertIsNone(ctx.namespace_plan(Node))
+
+        frozen = XmlContext().freeze()
+        frozen.save_namespace_plan(Node, plan)
+        self.assertEqual({}, frozen.namespace_cache)
+
+    def test_is_qualified(self):
+        self.assertTrue(self.ctx.is_qualified(Node))
+        self.assertFalse(self.ctx.is_qualified(Root))
+
+        @dataclass
+        class Named:
+            qname: str = field(metadata=dict(type="Attribute"))
+
+        @dataclass
+        class Base:
+            value: str = field(metadata=dict(type="Element", namespace="urn:a"))
+
+        self.assertFalse(self.ctx.is_qualified(Named))
+        self.assertTrue(self.ctx.is_qualified(Base))
+
+        @dataclass
+        class Derived(Base):
+            attrs: Dict = field(default_factory=dict, metadata=dict(type="Attributes"))
+
+        self.assertFalse(self.ctx.is_qualified(Base))
+
+    def test_class_source_qname(self):
         # no meta name
-        self.assertFalse(self.ctx.match_class_source_qname(ItemsType, qname_foo))
-        self.assertTrue(self.ctx.match_class_source_qname(ItemsType, qname_items))
+        self.assertEqual(QName("ItemsType"), self.ctx.class_source_qname(ItemsType))
 
         # with meta name
-        self.assertFalse(self.ctx.match_class_source_qname(Product, qname_items))
-        self.assertTrue(self.ctx.match_class_source_qname(Product, qname_product))
-
-        # not dataclass
-        self.assertFalse(self.ctx.match_class_source_qname(object, qname_object))
-        self.assertFalse(self.ctx.match_class_source_qname(int, qname_int))
+        self.assertEqual(
+            QName("http://datypic.com/prod", "product"),
+            self.ctx.class_source_qname(Product),
+        )
 
     @mock.patch.object(XmlContext, "get_type_hints")
     def test_build_build_vars(self, mock_get_type_hints):
@@ -197,6 +335,8 @@ class XmlContextTests(TestCase):
         for var in result:
             self.assertFalse(var.dataclass)
             self.assertIsNone(var.clazz)
+            self.assertIsInstance(var.converter, TypeConverter)
+            self.assertIs(var.types, var.converter.types)
 
     def test_get_type_hints_with_dataclass_list(self):
         result = list(self.ctx.get_type_hints(Books, None))
@@ -298,15 +438,24 @@ class XmlContextTests(TestCase):
             ),
         )
 
-    def test_is_derived(self):
+    def test_xsi_type(self):
         a = make_dataclass("A", fields=[])
         b = make_dataclass("B", fields=[], bases=(a,))
         c = make_dataclass("C", fields=[], bases=(a,))
         d = make_dataclass("D", fields=[])
 
-        self.assertTrue(self.ctx.is_derived(c(), b))
-        self.assertTrue(self.ctx.is_derived(b(), c))
-        self.assertTrue(self.ctx.is_derived(a(), b))
-        self.assertTrue(self.ctx.is_derived(a(), c))
-        self.assertTrue(self.ctx.is_derived(a(), a))
-        self.assertFalse(self.ctx.is_derived(a(), d))
+        self.assertEqual(QName("B"), self.ctx.xsi_type(b, c))
+        self.assertEqual(QName("A"), self.ctx.xsi_type(a, b))
+        self.assertIsNone(self.ctx.xsi_type(a, d))
+        self.assertEqual(
+            {(b, c): QName("B"), (a, b): QName("A"), (a, d): None},
+            self.ctx.xsi_type_cache,
+        )
+
+        with mock.patch.object(XmlContext, "fetch") as mock_fetch:
+            self.assertEqual(QName("B"), self.ctx.xsi_type(b, c))
+            self.assertEqual(0, mock_fetch.call_count)
+
+        frozen = XmlContext().freeze()
+        self.assertEqual(QName("B"), frozen.xsi_type(b, c))
+        self.assertEqual({}, frozen.xsi_type_cache)
@@ -6,9 +6,12 @@ from lxml.etree import QName
 from tests.fixtures import BookForm
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import FindMode
+from xsdata.formats.dataclass.models.elements import RenderMode
 from xsdata.formats.dataclass.models.elements import XmlAttribute
 from xsdata.formats.dataclass.models.elements import XmlAttributes
 from xsdata.formats.dataclass.models.elements import XmlElement
+from xsdata.formats.dataclass.models.elements import XmlMeta as XmlMetaModel
+from xsdata.formats.dataclass.models.elements import XmlRenderStep
 from xsdata.formats.dataclass.models.elements import XmlText
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.elements import XmlWildcard
@@ -158,3 +161,85 @@ class XmlMeta(TestCase):
 
         meta.cache[key] = meta._find_var(title)
         self.assertEqual("title", meta.find_var(author).name)
+
+    def test_binding_index(self):
+        text = XmlText(name="a", qname=QName("a"))
+        attr = XmlAttribute(name="b", qname=QName("b"))
+        attrs = XmlAttributes(name="c", qname=QName("c"))
+        elem = XmlElement(name="d", qname=QName("d"))
+        dupl = XmlElement(name="e", qname=QName("d"))
+        wild = XmlWildcard(name="f", qname=QName("f"), namespaces=["foo"])
+        other = XmlWildcard(name="g", qname=QName("g"), namespaces=["##any"])
+        meta = XmlMetaModel(
+            name="foo",
+            clazz=None,
+            qname=QName("foo"),
+            source_qname=QName("foo"),
+            nillable=False,
+            vars=[text, attr, attrs, elem, dupl, wild, other],
+        )
+
+        self.assertIs(text, meta.text_var)
+        self.assertIs(attrs, meta.any_attributes_var)
+        self.assertIs(wild, meta.wildcard_var)
+        self.assertEqual({"b": attr}, meta.attribute_vars)
+        self.assertEqual([wild, other], meta.wildcard_vars)
+        self.assertEqual(
+            {"a": text, "b": attr, "c": attrs, "d": elem}, meta.element_vars
+        )
+
+        self.assertIs(elem, meta.find_child_var(QName("d")))
+        self.assertIs(wild, meta.find_child_var(QName("foo", "x")))
+        self.assertIs(other, meta.find_child_var(QName("bar", "x")))
+        self.assertIs(other, meta.find_wildcard_var(QName("bar", "x")))
+
+        for name in ("a", "b", "d", "{foo}x", "{bar}x", "nope"):
+            qname = QName(name)
+            expected = meta.find_var(qname, FindMode.NOT_WILDCARD) or meta.find_var(
+                qname, FindMode.WILDCARD
+            )
+            self.assertIs(expected, meta.find_child_var(qname))
+
+    def test_render_steps(self):
+        text = XmlText(name="a", qname=QName("a"))
+        attr = XmlAttribute(name="b", qname=QName("b"))
+        attrs = XmlAttributes(name="c", qname=QName("c"))
+        elem = XmlElement(name="d", qname=QName("d"), types=[int])
+        first = XmlElement(name="e", qname=QName("e"), sequential=True)
+        second = XmlElement(name="f", qname=QName("f"), sequential=True)
+        any_type = XmlElement(name="g", qname=QName("g"), types=[object])
+        wild = XmlWildcard(name="h", qname=QName("h"), sequential=True)
+        nested = XmlElement(name="i", qname=QName("i"), dataclass=True)
+        mixed = XmlElement(name="j", qname=QName("j"), types=[Fixture, object])
+        meta = XmlMetaModel(
+            name="foo",
+            clazz=None,
+            qname=QName("foo"),
+            source_qname=QName("foo"),
+            nillable=False,
+            vars=[
+                text,
+                attr,
+                attrs,
+                elem,
+                first,
+                second,
+                any_type,
+                wild,
+                nested,
+                mixed,
+            ],
+        )
+
+        expected = [
+            XmlRenderStep(RenderMode.TEXT, text),
+            XmlRenderStep(RenderMode.ATTRIBUTE, attr),
+            XmlRenderStep(RenderMode.ATTRIBUTES, attrs),
+            XmlRenderStep(RenderMode.SIMPLE, elem),
+            XmlRenderStep(RenderMode.SEQUENCE, first, [first, second]),
+            XmlRenderStep(RenderMode.NODE, any_type),
+            XmlRenderStep(RenderMode.SEQUENCE, wild, [wild]),
+            XmlRenderStep(RenderMode.ELEMENT, nested),
+            XmlRenderStep(RenderMode.NODE, mixed),
+        ]
+        self.assertEqual(expected, meta.render_steps)
@@ -56,6 +56,15 @@ class NamespacesTests(TestCase):
         self.assertEqual("xs", namespaces.prefix("http://www.w3.org/2001/XMLSchema"))
         self.assertIsNone(namespaces.prefix("http://xsdata"))
 
+        namespaces.add("http://xsdata")
+        self.assertEqual("ns0", namespaces.prefix("http://xsdata"))
+
+        namespaces.add("bar", "a")
+        self.assertEqual("a", namespaces.prefix("bar"))
+
+        namespaces.clear()
+        self.assertIsNone(namespaces.prefix("bar"))
+
     def test_property_ns_map(self):
         namespaces = Namespaces()
         namespaces.add_all(
@@ -79,6 +88,23 @@ class NamespacesTests(TestCase):
         }
         self.assertEqual(expected, namespaces.ns_map)
 
+    def test_add_keeps_the_cached_maps_without_changes(self):
+        namespaces = Namespaces()
+        namespaces.add("bar", "b")
+        namespaces.add(Namespace.XSI.uri, Namespace.XSI.prefix)
+        ns_map = namespaces.ns_map
+        self.assertEqual("b", namespaces.prefix("bar"))
+
+        namespaces.add("bar")
+        namespaces.add("bar", "b")
+        namespaces.add(Namespace.XSI.uri, Namespace.XSI.prefix)
+        namespaces.add(Namespace.XSI.uri, "foo")
+        self.assertIs(ns_map, namespaces.ns_map)
+
+        namespaces.add("bar", "a")
+        self.assertIsNot(ns_map, namespaces.ns_map)
+        self.assertEqual("a", namespaces.prefix("bar"))
+
     def test_clear(self):
         namespaces = Namespaces()
         namespaces.add_all(
@@ -88,6 +114,14 @@ class NamespacesTests(TestCase):
         namespaces.clear()
         self.assertEqual(0, len(namespaces.ns_map))
 
+    def test_registry(self):
+        namespaces = Namespaces()
+        namespaces.add("http://komposta.net", "bar")
+        namespaces.add("http://foobar", "ns2")
+        namespaces.add("http://default", None)
+
+        self.assertEqual({"bar": "http://komposta.net"}, namespaces.registry)
+
     def test_register(self):
         namespaces = Namespaces()
         namespaces.add(Namespace.XML.uri)
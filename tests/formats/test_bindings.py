@@ -0,0 +1,52 @@
+import io
+import tempfile
+from pathlib import Path
+from unittest import mock
+from unittest.case import TestCase
+
+from tests.fixtures.books import Books
+from xsdata.formats.bindings import StringReader
+from xsdata.formats.dataclass.parsers import JsonParser
+from xsdata.formats.dataclass.parsers import XmlParser
+
+
+class StringReaderTests(TestCase):
+    def test_read(self):
+        reader = StringReader("aéb€")
+
+        self.assertEqual(b"a\xc3\xa9", reader.read(2))
+        self.assertEqual("b€".encode(), reader.read(10))
+        self.assertEqual(b"", reader.read(10))
+
+        reader = StringReader("aéb€", "utf-16-le")
+        self.assertEqual("aéb€".encode("utf-16-le"), reader.read())
+        self.assertEqual(b"", reader.read(None))
+
+
+class AbstractParserTests(TestCase):
+    xml = '<brk:books xmlns:brk="urn:books"><book id="é"/></brk:books>'
+
+    def test_from_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath("books.xml")
+            path.write_text(self.xml, encoding="utf-8")
+            parser = XmlParser()
+
+            with mock.patch.object(XmlParser, "parse", wraps=parser.parse) as parse:
+                actual = parser.from_path(path, Books)
+                self.assertIsInstance(parse.call_args[0][0], io.BufferedReader)
+
+            self.assertEqual("é", actual.book[0].id)
+            self.assertEqual(actual, parser.from_path(str(path), Books))
+
+    def test_from_string(self):
+        actual = XmlParser().from_string(self.xml, Books)
+        self.assertEqual("é", actual.book[0].id)
+
+    def test_json_from_string(self):
+        parser = JsonParser()
+        with mock.patch.object(JsonParser, "parse") as parse:
+            actual = parser.from_string('{"book": [{"id": "é"}]}', Books)
+
+        self.assertEqual(0, parse.call_count)
+        self.assertEqual("é", actual.book[0].id)
@@ -1,14 +1,23 @@
 from dataclasses import dataclass
+from datetime import date
+from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from enum import IntEnum
+from unittest import mock
 from unittest import TestCase
 
 from lxml.etree import QName
 
 from tests.fixtures.books import BookForm
 from xsdata.exceptions import ConverterError
+from xsdata.formats.converters import enum_cache
+from xsdata.formats.converters import register_xml_converter
 from xsdata.formats.converters import to_python
 from xsdata.formats.converters import to_xml
+from xsdata.formats.converters import TypeConverter
+from xsdata.formats.converters import xml_func_cache
+from xsdata.formats.converters import xml_func_map
 from xsdata.formats.dataclass.models.generics import Namespaces
 from xsdata.models.enums import UseType
 
@@ -44,6 +53,52 @@ class ConvertersTestCases(TestCase):
         with self.assertRaises(ConverterError):
             to_xml(BookForm())
 
+    @mock.patch.dict(xml_func_cache)
+    @mock.patch.dict(xml_func_map)
+    def test_register_xml_converter(self):
+        class Amount(float):
+            pass
+
+        class Code(float, Enum):
+            A = 1.5
+
+        self.assertEqual("1.5", to_xml(Amount(1.5)))
+        self.assertIs(xml_func_map[float], xml_func_cache[Amount])
+        self.assertEqual("1.5", to_xml(Code.A))
+        self.assertEqual("1.5", enum_cache[Code, Code.A])
+
+        register_xml_converter(date, lambda value, namespaces: value.isoformat())
+        self.assertEqual({}, xml_func_cache)
+        self.assertEqual("2020-01-02T03:00:00", to_xml(datetime(2020, 1, 2, 3)))
+        self.assertEqual(
+            "2020-01-02 2020-01-03", to_xml([date(2020, 1, 2), date(2020, 1, 3)])
+        )
+
+        register_xml_converter(float, lambda value, namespaces: f"{value:.2f}")
+        self.assertEqual("1.50", to_xml(Amount(1.5)))
+        self.assertEqual("1.50", to_xml(Code.A))
+
+    def test_to_xml_with_qname_enum(self):
+        class Qualified(Enum):
+            A = QName("a", "b")
+
+        namespaces = Namespaces()
+        namespaces.add("a", "aa")
+        self.assertEqual("aa:b", to_xml(Qualified.A, namespaces))
+        self.assertEqual("{a}b", to_xml(Qualified.A))
+        self.assertNotIn((Qualified, Qualified.A), enum_cache)
+
+    @mock.patch.dict(enum_cache)
+    def test_to_xml_with_equal_members_of_different_enums(self):
+        class Integer(IntEnum):
+            X = 1
+
+        class Number(float, Enum):
+            X = 1.0
+
+        self.assertEqual("1", to_xml(Integer.X))
+        self.assertEqual("1.0", to_xml(Number.X))
+
     def test_to_python_integer(self):
         self.assertEqual(1, to_python([int], "1"))
         self.assertEqual(1, to_python([int, str], "1"))
@@ -109,3 +164,69 @@ class ConvertersTestCases(TestCase):
             pass
 
         self.assertEqual("1", to_python([Foo], "1"))
+
+
+class TypeConverterTests(TestCase):
+    def test_matches_to_python(self):
+        @dataclass
+        class Foo:
+            value: int
+
+        class QNameType(Enum):
+            a = QName("a")
+            b = QName("b")
+
+        class NumberType(Enum):
+            one = 1
+            half = 0.5
+
+        class Unhandled:
+            pass
+
+        samples = [
+            ([int], ["1", "a", " 2", "01"]),
+            ([int, str], ["1", "a"]),
+            ([str, int], ["1"]),
+            ([float], ["1", "a", "-INF", "INF"]),
+            ([bool], ["1", "true", "0", "false", "a", "1 ", "false "]),
+            ([Decimal], ["1.5", "1E-8"]),
+            ([UseType], ["optional", "required"]),
+            ([str, UseType], ["optional"]),
+            ([NumberType], ["1", "01", "1.0"]),
+            ([QNameType], ["a", "b"]),
+            ([QName], ["foo:x", "bar"]),
+            ([Foo], ["1"]),
+            ([float, UseType], ["1"]),
+            ([Unhandled], ["1"]),
+        ]
+
+        ns_map = {"foo": "bar"}
+        for types, values in samples:
+            converter = TypeConverter(types)
+            for value in values:
+                self.assertEqual(
+                    to_python(types, value, ns_map), converter(value, ns_map)
+                )
+                self.assertEqual(to_python(types, value), converter(value))
+
+    def test_non_string_values(self):
+        converter = TypeConverter([int])
+        self.assertEqual(1.5, converter(1.5))
+        self.assertIsNone(converter(None))
+
+    def test_enum_values_map(self):
+        converter = TypeConverter([UseType])
+        self.assertIs(UseType.OPTIONAL, converter("optional"))
+        self.assertEqual("nope", converter("nope"))
+
+    def test_property_qualified(self):
+        class QNameType(Enum):
+            a = QName("a")
+
+        class EmptyType(Enum):
+            pass
+
+        self.assertTrue(TypeConverter([QName]).qualified)
+        self.assertTrue(TypeConverter([int, QNameType]).qualified)
+        self.assertFalse(TypeConverter([int, str, UseType]).qualified)
+        self.assertFalse(TypeConverter([EmptyType]).qualified)
@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 from xsdata.utils.text import capitalize
+from xsdata.utils.text import identity
 from xsdata.utils.text import pascal_case
 from xsdata.utils.text import snake_case
 
@@ -28,6 +29,9 @@ class TextTests(TestCase):
         self.assertEqual("UserName", pascal_case("USER_NAME"))
         self.assertEqual("UserName", pascal_case("user_name"))
 
+    def test_identity(self):
+        self.assertEqual("userName", identity("userName"))
+
     def test_capitalize(self):
         self.assertEqual("UserName", capitalize("userName"))
         self.assertEqual(".userName", capitalize(".userName"))
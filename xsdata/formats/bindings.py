@@ -4,6 +4,7 @@ from abc import ABC
 from abc import abstractmethod
 from typing import Type
 from typing import TypeVar
+from typing import Union
 
 
 class AbstractSerializer(ABC):
@@ -15,14 +16,43 @@ class AbstractSerializer(ABC):
 T = TypeVar("T")
 
 
+class StringReader:
+    """
+    Binary file-like reader of a string.
+
+    The string is encoded in chunks as it's read, the input is never
+    copied as a whole.
+    """
+
+    __slots__ = ("source", "encoding", "offset")
+
+    def __init__(self, source: str, encoding: str = "utf-8"):
+        self.source = source
+        self.encoding = encoding
+        self.offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        start = self.offset
+        end = len(self.source) if size is None or size < 0 else start + size
+        chunk = self.source[start:end]
+        self.offset += len(chunk)
+        return chunk.encode(self.encoding)
+
+
 class AbstractParser(ABC):
-    def from_path(self, path: pathlib.Path, clazz: Type[T]) -> T:
-        """Parse the input file path and return the resulting object tree."""
-        return self.from_bytes(path.read_bytes(), clazz)
+    def from_path(self, path: Union[str, pathlib.Path], clazz: Type[T]) -> T:
+        """
+        Parse the input file path and return the resulting object tree.
+
+        The file is read in chunks by the parser, it's never loaded in
+        memory as a whole.
+        """
+        with open(path, "rb") as source:
+            return self.parse(source, clazz)  # type: ignore
 
     def from_string(self, source: str, clazz: Type[T]) -> T:
         """Parse the input string and return the resulting object tree."""
-        return self.from_bytes(source.encode(), clazz)
+        return self.parse(StringReader(source), clazz)  # type: ignore
 
     def from_bytes(self, source: bytes, clazz: Type[T]) -> T:
         """Parse the input bytes array return the resulting object tree."""
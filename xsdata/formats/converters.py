@@ -7,6 +7,7 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
 from lxml.etree import QName
@@ -15,6 +16,8 @@ from xsdata.exceptions import ConverterError
 from xsdata.formats.dataclass.models.generics import Namespaces
 from xsdata.utils import text
 
+XmlConverter = Callable[[Any, Optional[Namespaces]], Optional[str]]
+
 
 def sort_types(types: List[Type]) -> List[Type]:
     in_order = (bool, int, str, float, Decimal)
@@ -50,6 +53,84 @@ def to_python(
     return value
 
 
+class TypeConverter:
+    """
+    Compiled converter of xml string values to the given python types.
+
+    The types are tried in order and the first one that doesn't raise a
+    value error wins, like :func:`to_python`. Enumerations are resolved
+    through a precomputed map of their member values and the namespaces
+    map is only required for qname types.
+    """
+
+    __slots__ = ("types", "funcs", "qualified")
+
+    def __init__(self, types: List[Type]):
+        self.types = types
+        self.funcs = [self.compile(clazz) for clazz in types]
+        self.qualified = any(self.is_qualified(clazz) for clazz in types)
+
+    def __call__(self, value: Any, ns_map: Optional[Dict] = None) -> Any:
+        if not isinstance(value, str):
+            return value
+
+        for func in self.funcs:
+            try:
+                return func(value, ns_map)
+            except ValueError:
+                pass
+
+        return value
+
+    @classmethod
+    def compile(cls, clazz: Any) -> Callable:
+        name = getattr(clazz, "__name__", None)
+        if name in func_map:
+            func = func_map[name]
+            return lambda value, ns_map: func(value)
+        if clazz is QName:
+            return to_qname
+        if isinstance(clazz, type) and issubclass(clazz, Enum):
+            return cls.compile_enum(clazz)
+        if is_dataclass(clazz):
+            return lambda value, ns_map: clazz(value)
+
+        return lambda value, ns_map: to_class(clazz, value, ns_map)
+
+    @classmethod
+    def compile_enum(cls, clazz: Type[Enum]) -> Callable:
+        enumeration = next(iter(clazz), None)
+        if enumeration is None:
+            return lambda value, ns_map: to_enum(clazz, value, ns_map)
+
+        value_type = type(enumeration.value)
+        if value_type is QName:
+            return lambda value, ns_map: clazz(to_qname(value, ns_map))
+
+        members = {
+            str(member.value): member
+            for member in clazz
+            if type(member.value) is value_type and value_type is not bool
+        }
+
+        def convert(value: str, ns_map: Optional[Dict]) -> Enum:
+            member = members.get(value)
+            return member if member is not None else clazz(value_type(value))
+
+        return convert
+
+    @classmethod
+    def is_qualified(cls, clazz: Any) -> bool:
+        if clazz is QName:
+            return True
+
+        if isinstance(clazz, type) and issubclass(clazz, Enum):
+            enumeration = next(iter(clazz), None)
+            return enumeration is not None and isinstance(enumeration.value, QName)
+
+        return False
+
+
 def to_qname(value: str, ns_map: Optional[Dict]) -> QName:
     if ns_map is None:
         return QName(value)
@@ -90,32 +171,119 @@ def to_bool(value: Any) -> bool:
 
 
 def to_xml(value: Any, namespaces: Optional[Namespaces] = None) -> Any:
+    """
+    Convert the given value to its xml text representation.
+
+    The converter is looked up by the exact value type first and
+    resolved through the registered types on a cache miss, see
+    :func:`register_xml_converter`.
+    """
     if value is None:
         return None
-    if isinstance(value, list):
-        return " ".join(map(lambda x: to_xml(x, namespaces), value))
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    if isinstance(value, Enum):
-        return to_xml(value.value, namespaces)
-    if isinstance(value, float):
-        return "NaN" if math.isnan(value) else str(value).upper()
-    if isinstance(value, Decimal) and value.is_infinite():
+
+    clazz = type(value)
+    if clazz is str:
+        return value
+
+    func = xml_func_cache.get(clazz)
+    if func is None:
+        func = resolve_xml_converter(clazz)
+
+    return func(value, namespaces)
+
+
+def register_xml_converter(clazz: Type, func: XmlConverter):
+    """
+    Register the xml text converter of the given type and its subclasses.
+
+    The converter is called with the value and the namespaces instance,
+    which is None outside of the serializer.
+    """
+    xml_func_map[clazz] = func
+    xml_func_cache.clear()
+    enum_cache.clear()
+
+
+def resolve_xml_converter(clazz: Type) -> XmlConverter:
+    """Return and cache the converter of the closest registered type in
+    the method resolution order of the given type, enumerations take
+    precedence over their mixin types."""
+    func = xml_func_map.get(clazz)
+    if func is None:
+        if issubclass(clazz, Enum):
+            func = enum_to_xml
+        elif is_dataclass(clazz):
+            func = dataclass_to_xml
+        else:
+            func = next(
+                (xml_func_map[base] for base in clazz.__mro__ if base in xml_func_map),
+                object_to_xml,
+            )
+
+    xml_func_cache[clazz] = func
+    return func
+
+
+def object_to_xml(value: Any, namespaces: Optional[Namespaces]) -> str:
+    return str(value)
+
+
+def list_to_xml(value: List, namespaces: Optional[Namespaces]) -> str:
+    return " ".join([to_xml(val, namespaces) for val in value])
+
+
+def bool_to_xml(value: bool, namespaces: Optional[Namespaces]) -> str:
+    return "true" if value else "false"
+
+
+def float_to_xml(value: float, namespaces: Optional[Namespaces]) -> str:
+    return "NaN" if math.isnan(value) else str(value).upper()
+
+
+def decimal_to_xml(value: Decimal, namespaces: Optional[Namespaces]) -> str:
+    if value.is_infinite():
         return str(value).replace("Infinity", "INF")
-    if isinstance(value, QName):
-        return qname_to_xml(value, namespaces) if namespaces else value.text
-    if is_dataclass(value):
-        raise ConverterError("Text nodes can't be dataclasses!")
+
     return str(value)
 
 
-def qname_to_xml(qname: QName, namespaces: Namespaces) -> str:
+def enum_to_xml(value: Enum, namespaces: Optional[Namespaces]) -> str:
+    """Convert the enumeration value, the results of members with values
+    that don't depend on the namespaces are cached per enumeration."""
+    key = (value.__class__, value)
+    result = enum_cache.get(key)
+    if result is None:
+        result = to_xml(value.value, namespaces)
+        if not isinstance(value.value, (QName, list)):
+            enum_cache[key] = result
+
+    return result
+
+
+def dataclass_to_xml(value: Any, namespaces: Optional[Namespaces]) -> str:
+    raise ConverterError("Text nodes can't be dataclasses!")
+
+
+def qname_to_xml(qname: QName, namespaces: Optional[Namespaces]) -> str:
+    if not namespaces:
+        return qname.text
+
     namespaces.add(qname.namespace)
     prefix = namespaces.prefix(qname.namespace)
 
     return f"{prefix}:{qname.localname}" if prefix else qname.localname
 
 
+xml_func_map: Dict[Type, XmlConverter] = {
+    list: list_to_xml,
+    bool: bool_to_xml,
+    float: float_to_xml,
+    Decimal: decimal_to_xml,
+    QName: qname_to_xml,
+}
+xml_func_cache: Dict[Type, XmlConverter] = {}
+enum_cache: Dict[Tuple[Type, Enum], str] = {}
+
 func_map: Dict[str, Callable] = {
     "str": str,
     "int": int,
@@ -0,0 +1,149 @@
+import hashlib
+import importlib.util
+import pickle
+import sys
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from xsdata.formats.dataclass.models.elements import XmlMeta
+
+CACHE_VERSION = 1
+
+MetaEntry = Tuple[Any, ...]
+
+
+class ModuleHashes:
+    """Lazy map of module names to the sha256 digest of their source
+    file."""
+
+    def __init__(self):
+        self.hashes: Dict[str, Optional[str]] = {}
+
+    def get(self, name: str) -> Optional[str]:
+        if name not in self.hashes:
+            self.hashes[name] = self.digest(name)
+
+        return self.hashes[name]
+
+    @classmethod
+    def digest(cls, name: str) -> Optional[str]:
+        """Return the digest of the module source file, builtin and missing
+        modules have no digest."""
+        module = sys.modules.get(name)
+        path = getattr(module, "__file__", None)
+        if module is None:
+            try:
+                spec = importlib.util.find_spec(name)
+            except (ImportError, ValueError):
+                spec = None
+            path = spec.origin if spec and spec.has_location else None
+
+        if not path:
+            return None
+
+        try:
+            return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+
+def dump_entries(
+    entries: Iterable[Tuple[XmlMeta, MetaEntry]],
+    path: Union[str, Path],
+    name_generator: Callable,
+):
+    """
+    Write the given class metadata entries to the given path.
+
+    Every entry is keyed by the source file digests of the modules its
+    metadata was built from: the modules of the class and its bases,
+    the modules of its field types and the module of the name
+    generator. Entries of local classes that can't be pickled are
+    skipped.
+    """
+    hashes = ModuleHashes()
+    generator_module = getattr(name_generator, "__module__", None)
+    records = []
+    for meta, entry in entries:
+        try:
+            data = pickle.dumps(entry)
+        except (AttributeError, TypeError, pickle.PicklingError):
+            continue
+
+        modules = set(entry_modules(meta))
+        if generator_module:
+            modules.add(generator_module)
+        digests = tuple((name, hashes.get(name)) for name in sorted(modules))
+        records.append((digests, data))
+
+    payload = {
+        "version": cache_version(),
+        "generator": generator_key(name_generator),
+        "entries": records,
+    }
+    Path(path).write_bytes(pickle.dumps(payload))
+
+
+def load_entries(
+    path: Union[str, Path], name_generator: Callable
+) -> Iterator[MetaEntry]:
+    """
+    Read the class metadata entries of the given path.
+
+    Missing files or files from a different cache version, python
+    version or name generator yield nothing, entries with outdated
+    module digests or classes that no longer exist are skipped.
+
+    The file is unpickled, only load cache files from trusted
+    locations.
+    """
+    try:
+        payload = pickle.loads(Path(path).read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != cache_version()
+        or payload.get("generator") != generator_key(name_generator)
+    ):
+        return
+
+    hashes = ModuleHashes()
+    for digests, data in payload["entries"]:
+        if any(hashes.get(name) != digest for name, digest in digests):
+            continue
+
+        try:
+            yield pickle.loads(data)
+        except (AttributeError, ImportError, pickle.UnpicklingError):
+            continue
+
+
+def cache_version() -> Tuple[int, int, int]:
+    return CACHE_VERSION, sys.version_info[0], sys.version_info[1]
+
+
+def generator_key(name_generator: Callable) -> str:
+    """Return the qualified name of the given name generator."""
+    name = getattr(name_generator, "__qualname__", repr(name_generator))
+    return f"{getattr(name_generator, '__module__', None)}.{name}"
+
+
+def entry_modules(meta: XmlMeta) -> Iterator[str]:
+    for base in meta.clazz.__mro__:
+        if base.__module__ != "builtins":
+            yield base.__module__
+
+    for var in meta.vars:
+        for tp in var.types:
+            name = getattr(tp, "__module__", None)
+            if name and name != "builtins":
+                yield name
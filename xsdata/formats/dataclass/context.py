@@ -1,10 +1,13 @@
 import sys
+from collections import deque
 from dataclasses import dataclass
 from dataclasses import Field
 from dataclasses import field
 from dataclasses import fields
 from dataclasses import is_dataclass
 from dataclasses import MISSING
+from dataclasses import replace
+from pathlib import Path
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -12,22 +15,47 @@ from typing import get_type_hints
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
+from typing import Union
 
 from lxml.etree import QName
 
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.converters import sort_types
+from xsdata.formats.converters import TypeConverter
+from xsdata.formats.dataclass.cache import dump_entries
+from xsdata.formats.dataclass.cache import load_entries
+from xsdata.formats.dataclass.cache import MetaEntry
 from xsdata.formats.dataclass.models.constants import XmlType
 from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlNamespacePlan
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.models.enums import NamespaceType
+from xsdata.utils import text
 
 
 @dataclass
 class XmlContext:
-    name_generator: Callable = field(default=lambda x: x)
+    """
+    :ivar name_generator: Callable to generate the xml names of classes and fields
+    :ivar cache: Class metadata cache
+    :ivar xsi_cache: Index of xsi types to classes per class hierarchy root
+    :ivar namespace_cache: Root namespace declarations per root class
+    :ivar xsi_type_cache: Xsi type decisions per value and field class
+    :ivar frozen: Read only mode, cache misses are built but never stored
+    """
+
+    name_generator: Callable = field(default=text.identity)
     cache: Dict[Type, XmlMeta] = field(default_factory=dict)
+    xsi_cache: Dict[Type, Dict[QName, Type]] = field(default_factory=dict)
+    namespace_cache: Dict[Type, Optional[XmlNamespacePlan]] = field(
+        default_factory=dict
+    )
+    xsi_type_cache: Dict[Tuple[Type, Type], Optional[QName]] = field(
+        default_factory=dict
+    )
+    frozen: bool = field(default=False)
 
     def fetch(
         self,
@@ -44,54 +72,350 @@ class XmlContext:
         return meta
 
     def find_subclass(self, clazz: Type, xsi_type: QName) -> Optional[Type]:
-        for subclass in clazz.__subclasses__():
-            if self.match_class_source_qname(subclass, xsi_type):
+        """
+        Find the class with the given xsi type in the hierarchies of the
+        given class.
+
+        The index of every hierarchy root is built on first use, a lookup
+        miss rebuilds it from the live subclasses, so classes that are
+        defined later are always found and misses are never cached.
+        """
+        for root in self.hierarchy_roots(clazz):
+            index = self.xsi_cache.get(root)
+            if index is None or xsi_type not in index:
+                index = self.build_xsi_index(root)
+                if not self.frozen:
+                    self.xsi_cache[root] = index
+
+            subclass = index.get(xsi_type)
+            if subclass:
                 return subclass
 
-        for base in clazz.__bases__:
-            if not is_dataclass(base):
+        return None
+
+    def build_xsi_index(self, root: Type) -> Dict[QName, Type]:
+        """Index the dataclasses of the given hierarchy root by their source
+        qualified name, the first class in breadth first order wins."""
+        index: Dict[QName, Type] = {}
+        seen = set()
+        queue = deque([root])
+        while queue:
+            clazz = queue.popleft()
+            if clazz in seen:
                 continue
 
-            if self.match_class_source_qname(base, xsi_type):
-                return base
+            seen.add(clazz)
+            if is_dataclass(clazz):
+                index.setdefault(self.class_source_qname(clazz), clazz)
 
-            sibling = self.find_subclass(base, xsi_type)
-            if sibling:
-                return sibling
+            queue.extend(clazz.__subclasses__())
 
-        return None
+        return index
+
+    def invalidate_xsi_index(self, clazz: Type, source_qname: QName):
+        """Drop the hierarchy indexes of the given class that are unaware of
+        it."""
+        for root in self.hierarchy_roots(clazz):
+            index = self.xsi_cache.get(root)
+            if index is not None and source_qname not in index:
+                self.xsi_cache.pop(root, None)
+
+    @classmethod
+    def hierarchy_roots(cls, clazz: Type) -> List[Type]:
+        """Return the top most dataclasses in the method resolution order of
+        the given class, a class without dataclass bases is its own
+        root."""
+        roots = [
+            base
+            for base in clazz.__mro__
+            if is_dataclass(base) and not any(map(is_dataclass, base.__bases__))
+        ]
+        return roots or [clazz]
+
+    def class_source_qname(self, clazz: Type) -> QName:
+        """Return the qualified name of the given class in its source
+        schema."""
+        meta = self.class_meta(clazz)
+        name = getattr(meta, "name", self.name_generator(clazz.__name__))
+        module = sys.modules[clazz.__module__]
+        return QName(getattr(module, "__NAMESPACE__", None), name)
 
-    def match_class_source_qname(self, clazz: Type, xsi_type: QName) -> bool:
-        if is_dataclass(clazz):
-            meta = self.build(clazz)
-            return meta.source_qname == xsi_type
+    @staticmethod
+    def class_meta(clazz: Type) -> Any:
+        """Return the inner Meta class of the given class, inherited ones are
+        ignored."""
+        meta = getattr(clazz, "Meta", None)
+        if meta and meta.__qualname__ != f"{clazz.__name__}.Meta":
+            meta = None
 
-        return False
+        return meta
 
     def build(self, clazz: Type, parent_ns: Optional[str] = None) -> XmlMeta:
-        if clazz not in self.cache:
+        """
+        Build and cache the binding metadata of the given dataclass.
+
+        Concurrent builds of the same class are harmless, the first
+        stored instance wins.
+        """
+        meta = self.cache.get(clazz)
+        if meta is None:
             if not is_dataclass(clazz):
                 raise XmlContextError(f"Object {clazz} is not a dataclass.")
 
-            meta = getattr(clazz, "Meta", None)
-            if meta and meta.__qualname__ != f"{clazz.__name__}.Meta":
-                meta = None
+            class_meta = self.class_meta(clazz)
+            name = getattr(class_meta, "name", self.name_generator(clazz.__name__))
+            nillable = getattr(class_meta, "nillable", False)
+            namespace = getattr(class_meta, "namespace", parent_ns)
+            source_qname = self.class_source_qname(clazz)
 
-            name = getattr(meta, "name", self.name_generator(clazz.__name__))
-            nillable = getattr(meta, "nillable", False)
-            namespace = getattr(meta, "namespace", parent_ns)
-            module = sys.modules[clazz.__module__]
-            source_namespace = getattr(module, "__NAMESPACE__", None)
-
-            self.cache[clazz] = XmlMeta(
+            meta = XmlMeta(
                 name=name,
                 clazz=clazz,
                 qname=QName(namespace, name),
-                source_qname=QName(source_namespace, name),
+                source_qname=source_qname,
                 nillable=nillable,
                 vars=list(self.get_type_hints(clazz, namespace)),
             )
-        return self.cache[clazz]
+            if not self.frozen:
+                meta = self.cache.setdefault(clazz, meta)
+                self.invalidate_xsi_index(clazz, source_qname)
+
+        return meta
+
+    def warm(self, *classes: Type) -> "XmlContext":
+        """Build the metadata of the given classes, their subclasses and of
+        every dataclass reachable through their fields along with their
+        xsi type indexes."""
+        seen = set()
+        queue = deque((clazz, None) for clazz in classes)
+        while queue:
+            clazz, parent_ns = queue.popleft()
+            if clazz in seen:
+                continue
+
+            seen.add(clazz)
+            meta = self.build(clazz, parent_ns)
+            for root in self.hierarchy_roots(clazz):
+                if root not in self.xsi_cache and not self.frozen:
+                    self.xsi_cache[root] = self.build_xsi_index(root)
+
+            queue.extend((sub, parent_ns) for sub in clazz.__subclasses__())
+            for var in meta.vars:
+                queue.extend(
+                    (tp, meta.qname.namespace) for tp in var.types if is_dataclass(tp)
+                )
+
+        return self
+
+    def xsi_type(
+        self, clazz: Type, base: Type, parent_ns: Optional[str] = None
+    ) -> Optional[QName]:
+        """
+        Return the xsi type of the given class for values of a field of
+        the given base class or None if the class isn't derived from it.
+
+        The decision is cached per class pair, the parent namespace is
+        only used the first time the class metadata are built.
+        """
+        key = (clazz, base)
+        if key in self.xsi_type_cache:
+            return self.xsi_type_cache[key]
+
+        xsi_type = None
+        if issubclass(clazz, base) or any(
+            sup is not object and issubclass(clazz, sup) for sup in base.__bases__
+        ):
+            xsi_type = self.fetch(clazz, parent_ns).source_qname
+
+        if not self.frozen:
+            self.xsi_type_cache[key] = xsi_type
+
+        return xsi_type
+
+    def namespace_plan(self, clazz: Type) -> Optional[XmlNamespacePlan]:
+        """Return the root namespace declarations of the first rendered tree
+        of the given root class, if any."""
+        return self.namespace_cache.get(clazz)
+
+    def save_namespace_plan(self, clazz: Type, plan: XmlNamespacePlan):
+        """
+        Store the root namespace declarations of the first rendered tree of
+        the given root class, the plan is never replaced.
+
+        Classes whose trees can use namespaces outside the prefixes map or
+        whose root declares a namespace twice or as default are never
+        planned.
+        """
+        if self.frozen or clazz in self.namespace_cache:
+            return
+
+        uris = set(plan.nsmap.values())
+        if (
+            None in plan.nsmap
+            or len(uris) != len(plan.nsmap)
+            or not self.is_qualified(clazz)
+        ):
+            self.namespace_cache[clazz] = None
+        else:
+            self.namespace_cache[clazz] = plan
+
+    def is_qualified(self, clazz: Type) -> bool:
+        """
+        Return whether the object trees of the given class and of its known
+        subclasses use only the namespaces of their fields.
+
+        Wildcards, any type elements, attributes maps and custom element
+        names can use any namespace.
+        """
+        seen = set()
+        queue = deque([(clazz, None)])
+        while queue:
+            clazz, parent_ns = queue.popleft()
+            if clazz in seen:
+                continue
+
+            seen.add(clazz)
+            if hasattr(clazz, "qname"):
+                return False
+
+            meta = self.build(clazz, parent_ns)
+            for var in meta.vars:
+                if (
+                    var.is_wildcard
+                    or var.is_attributes
+                    or var.is_any_type
+                    or var.name == "qname"
+                ):
+                    return False
+
+                queue.extend(
+                    (tp, meta.qname.namespace) for tp in var.types if is_dataclass(tp)
+                )
+
+            queue.extend((sub, parent_ns) for sub in clazz.__subclasses__())
+
+        return True
+
+    def freeze(self) -> "XmlContext":
+        """
+        Return a read only snapshot of the context that can be shared
+        across threads without locks.
+
+        The snapshot never modifies its caches, classes that weren't
+        warmed before are built on every call.
+        """
+        return replace(
+            self,
+            cache=dict(self.cache),
+            xsi_cache=dict(self.xsi_cache),
+            namespace_cache=dict(self.namespace_cache),
+            xsi_type_cache=dict(self.xsi_type_cache),
+            frozen=True,
+        )
+
+    def dump_cache(self, path: Union[str, Path]):
+        """
+        Write the metadata of all the built classes to the given path.
+
+        The cache can only be loaded by contexts with the same name
+        generator.
+        """
+        entries = ((meta, self.encode_meta(meta)) for meta in self.cache.values())
+        dump_entries(entries, path, self.name_generator)
+
+    def load_cache(self, path: Union[str, Path]) -> int:
+        """
+        Load the classes metadata from the given path and return the
+        number of the loaded classes.
+
+        Classes from modules that were modified since the cache was
+        written are skipped and will be built on demand. The cache file
+        is unpickled, only load files from trusted locations.
+
+        :raises XmlContextError: If the context is frozen
+        """
+        if self.frozen:
+            raise XmlContextError("Frozen context can't be modified.")
+
+        count = 0
+        for entry in load_entries(path, self.name_generator):
+            meta = self.decode_meta(entry)
+            if meta and meta.clazz not in self.cache:
+                self.cache[meta.clazz] = meta
+                self.invalidate_xsi_index(meta.clazz, meta.source_qname)
+                count += 1
+
+        return count
+
+    @classmethod
+    def encode_meta(cls, meta: XmlMeta) -> MetaEntry:
+        """Convert the class metadata to a picklable tuple, the field
+        defaults and converters are restored from the class itself."""
+        return (
+            meta.clazz,
+            meta.name,
+            meta.qname.text,
+            meta.source_qname.text,
+            meta.nillable,
+            [
+                (
+                    type(var),
+                    var.name,
+                    var.qname.text,
+                    var.init,
+                    var.nillable,
+                    var.dataclass,
+                    var.sequential,
+                    var.types,
+                    var.namespaces,
+                )
+                for var in meta.vars
+            ],
+        )
+
+    @classmethod
+    def decode_meta(cls, entry: MetaEntry) -> Optional[XmlMeta]:
+        """Restore the class metadata from the given tuple or return None if
+        the class fields no longer match."""
+        clazz, name, qname, source_qname, nillable, var_entries = entry
+        if not isinstance(clazz, type) or not is_dataclass(clazz):
+            return None
+
+        class_fields = {var.name: var for var in fields(clazz)}
+        if len(class_fields) != len(var_entries):
+            return None
+
+        xml_vars = []
+        for var_entry in var_entries:
+            xml_clazz, var_name, var_qname, init, var_nillable = var_entry[:5]
+            dataclass, sequential, types, namespaces = var_entry[5:]
+            var = class_fields.get(var_name)
+            if var is None:
+                return None
+
+            xml_vars.append(
+                xml_clazz(
+                    name=var_name,
+                    qname=QName(var_qname),
+                    namespaces=namespaces,
+                    init=init,
+                    nillable=var_nillable,
+                    dataclass=dataclass,
+                    sequential=sequential,
+                    types=types,
+                    default=cls.default_value(var),
+                    converter=TypeConverter(types),
+                )
+            )
+
+        return XmlMeta(
+            name=name,
+            clazz=clazz,
+            qname=QName(qname),
+            source_qname=QName(source_qname),
+            nillable=nillable,
+            vars=xml_vars,
+        )
 
     def get_type_hints(self, clazz: Type, parent_ns: Optional[str]) -> Iterator[XmlVar]:
         type_hints = get_type_hints(clazz)
@@ -121,6 +445,7 @@ class XmlContext:
                 sequential=var.metadata.get("sequential", False),
                 types=types,
                 default=self.default_value(var),
+                converter=TypeConverter(types),
             )
 
     @staticmethod
@@ -181,12 +506,3 @@ class XmlContext:
             types.append(type_hint)
 
         return sort_types(types)
-
-    @classmethod
-    def is_derived(cls, obj: Any, clazz: Type) -> bool:
-        if isinstance(obj, clazz):
-            return True
-
-        return any(
-            base is not object and isinstance(obj, base) for base in clazz.__bases__
-        )
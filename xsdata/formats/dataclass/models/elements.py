@@ -7,12 +7,16 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Type
+from typing import TYPE_CHECKING
 
 from lxml.etree import QName
 
 from xsdata.models.enums import NamespaceType
 from xsdata.models.enums import QNames
 
+if TYPE_CHECKING:
+    from xsdata.formats.converters import TypeConverter
+
 
 @dataclass(frozen=True)
 class XmlVar:
@@ -25,6 +29,9 @@ class XmlVar:
     default: Any = None
     types: List[Type] = field(default_factory=list)
     namespaces: List[str] = field(default_factory=list)
+    converter: Optional["TypeConverter"] = field(
+        default=None, compare=False, repr=False
+    )
 
     @property
     def clazz(self) -> Optional[Type]:
@@ -158,6 +165,72 @@ find_lambdas = {
 }
 
 
+class RenderMode(IntEnum):
+    ATTRIBUTE = auto()
+    ATTRIBUTES = auto()
+    TEXT = auto()
+    SIMPLE = auto()
+    ELEMENT = auto()
+    NODE = auto()
+    SEQUENCE = auto()
+
+
+@dataclass(frozen=True)
+class XmlRenderStep:
+    """
+    Compiled serializer step of a single field or a run of sequential
+    fields.
+
+    Elements of simple types are rendered as text, elements of complex
+    types directly and any type elements and wildcards as generic nodes.
+
+    :ivar mode: The render mode of the step
+    :ivar var: The field or the first field of the sequence
+    :ivar sequence: The sequential fields
+    """
+
+    mode: RenderMode
+    var: XmlVar
+    sequence: List[XmlVar] = field(default_factory=list)
+
+    @classmethod
+    def mode_of(cls, var: XmlVar) -> RenderMode:
+        """Return the render mode of the given non sequential var."""
+        if var.is_attribute:
+            return RenderMode.ATTRIBUTE
+        if var.is_attributes:
+            return RenderMode.ATTRIBUTES
+        if var.is_text:
+            return RenderMode.TEXT
+        if var.is_element and object not in var.types:
+            return RenderMode.ELEMENT if var.dataclass else RenderMode.SIMPLE
+
+        return RenderMode.NODE
+
+
+@dataclass(frozen=True)
+class XmlNamespacePlan:
+    """
+    Namespace declarations of the root element of a rendered tree.
+
+    The declarations depend only on the predefined prefixes and on the
+    prefixes of all the namespaces of the tree.
+
+    :ivar registry: The predefined prefixes
+    :ivar ns_map: The prefixes of all the namespaces of the tree
+    :ivar nsmap: The namespace declarations of the root element
+    """
+
+    registry: Dict
+    ns_map: Dict
+    nsmap: Dict
+
+    def matches(self, registry: Dict, ns_map: Dict) -> bool:
+        """Return whether a tree with the given prefixes has the same root
+        declarations."""
+        return self.registry == registry and self.ns_map == ns_map
+
+
 @dataclass(frozen=True)
 class XmlMeta:
     name: str
@@ -167,6 +240,80 @@ class XmlMeta:
     nillable: bool
     vars: List[XmlVar] = field(default_factory=list)
     cache: Dict = field(default_factory=dict)
+    element_vars: Dict[QName, XmlVar] = field(init=False, default_factory=dict)
+    attribute_vars: Dict[QName, XmlVar] = field(init=False, default_factory=dict)
+    wildcard_vars: List[XmlVar] = field(init=False, default_factory=list)
+    text_var: Optional[XmlVar] = field(init=False, default=None)
+    any_attributes_var: Optional[XmlVar] = field(init=False, default=None)
+    render_steps: List[XmlRenderStep] = field(init=False, default_factory=list)
+
+    def __post_init__(self):
+        """
+        Compile the binding index for the parser lookups and the render
+        steps for the serializer.
+
+        Elements and attributes are mapped by their qualified names,
+        the first match wins as in :meth:`find_var`.
+        """
+        for var in self.vars:
+            if var.is_wildcard:
+                self.wildcard_vars.append(var)
+                continue
+
+            self.element_vars.setdefault(var.qname, var)
+            if var.is_attribute:
+                self.attribute_vars.setdefault(var.qname, var)
+            elif var.is_text and self.text_var is None:
+                object.__setattr__(self, "text_var", var)
+            elif var.is_attributes and self.any_attributes_var is None:
+                object.__setattr__(self, "any_attributes_var", var)
+
+        self.compile_render_steps()
+
+    def compile_render_steps(self):
+        """Compile the render steps in the fields order, consecutive
+        sequential fields are grouped in a single step."""
+        index = 0
+        stop = len(self.vars)
+        while index < stop:
+            var = self.vars[index]
+            if not var.sequential:
+                self.render_steps.append(XmlRenderStep(XmlRenderStep.mode_of(var), var))
+                index += 1
+                continue
+
+            end = index + 1
+            while end < stop and self.vars[end].sequential:
+                end += 1
+
+            sequence = self.vars[index:end]
+            self.render_steps.append(XmlRenderStep(RenderMode.SEQUENCE, var, sequence))
+            index = end
+
+    @property
+    def wildcard_var(self) -> Optional[XmlVar]:
+        """Return the first wildcard var, if any."""
+        return self.wildcard_vars[0] if self.wildcard_vars else None
+
+    def find_child_var(self, qname: QName) -> Optional[XmlVar]:
+        """Find the var for the given child element qualified name, non
+        wildcard vars take precedence."""
+        var = self.element_vars.get(qname)
+        if var is None and self.wildcard_vars:
+            var = self.find_wildcard_var(qname)
+
+        return var
+
+    def find_wildcard_var(self, qname: QName) -> Optional[XmlVar]:
+        """Find the first wildcard var that matches the given qualified
+        name."""
+        key = (hash(qname), hash(FindMode.WILDCARD))
+        if key not in self.cache:
+            self.cache[key] = next(
+                (var for var in self.wildcard_vars if var.matches(qname)), None
+            )
+
+        return self.cache[key]
 
     def find_var(
         self, qname: QName = QNames.ALL, mode: FindMode = FindMode.ALL
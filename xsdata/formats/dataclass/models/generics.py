@@ -31,6 +31,7 @@ class Namespaces:
     auto_ns: int = field(default_factory=int, init=False)
     dirty: bool = field(default=False, init=True)
     _ns_map: Optional[Dict] = field(init=False, default=None)
+    _prefixes: Optional[Dict] = field(init=False, default=None)
 
     @property
     def prefixes(self) -> List[str]:
@@ -47,9 +48,14 @@ class Namespaces:
         return self._ns_map
 
     def prefix(self, namespace: str) -> Optional[str]:
-        return next(
-            (prefix for prefix, uri in self.ns_map.items() if uri == namespace), None
-        )
+        """Return the first prefix of the given namespace in the prefixes
+        map order."""
+        if self._prefixes is None:
+            self._prefixes = {}
+            for prefix, uri in self.ns_map.items():
+                self._prefixes.setdefault(uri, prefix)
+
+        return self._prefixes.get(namespace)
 
     def add(self, uri: Optional[str], prefix: Optional[str] = None):
         if not uri or uri in self.data and not prefix:
@@ -57,11 +63,15 @@ class Namespaces:
 
         namespace = Namespace.get_enum(uri)
         prefix = namespace.prefix if namespace else prefix
+        if uri in self.data and prefix in self.data[uri]:
+            return
+
         if not prefix:
             prefix = f"ns{self.auto_ns}"
             self.auto_ns += 1
 
         self._ns_map = None
+        self._prefixes = None
         self.data[uri].add(prefix)
 
     def add_all(self, ns_map: Dict):
@@ -70,12 +80,22 @@ class Namespaces:
 
     def clear(self):
         self._ns_map = None
+        self._prefixes = None
         self.data.clear()
 
+    @property
+    def registry(self) -> Dict:
+        """The explicit prefixes map, auto generated and default prefixes are
+        excluded."""
+        return {
+            prefix: uri
+            for prefix, uri in self.ns_map.items()
+            if prefix and not prefix.startswith("ns")
+        }
+
     def register(self):
-        for prefix, uri in self.ns_map.items():
-            if prefix and not prefix.startswith("ns"):
-                register_namespace(prefix, uri)
+        for prefix, uri in self.registry.items():
+            register_namespace(prefix, uri)
 
     def unregister(self):
         for prefix, uri in self.ns_map.items():
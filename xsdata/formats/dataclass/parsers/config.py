@@ -3,4 +3,10 @@ from dataclasses import dataclass
 
 @dataclass
 class ParserConfig:
+    """
+    :ivar fail_on_unknown_properties: Fail on unknown elements
+    :ivar low_memory: Detach the processed elements from the lxml tree
+    """
+
     fail_on_unknown_properties: bool = True
+    low_memory: bool = False
@@ -0,0 +1,218 @@
+import io
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from xml.parsers import expat
+
+from lxml.etree import iterparse
+from lxml.etree import XMLParser
+
+from xsdata.models.enums import EventType
+
+XmlEvents = Iterator[Tuple[str, Any]]
+
+
+class XmlHandler(ABC):
+    """
+    Abstract xml event source.
+
+    The parser core consumes the ``start``, ``end`` and ``start-ns``
+    events with the same semantics as :func:`lxml.etree.iterparse`.
+    """
+
+    @abstractmethod
+    def events(self, source: io.BytesIO) -> XmlEvents:
+        """Return an iterator of (event, element) pairs for the given input
+        stream."""
+
+
+class LxmlEventHandler(XmlHandler):
+    """Default event source based on :func:`lxml.etree.iterparse`."""
+
+    def events(self, source: io.BytesIO) -> XmlEvents:
+        return iterparse(
+            source=source,
+            events=(EventType.START, EventType.END, EventType.START_NS),
+            recover=True,
+            remove_comments=True,
+        )
+
+
+class TargetElement:
+    """
+    Lightweight element for the event sources that don't build an element
+    tree.
+
+    It only supports the element api the parser nodes need, parents are
+    kept to resolve the namespaces map and the root element but children
+    are never attached.
+    """
+
+    __slots__ = ("tag", "attrib", "text", "tail", "sourceline", "_parent", "_nsmap")
+
+    def __init__(
+        self,
+        tag: str,
+        attrib: Dict,
+        nsmap: Dict,
+        parent: Optional["TargetElement"] = None,
+        sourceline: Optional[int] = None,
+    ):
+        self.tag = tag
+        self.attrib = attrib
+        self.text: Optional[str] = None
+        self.tail: Optional[str] = None
+        self.sourceline = sourceline
+        self._parent = parent
+        self._nsmap = nsmap
+
+    @property
+    def nsmap(self) -> Dict:
+        return dict(self._nsmap)
+
+    def getparent(self) -> Optional["TargetElement"]:
+        return self._parent
+
+    def getprevious(self) -> Optional["TargetElement"]:
+        return None
+
+    def clear(self):
+        self.attrib = {}
+        self.text = None
+        self.tail = None
+
+
+class EventCollector:
+    """Collect the parser callbacks as (event, element) pairs."""
+
+    def __init__(self):
+        self.events: List[Tuple[str, Any]] = []
+        self.stack: List[TargetElement] = []
+        self.last: Optional[TargetElement] = None
+        self.ns_map: Dict = {}
+
+    def start_ns(self, prefix: Optional[str], uri: str):
+        self.ns_map[prefix or None] = uri
+        self.events.append((EventType.START_NS, (prefix or "", uri)))
+
+    def start(
+        self,
+        tag: str,
+        attrib: Dict,
+        nsmap: Optional[Dict] = None,
+        sourceline: Optional[int] = None,
+    ):
+        """Open a new element, lxml passes the element's own namespaces map
+        which is ignored in favor of the start-ns events."""
+        parent = self.stack[-1] if self.stack else None
+        in_scope = parent._nsmap if parent else {}
+        if self.ns_map:
+            in_scope = {**in_scope, **self.ns_map}
+            self.ns_map = {}
+
+        element = TargetElement(tag, dict(attrib), in_scope, parent, sourceline)
+        self.stack.append(element)
+        self.last = None
+        self.events.append((EventType.START, element))
+
+    def end(self, *args: Any):
+        element = self.stack.pop()
+        self.last = element
+        self.events.append((EventType.END, element))
+
+    def data(self, data: str):
+        if self.last is not None:
+            self.last.tail = (self.last.tail or "") + data
+        elif self.stack:
+            element = self.stack[-1]
+            element.text = (element.text or "") + data
+
+    def close(self):
+        return None
+
+    def drain(self, final: bool = False) -> XmlEvents:
+        """
+        Return and forget the collected events.
+
+        A trailing end event is held back until the next event arrives,
+        because the element's tail may continue in the next input chunk.
+        """
+        events = self.events
+        if final or not events or events[-1][0] != EventType.END:
+            self.events = []
+        else:
+            self.events = events[-1:]
+            events = events[:-1]
+
+        return iter(events)
+
+
+class LxmlTargetHandler(XmlHandler):
+    """
+    Event source based on the lxml target parser interface.
+
+    The callbacks are collected per input chunk, no element tree is
+    created, the source lines are not available.
+    """
+
+    def __init__(self, chunk_size: int = 65536):
+        self.chunk_size = chunk_size
+
+    def events(self, source: io.BytesIO) -> XmlEvents:
+        collector = EventCollector()
+        parser = XMLParser(target=collector, recover=True, remove_comments=True)
+
+        while True:
+            chunk = source.read(self.chunk_size)
+            if not chunk:
+                break
+
+            parser.feed(chunk)
+            yield from collector.drain()
+
+        parser.close()
+        yield from collector.drain(final=True)
+
+
+class ExpatEventHandler(XmlHandler):
+    """Pure python event source based on :mod:`xml.parsers.expat`."""
+
+    def __init__(self, chunk_size: int = 65536):
+        self.chunk_size = chunk_size
+
+    def events(self, source: io.BytesIO) -> XmlEvents:
+        collector = EventCollector()
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+
+        def start(name: str, attrs: Dict):
+            attrib = {self.clark_notation(key): value for key, value in attrs.items()}
+            collector.start(
+                self.clark_notation(name), attrib, sourceline=parser.CurrentLineNumber,
+            )
+
+        parser.StartNamespaceDeclHandler = collector.start_ns
+        parser.StartElementHandler = start
+        parser.EndElementHandler = collector.end
+        parser.CharacterDataHandler = collector.data
+
+        while True:
+            chunk = source.read(self.chunk_size)
+            if not chunk:
+                break
+
+            parser.Parse(chunk, False)
+            yield from collector.drain()
+
+        parser.Parse(b"", True)
+        yield from collector.drain(final=True)
+
+    @staticmethod
+    def clark_notation(name: str) -> str:
+        """Convert the expat `uri}local` names to `{uri}local`."""
+        return f"{{{name}" if "}" in name else name
@@ -1,10 +1,20 @@
+import codecs
 import io
 import json
+import re
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
+from weakref import ref
+from weakref import WeakKeyDictionary
 
 from xsdata.exceptions import ParserError
 from xsdata.formats.bindings import AbstractParser
@@ -18,42 +28,98 @@ T = TypeVar("T")
 
 @dataclass
 class JsonParser(AbstractParser, XmlContext):
+    def from_string(self, source: str, clazz: Type[T]) -> T:
+        """Parse the JSON input string and return the resulting object
+        tree."""
+        ctx = json.loads(source)
+        return self.parse_context(ctx, clazz)
+
     def parse(self, source: io.BytesIO, clazz: Type[T]) -> T:
         """Parse the JSON input stream and return the resulting object tree."""
         ctx = json.load(source)
         return self.parse_context(ctx, clazz)
 
-    def parse_context(self, data: Dict, clazz: Type[T]) -> T:
+    def iterparse(
+        self, source: io.BytesIO, clazz: Type[T], lines: bool = False
+    ) -> Iterator[T]:
         """
-        Recursively build the given model from the input dict data.
+        Parse the values of a top level JSON array or of newline delimited
+        JSON documents and yield the resulting objects one at a time.
 
-        :raise TypeError: When parsing fails for any reason
+        The input stream is read incrementally and the memory footprint
+        is bounded by a single record. A stream that starts with an array
+        is read as a top level array, unless the lines flag is set.
+
+        :param source: The binary or text input stream
+        :param clazz: The target class of every record
+        :param lines: Read every value as a document, even arrays
         """
-        params = {}
+        decoder = self.decoder(clazz)
+        for data in JsonStream(source, lines=lines):
+            yield decoder.decode(data)
 
-        if isinstance(data, list) and len(data) == 1:
-            data = data[0]
+    def parse_context(self, data: Dict, clazz: Type[T]) -> T:
+        """
+        Build the given model from the input dict data with the compiled
+        class decoder.
 
-        for var in self.build(clazz).vars:
-            value = self.get_value(data, var)
+        :raise ParserError: When parsing fails for any reason
+        """
+        return self.decoder(clazz).decode(data)
 
-            if value is None:
-                continue
-            elif var.is_list:
-                params[var.name] = [self.bind_value(var, val) for val in value]
-            else:
-                params[var.name] = self.bind_value(var, value)
+    def decoder(self, clazz: Type) -> "JsonDecoder":
+        """
+        Return the compiled decoder of the given class.
 
+        Decoders are shared by all the parsers with the same name
+        generator. New decoders are published once the whole class graph
+        is compiled, the cache doesn't keep the classes alive. Builtin
+        generators can't be weakly referenced and are kept alive.
+        """
         try:
-            return clazz(**params)  # type: ignore
-        except Exception:
-            raise ParserError("Parsing failed")
+            decoders = JSON_DECODERS.setdefault(
+                self.name_generator, WeakKeyDictionary()
+            )
+        except TypeError:
+            decoders = JSON_STATIC_DECODERS.setdefault(
+                self.name_generator, WeakKeyDictionary()
+            )
 
-    def bind_value(self, var: XmlVar, value: Any) -> Any:
+        if clazz not in decoders:
+            pending: Dict[Type, JsonDecoder] = {}
+            self.compile_decoder(clazz, decoders, pending)
+            for key, decoder in pending.items():
+                decoders.setdefault(key, decoder)
+
+        return decoders[clazz]
+
+    def compile_decoder(
+        self, clazz: Type, decoders: Mapping[Type, "JsonDecoder"], pending: Dict
+    ) -> "JsonDecoder":
+        """Compile the decoder of the given class and of any nested class that
+        isn't compiled yet."""
+        decoder = decoders.get(clazz) or pending.get(clazz)
+        if decoder is None:
+            decoder = pending[clazz] = JsonDecoder(clazz)
+            decoder.fields = [
+                (
+                    var.name,
+                    (var.qname.localname, var.name),
+                    var.is_list,
+                    self.compile_value(var, decoders, pending),
+                )
+                for var in self.build(clazz).vars
+            ]
+
+        return decoder
+
+    def compile_value(
+        self, var: XmlVar, decoders: Mapping[Type, "JsonDecoder"], pending: Dict
+    ) -> Callable:
         """
-        Bind value according to the class var.
+        Return the value decoder of the given class var.
 
-        The return value can be:
+        The decoded value can be:
         - a dataclass instance
         - a dictionary with unknown attributes
         - a list of unknown elements
@@ -61,34 +127,193 @@ class JsonParser(AbstractParser, XmlContext):
         - a primitive value
         """
         if var.dataclass and var.clazz:
-            return self.parse_context(value, var.clazz)
+            return self.compile_decoder(var.clazz, decoders, pending).decode
 
         if var.is_attributes:
-            return dict(value)
+            return dict
 
         if var.is_wildcard:
-            return (
-                value
-                if isinstance(value, str)
-                else self.parse_context(value, AnyElement)
+            any_decoder = self.compile_decoder(AnyElement, decoders, pending)
+            return lambda value: (
+                value if isinstance(value, str) else any_decoder.decode(value)
             )
 
-        return ParserUtils.parse_value(
-            var.types, value, var.default, tokens=var.is_tokens
-        )
-
-    @staticmethod
-    def get_value(data: Dict, field: XmlVar) -> Any:
-        """Find the field value in the given dictionary or return the default
-        field value."""
-        if field.qname.localname in data:
-            value = data[field.qname.localname]
-        elif field.name in data:
-            value = data[field.name]
-        else:
-            return None
-
-        if field.is_list and not isinstance(value, list):
-            value = [value]
-
-        return value
+        if var.converter is None or var.is_tokens:
+            return partial(ParserUtils.parse_var, var)
+
+        return var.converter
+
+
+READ_SIZE = 64 * 1024
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+JSON_DECODERS: "WeakKeyDictionary[Callable, WeakKeyDictionary[Type, JsonDecoder]]"
+JSON_DECODERS = WeakKeyDictionary()
+JSON_STATIC_DECODERS: "Dict[Callable, WeakKeyDictionary[Type, JsonDecoder]]" = {}
+
+
+class JsonDecoder:
+    """
+    Compiled decoder of json dictionaries to a dataclass.
+
+    :ivar ref: Weak reference to the target dataclass
+    :ivar fields: List of the field name, the lookup keys, the list flag
+        and the value decoder of every class var
+    """
+
+    __slots__ = ("ref", "fields")
+
+    def __init__(self, clazz: Type):
+        self.ref = ref(clazz)
+        self.fields: List[Tuple[str, Tuple[str, str], bool, Callable]] = []
+
+    def decode(self, data: Any) -> Any:
+        """
+        Decode the given dictionary, the first key of every field found in
+        the data wins and null values are skipped.
+
+        :raise ParserError: When the class instantiation fails
+        """
+        if isinstance(data, list) and len(data) == 1:
+            data = data[0]
+
+        params = {}
+        for name, keys, is_list, decode in self.fields:
+            for key in keys:
+                if key in data:
+                    value = data[key]
+                    break
+            else:
+                continue
+
+            if value is None:
+                continue
+
+            if is_list:
+                if not isinstance(value, list):
+                    value = [value]
+                params[name] = [decode(val) for val in value]
+            else:
+                params[name] = decode(value)
+
+        try:
+            return self.ref()(**params)  # type: ignore
+        except Exception:
+            raise ParserError("Parsing failed")
+
+
+class JsonStream:
+    """
+    Incremental reader of the values of a top level JSON array or of
+    consecutive JSON documents, e.g. newline delimited JSON.
+
+    Binary streams are decoded as utf-8. A top level array and a stream
+    of arrays look the same until the first one ends, so a stream that
+    starts with an array is read as a top level array, unless the lines
+    flag is set.
+
+    :ivar source: The binary or text input stream
+    :ivar read_size: The initial size of the stream reads
+    :ivar lines: Read every value as a document, even arrays
+    :ivar buffer: The unconsumed text read so far
+    :ivar pos: The current position in the buffer
+    :ivar eof: The end of the stream flag
+    """
+
+    __slots__ = (
+        "source",
+        "read_size",
+        "lines",
+        "decoder",
+        "text",
+        "buffer",
+        "pos",
+        "eof",
+    )
+
+    def __init__(self, source: Any, read_size: int = READ_SIZE, lines: bool = False):
+        self.source = source
+        self.read_size = read_size
+        self.lines = lines
+        self.decoder = json.JSONDecoder()
+        self.text = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yield the decoded values of the stream.
+
+        :raise ParserError: When the top level array is malformed
+        """
+        if self.lines or self.peek() != "[":
+            while self.peek():
+                yield self.decode()
+            return
+
+        self.pos += 1
+        if self.peek() != "]":
+            while True:
+                yield self.decode()
+
+                char = self.peek()
+                if char == "]":
+                    break
+                if char != ",":
+                    raise ParserError(f"Expected `,` or `]` at position {self.pos}")
+
+                self.pos += 1
+
+        self.pos += 1
+        if self.peek():
+            raise ParserError(f"Unexpected data at position {self.pos}")
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character or an empty string
+        at the end of the stream."""
+        while True:
+            match = WHITESPACE.match(self.buffer, self.pos)
+            if match:
+                self.pos = match.end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill(self.read_size):
+                return ""
+
+    def decode(self) -> Any:
+        """
+        Decode the next value after any whitespace, a value that is
+        incomplete or ends with the buffer is retried with more data and
+        a doubling read size.
+
+        :raise JSONDecodeError: When the value is invalid
+        """
+        self.peek()
+        size = self.read_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+
+            self.fill(size)
+            size *= 2
+
+    def fill(self, size: int) -> bool:
+        """Read the next chunk of the stream, drop the consumed text of the
+        buffer and return whether any data were read."""
+        if self.eof:
+            return False
+
+        data = self.source.read(size)
+        self.eof = not data
+        if isinstance(data, bytes):
+            data = self.text.decode(data, final=self.eof)
+
+        pos, self.pos = self.pos, 0
+        self.buffer = self.buffer[pos:] + data
+        return not self.eof
@@ -2,22 +2,32 @@ from dataclasses import dataclass
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
-from typing import Type
 
 from lxml.etree import Element
 from lxml.etree import QName
 
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.context import XmlContext
-from xsdata.formats.dataclass.models.elements import FindMode
 from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.projection import Projection
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
 
 
-@dataclass(frozen=True)
+@dataclass
 class XmlNode:
+    """
+    Base parser node, nodes are created for every element and they are
+    slotted to keep them cheap.
+
+    :ivar position: The index of the node's first child in the parsed objects
+    """
+
+    __slots__ = ("position",)
+
     position: int
 
     def next_node(self, element: Element, position: int, ctx: XmlContext) -> "XmlNode":
@@ -27,11 +37,24 @@ class XmlNode:
         raise NotImplementedError(f"Not Implemented {element.tag}.")
 
 
-@dataclass(frozen=True)
+@dataclass
 class ElementNode(XmlNode):
+    """
+    :ivar meta: Class metadata, projected if there is a projection
+    :ivar default: Field default value
+    :ivar config: Parser config
+    :ivar projection: Selected fields, None for all
+
+    Slots can't carry class level defaults, every field is a required
+    argument.
+    """
+
+    __slots__ = ("meta", "default", "config", "projection")
+
     meta: XmlMeta
     default: Any
     config: ParserConfig
+    projection: Optional[Projection]
 
     def parse_element(self, element: Element, objects: List[Any]) -> Tuple:
         params: Dict = dict()
@@ -39,6 +62,8 @@ class ElementNode(XmlNode):
         ParserUtils.bind_element_text(params, self.meta, element)
         ParserUtils.bind_element_children(params, self.meta, self.position, objects)
         ParserUtils.bind_element_wild_text(params, self.meta, element)
+        if self.projection is not None:
+            self.projection.bind_defaults(params, self.meta.clazz)
 
         qname = QName(element.tag)
         obj = self.meta.clazz(**params)
@@ -47,12 +72,9 @@ class ElementNode(XmlNode):
 
     def next_node(self, element: Element, position: int, ctx: XmlContext) -> XmlNode:
         qname = QName(element.tag)
-        var = self.meta.find_var(qname, FindMode.NOT_WILDCARD)
+        var = self.meta.find_child_var(qname)
         if not var:
-            var = self.meta.find_var(qname, FindMode.WILDCARD)
-
-        if not var:
-            if self.config.fail_on_unknown_properties:
+            if self.config.fail_on_unknown_properties and self.projection is None:
                 raise XmlContextError(
                     f"{self.meta.qname} does not support mixed content: {qname}"
                 )
@@ -61,31 +83,38 @@ class ElementNode(XmlNode):
         if var.clazz:
             xsi_type = ParserUtils.parse_xsi_type(element)
             meta = ctx.fetch(var.clazz, self.meta.qname.namespace, xsi_type)
+            projection = self.projection.child(var.name) if self.projection else None
+            if projection is not None:
+                meta = projection.project(meta)
+
             return ElementNode(
-                position=position, meta=meta, default=var.default, config=self.config
+                position=position,
+                meta=meta,
+                default=var.default,
+                config=self.config,
+                projection=projection,
             )
 
         if var.is_any_type:
             return WildcardNode(position=position, qname=var.qname)
 
-        return PrimitiveNode(
-            position=position,
-            types=var.types,
-            default=var.default,
-            tokens=var.is_tokens,
-        )
+        return PrimitiveNode(position=position, var=var)
 
 
-@dataclass(frozen=True)
+@dataclass
 class RootNode(ElementNode):
+    __slots__ = ()
+
     def next_node(self, element: Element, position: int, ctx: XmlContext) -> XmlNode:
         if element.getparent() is None:
             return self
         return super(RootNode, self).next_node(element, position, ctx)
 
 
-@dataclass(frozen=True)
+@dataclass
 class WildcardNode(XmlNode):
+    __slots__ = ("qname",)
+
     qname: str
 
     def parse_element(self, element: Element, objects: List[Any]) -> Tuple:
@@ -98,19 +127,15 @@ class WildcardNode(XmlNode):
         return WildcardNode(position=position, qname=self.qname)
 
 
-@dataclass(frozen=True)
+@dataclass
 class PrimitiveNode(XmlNode):
-    types: List[Type]
-    tokens: bool = False
-    default: Any = None
+    __slots__ = ("var",)
+
+    var: XmlVar
 
     def parse_element(self, element: Element, objects: List) -> Tuple:
         qname = QName(element.tag)
-        value = element.text
-        ns_map = element.nsmap
-        obj = ParserUtils.parse_value(
-            self.types, value, self.default, ns_map, self.tokens
-        )
+        obj = ParserUtils.parse_var(self.var, element.text, element)
 
         return qname, obj
 
@@ -118,8 +143,10 @@ class PrimitiveNode(XmlNode):
         raise XmlContextError("Primitive node doesn't support child nodes!")
 
 
-@dataclass(frozen=True)
+@dataclass
 class SkipNode(XmlNode):
+    __slots__ = ()
+
     def next_node(self, element: Element, position: int, ctx: XmlContext) -> XmlNode:
         return SkipNode(position=position)
 
@@ -0,0 +1,144 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from itertools import islice
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from xsdata.exceptions import ParserError
+from xsdata.formats.bindings import AbstractParser
+
+ParseResults = Iterator[Tuple[int, Any]]
+
+__worker__: Dict[str, AbstractParser] = {}
+
+
+def init_worker(factory: Callable[[], AbstractParser]):
+    """Build the process parser once, its context is reused for every
+    document the process handles."""
+    __worker__["parser"] = factory()
+
+
+def parse_chunk(sources: List[bytes], clazz: Type) -> List[Any]:
+    """
+    Parse the given documents with the process parser and return the
+    resulting objects or the raised exceptions.
+
+    Exceptions are converted to parser errors, lxml syntax errors can't
+    be pickled back to the main process.
+    """
+    parser = __worker__["parser"]
+    results: List[Any] = []
+    for source in sources:
+        try:
+            results.append(parser.from_bytes(source, clazz))
+        except ParserError as e:
+            results.append(e)
+        except Exception as e:
+            results.append(ParserError(f"{e.__class__.__name__}: {e}"))
+
+    return results
+
+
+class ParserPool:
+    """
+    Fan out documents to a process pool.
+
+    :ivar factory: Picklable callable that builds the worker parser
+    :ivar workers: Number of worker processes, default: cpu count
+    :ivar chunksize: Number of documents per task
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], AbstractParser],
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+    ):
+        self.factory = factory
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = max(chunksize, 1)
+
+    def parse(
+        self, sources: Iterable[bytes], clazz: Type, ordered: bool = True
+    ) -> ParseResults:
+        """
+        Parse the input bytes arrays and yield the document index and the
+        resulting object tree or the raised exception.
+
+        The number of tasks in flight is bounded to twice the number of
+        workers, the sources iterable is consumed lazily.
+        """
+        chunks = self.chunks(sources)
+        limit = self.workers * 2
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers, initializer=init_worker, initargs=(self.factory,),
+        ) as executor:
+
+            def submit(offset: int, chunk: List[bytes]) -> Tuple[Future, int, int]:
+                future = executor.submit(parse_chunk, chunk, clazz)
+                return future, offset, len(chunk)
+
+            if ordered:
+                queue: Deque = deque()
+                for offset, chunk in chunks:
+                    queue.append(submit(offset, chunk))
+                    if len(queue) >= limit:
+                        yield from self.results(*queue.popleft())
+
+                while queue:
+                    yield from self.results(*queue.popleft())
+            else:
+                pending: Dict[Future, Tuple[int, int]] = {}
+                for offset, chunk in chunks:
+                    future, offset, size = submit(offset, chunk)
+                    pending[future] = offset, size
+                    if len(pending) >= limit:
+                        yield from self.completed(pending)
+
+                while pending:
+                    yield from self.completed(pending)
+
+    def chunks(self, sources: Iterable[bytes]) -> Iterator[Tuple[int, List[bytes]]]:
+        """Split the sources to lists of chunksize documents with their
+        starting index."""
+        iterator = iter(sources)
+        offset = 0
+        while True:
+            chunk = list(islice(iterator, self.chunksize))
+            if not chunk:
+                break
+
+            yield offset, chunk
+            offset += len(chunk)
+
+    @classmethod
+    def completed(cls, pending: Dict[Future, Tuple[int, int]]) -> ParseResults:
+        """Wait for at least one task and yield the results of all the
+        completed ones."""
+        done, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from cls.results(future, *pending.pop(future))
+
+    @classmethod
+    def results(cls, future: Future, offset: int, size: int) -> ParseResults:
+        """Yield the task results, a failed task reports its exception for
+        every document in the chunk."""
+        try:
+            results = future.result()
+        except Exception as e:
+            results = [e] * size
+
+        yield from enumerate(results, start=offset)
@@ -0,0 +1,100 @@
+from dataclasses import fields
+from dataclasses import MISSING
+from dataclasses import replace
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Type
+
+from xsdata.formats.dataclass.models.elements import XmlMeta
+
+
+class Projection:
+    """
+    Tree of the selected field names of a class and its nested classes.
+
+    A field without a sub projection is selected with all of its
+    descendants. The projected class metadata are cached per class.
+
+    :ivar fields: Mapping of selected field names to their sub projection
+    :ivar metas: Projected class metadata cache
+    :ivar defaults: Values of the unselected required fields per class
+    """
+
+    __slots__ = ("fields", "metas", "defaults")
+
+    def __init__(self, fields: Dict[str, Optional["Projection"]]):
+        self.fields = fields
+        self.metas: Dict[Type, XmlMeta] = {}
+        self.defaults: Dict[Type, Dict] = {}
+
+    def __getstate__(self) -> Dict[str, Optional["Projection"]]:
+        """Pickle only the selected fields, the caches hold the metadata of
+        the process context."""
+        return self.fields
+
+    def __setstate__(self, fields: Dict[str, Optional["Projection"]]):
+        self.__init__(fields)  # type: ignore
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> "Projection":
+        """
+        Create a projection from the given dotted field paths, e.g.
+        ``["header", "totals.amount"]``
+
+        A path that selects a field overrides the deeper paths of the
+        same field.
+        """
+        root = cls({})
+        for path in paths:
+            projection: Optional[Projection] = root
+            *parents, name = path.split(".")
+            for parent in parents:
+                if projection is None:
+                    break
+
+                if parent not in projection.fields:
+                    projection.fields[parent] = cls({})
+
+                projection = projection.fields[parent]
+
+            if projection is not None:
+                projection.fields[name] = None
+
+        return root
+
+    def child(self, name: str) -> Optional["Projection"]:
+        """Return the sub projection of the given field name."""
+        return self.fields.get(name)
+
+    def project(self, meta: XmlMeta) -> XmlMeta:
+        """
+        Return a copy of the given class metadata with only the selected
+        vars.
+
+        Concurrent projections of the same class are harmless, the
+        defaults are stored before the metadata and the first stored
+        instances win.
+        """
+        clazz = meta.clazz
+        projected = self.metas.get(clazz)
+        if projected is None:
+            xml_vars = [var for var in meta.vars if var.name in self.fields]
+            defaults = {
+                var.name: None
+                for var in fields(clazz)
+                if var.init
+                and var.name not in self.fields
+                and var.default is MISSING
+                and var.default_factory is MISSING  # type: ignore
+            }
+            self.defaults.setdefault(clazz, defaults)
+            projected = replace(meta, vars=xml_vars, cache={})
+            projected = self.metas.setdefault(clazz, projected)
+
+        return projected
+
+    def bind_defaults(self, params: Dict, clazz: Type):
+        """Add the default values of the unselected required fields of the
+        given class."""
+        params.update(self.defaults[clazz])
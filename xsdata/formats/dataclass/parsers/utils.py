@@ -11,7 +11,6 @@ from lxml.etree import QName
 
 from xsdata.exceptions import ParserError
 from xsdata.formats.converters import to_python
-from xsdata.formats.dataclass.models.elements import FindMode
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.generics import AnyElement
@@ -50,18 +49,46 @@ class ParserUtils:
 
         return to_python(types, value, ns_map)
 
+    @classmethod
+    def parse_var(
+        cls, var: XmlVar, value: Any, element: Optional[Element] = None
+    ) -> Any:
+        """
+        Convert xml string values with the var's compiled converter.
+
+        The element namespaces map is only resolved for qname types.
+        """
+        converter = var.converter
+        if converter is None:
+            ns_map = element.nsmap if element is not None else None
+            return cls.parse_value(var.types, value, var.default, ns_map, var.is_tokens)
+
+        if value is None:
+            return None if callable(var.default) else var.default
+
+        ns_map = element.nsmap if element is not None and converter.qualified else None
+        if var.is_tokens:
+            value = value if isinstance(value, list) else filter(None, value.split(" "))
+            return [converter(val, ns_map) for val in value]
+
+        return converter(value, ns_map)
+
     @classmethod
     def bind_element_children(
         cls, params: Dict, meta: XmlMeta, position: int, objects: List,
     ):
-        """Return a dictionary of qualified object names and their values for
-        the given queue item."""
+        """
+        Bind the parsed objects from the given position onwards to the
+        params of the given class metadata.
+
+        The objects are handed off and removed with a single slice
+        deletion.
+        """
+        children = objects[position:]
+        del objects[position:]
 
-        while len(objects) > position:
-            qname, value = objects.pop(position)
-            arg = meta.find_var(qname, FindMode.NOT_WILDCARD) or meta.find_var(
-                qname, FindMode.WILDCARD
-            )
+        for qname, value in children:
+            arg = meta.find_child_var(qname)
 
             if not arg:
                 raise ParserError("Impossible exception!")
@@ -83,10 +110,8 @@ class ParserUtils:
 
     @classmethod
     def fetch_any_children(cls, position: int, objects: List) -> List[object]:
-        children = []
-        while len(objects) > position:
-            _, value = objects.pop(position)
-            children.append(value)
+        children = [value for _, value in objects[position:]]
+        del objects[position:]
         return children
 
     @classmethod
@@ -123,7 +148,7 @@ class ParserUtils:
 
     @classmethod
     def bind_element_wild_text(cls, params: Dict, meta: XmlMeta, element: Element):
-        var = meta.find_var(mode=FindMode.WILDCARD)
+        var = meta.wildcard_var
         if not var:
             return
 
@@ -174,11 +199,9 @@ class ParserUtils:
 
     @classmethod
     def bind_element_text(cls, params: Dict, metadata: XmlMeta, element: Element):
-        var = metadata.find_var(mode=FindMode.TEXT)
+        var = metadata.text_var
         if var and element.text is not None and var.init:
-            params[var.name] = cls.parse_value(
-                var.types, element.text, var.default, element.nsmap, var.is_tokens
-            )
+            params[var.name] = cls.parse_var(var, element.text, element)
 
     @classmethod
     def bind_element_attrs(cls, params: Dict, metadata: XmlMeta, element: Element):
@@ -189,15 +212,13 @@ class ParserUtils:
         if not element.attrib:
             return
 
-        wildcard = metadata.find_var(mode=FindMode.ATTRIBUTES)
+        wildcard = metadata.any_attributes_var
         for key, value in element.attrib.items():
-            var = metadata.find_var(QName(key), FindMode.ATTRIBUTE)
+            var = metadata.attribute_vars.get(key)
 
             if var and var.name not in params:
                 if var.init:
-                    params[var.name] = cls.parse_value(
-                        var.types, value, var.default, element.nsmap, var.is_tokens
-                    )
+                    params[var.name] = cls.parse_var(var, value, element)
             elif wildcard:
                 if wildcard.name not in params:
                     params[wildcard.name] = {}
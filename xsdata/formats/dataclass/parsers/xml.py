@@ -1,79 +1,310 @@
+import asyncio
 import io
 from dataclasses import dataclass
 from dataclasses import field
+from functools import partial
 from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Type
+from typing import Union
 
 from lxml.etree import Element
-from lxml.etree import iterparse
 from lxml.etree import QName
+from lxml.etree import XMLPullParser
 
 from xsdata.exceptions import ParserError
 from xsdata.formats.bindings import AbstractParser
 from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.generics import Namespaces
 from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import XmlEvents
+from xsdata.formats.dataclass.parsers.handlers import XmlHandler
 from xsdata.formats.dataclass.parsers.json import T
 from xsdata.formats.dataclass.parsers.nodes import RootNode
 from xsdata.formats.dataclass.parsers.nodes import XmlNode
+from xsdata.formats.dataclass.parsers.pool import ParseResults
+from xsdata.formats.dataclass.parsers.pool import ParserPool
+from xsdata.formats.dataclass.parsers.projection import Projection
 from xsdata.models.enums import EventType
 from xsdata.utils import text
 
 ParsedObjects = List[Tuple[QName, Any]]
+EVENT_NAMES_SIZE = 1024
 XmlNodes = List[XmlNode]
 
 
 @dataclass
 class XmlParser(AbstractParser):
+    """
+    Xml parser for dataclasses.
+
+    The parse state is kept per call, a parser and its context can be
+    shared across threads. The namespaces of the last parse call are
+    exposed for convenience.
+
+    :ivar namespaces: Namespaces of the last parse call
+    :ivar context: XmlContext instance
+    :ivar event_names: Element names to hook names cache, bounded
+    :ivar config: Parser config
+    :ivar handler: Xml events source
+    :ivar projection: Selected fields to bind, unselected elements are skipped
+    :ivar hooks: Element hook method names by event and element local name
+    """
+
     namespaces: Namespaces = field(init=False, default_factory=Namespaces)
     context: XmlContext = field(default_factory=XmlContext)
     event_names: Dict = field(default_factory=dict)
     config: ParserConfig = field(default_factory=ParserConfig)
+    handler: XmlHandler = field(default_factory=LxmlEventHandler)
+    projection: Optional[Projection] = field(default=None)
+    hooks: Dict[str, Dict[str, str]] = field(init=False, default_factory=dict)
+
+    def __post_init__(self):
+        self.hooks = self.find_hooks()
+
+    @classmethod
+    def find_hooks(cls) -> Dict[str, Dict[str, str]]:
+        """Map the ``start_*`` and ``end_*`` element hooks of the parser by
+        event and snake case element local name."""
+        hooks: Dict[str, Dict[str, str]] = {EventType.START: {}, EventType.END: {}}
+        for name in dir(cls):
+            event, _, local_name = name.partition("_")
+            if event in hooks and local_name and callable(getattr(cls, name)):
+                hooks[event][local_name] = name
+
+        return {event: names for event, names in hooks.items() if names}
 
     def parse(self, source: io.BytesIO, clazz: Type[T]) -> T:
         """Parse the XML input stream and return the resulting object tree."""
-        ctx = iterparse(
-            source=source,
-            events=(EventType.START, EventType.END, EventType.START_NS),
-            recover=True,
-            remove_comments=True,
-        )
+        ctx = self.handler.events(source)
         return self.parse_context(ctx, clazz)
 
-    def parse_context(self, context: iterparse, clazz: Type[T]) -> T:
+    def parse_context(self, context: XmlEvents, clazz: Type[T]) -> T:
         """
         Dispatch elements to handlers as they arrive and are fully parsed.
 
         :raises ParserError: When the requested type doesn't match the result object
         """
+        meta = self.context.build(clazz)
+        namespaces = self.namespaces = Namespaces()
+        objects: ParsedObjects = []
+        queue: XmlNodes = [self.root_node(meta)]
+
+        obj = self.dispatch_events(context, queue, objects, namespaces)
+
+        if not obj:
+            raise ParserError(f"Failed to create target class `{clazz.__name__}`")
+
+        return obj
+
+    def root_node(self, meta: XmlMeta) -> RootNode:
+        """Create the root node for the given class metadata and the parser
+        projection."""
+        if self.projection is not None:
+            meta = self.projection.project(meta)
+
+        return RootNode(
+            position=0,
+            meta=meta,
+            default=None,
+            config=self.config,
+            projection=self.projection,
+        )
+
+    async def parse_async(
+        self,
+        source: Union[asyncio.StreamReader, AsyncIterable[bytes]],
+        clazz: Type[T],
+        chunk_size: int = 65536,
+    ) -> T:
+        """
+        Parse the XML input chunks of the given stream reader or async
+        iterable and return the resulting object tree.
+
+        The chunks are fed incrementally to an lxml pull parser, bigger
+        chunks are split to the given size, and the control is given back
+        to the event loop after every chunk. The pull parser is always
+        lxml based, the parser's event handler is not used.
+
+        :raises ParserError: When the requested type doesn't match the result object
+        """
+        obj = None
+        meta = self.context.build(clazz)
+        namespaces = self.namespaces = Namespaces()
+        objects: ParsedObjects = []
+        queue: XmlNodes = [self.root_node(meta)]
+        parser = XMLPullParser(
+            events=(EventType.START, EventType.END, EventType.START_NS),
+            recover=True,
+            remove_comments=True,
+        )
+
+        async for chunk in self.read_chunks(source, chunk_size):
+            parser.feed(chunk)
+            events = parser.read_events()
+            result = self.dispatch_events(events, queue, objects, namespaces)
+            if result is not None:
+                obj = result
+            await asyncio.sleep(0)
+
+        parser.close()
+        events = parser.read_events()
+        result = self.dispatch_events(events, queue, objects, namespaces)
+        if result is not None:
+            obj = result
+
+        if not obj:
+            raise ParserError(f"Failed to create target class `{clazz.__name__}`")
+
+        return obj
+
+    @classmethod
+    async def read_chunks(
+        cls, source: Union[asyncio.StreamReader, AsyncIterable[bytes]], size: int
+    ) -> AsyncIterator[bytes]:
+        """Iterate the byte chunks of the given stream reader or async
+        iterable, the iterable chunks are split to the given size."""
+        if isinstance(source, asyncio.StreamReader):
+            while True:
+                chunk = await source.read(size)
+                if not chunk:
+                    break
+                yield chunk
+        else:
+            async for chunk in source:
+                for start in range(0, len(chunk), size):
+                    end = start + size
+                    yield chunk[start:end]
+
+    def dispatch_events(
+        self,
+        events: XmlEvents,
+        queue: XmlNodes,
+        objects: ParsedObjects,
+        namespaces: Namespaces,
+    ) -> Any:
+        """Dispatch the given events to the node queue and return the object
+        of the root element, if it was dequeued."""
         obj = None
+        for event, element in events:
+            if event == EventType.START_NS:
+                self.add_namespace(element, namespaces)
+            if event == EventType.START:
+                self.queue(element, queue, objects)
+            elif event == EventType.END:
+                result = self.dequeue(element, queue, objects)
+                if len(queue) == 1:
+                    obj = result
+
+        return obj
+
+    def iterparse(
+        self, source: io.BytesIO, clazz: Type, path: Sequence[str]
+    ) -> Iterator[Any]:
+        """
+        Parse the XML input stream and yield the objects of the repeating
+        element at the given path as soon as they are complete.
+
+        The path is the list of the element qualified names below the
+        root element, e.g. ``["book"]`` for ``<books><book/>...</books>``
+        """
+        ctx = self.handler.events(source)
+        return self.iterparse_context(ctx, clazz, path)
+
+    def iterparse_context(
+        self, context: XmlEvents, clazz: Type, path: Sequence[str]
+    ) -> Iterator[Any]:
+        """
+        Dispatch elements to handlers and yield the objects that match the
+        given path.
+
+        Yielded objects are removed from the parsed objects and their
+        elements along with their preceding siblings are released, in
+        order to keep the memory bounded by a single record. The
+        ancestors of the records are never bound.
+        """
         meta = self.context.build(clazz)
-        self.namespaces.clear()
+        namespaces = self.namespaces = Namespaces()
+        target = [QName(tag).text for tag in path]
+        depth = len(target) + 1
+        tags: List[str] = []
         objects: ParsedObjects = []
-        queue: XmlNodes = [
-            RootNode(position=0, meta=meta, default=None, config=self.config)
-        ]
+        queue: XmlNodes = [self.root_node(meta)]
 
         for event, element in context:
             if event == EventType.START_NS:
-                self.add_namespace(element)
+                self.add_namespace(element, namespaces)
             if event == EventType.START:
+                tags.append(element.tag)
                 self.queue(element, queue, objects)
             elif event == EventType.END:
-                obj = self.dequeue(element, queue, objects)
+                if len(tags) < depth:
+                    position = queue.pop().position
+                    del objects[position:]
+                    element.clear()
+                elif len(tags) == depth and tags[1:] == target:
+                    position = queue[-1].position
+                    obj = self.dequeue(element, queue, objects)
+                    if len(objects) > position:
+                        del objects[position:]
+                        yield obj
 
-        if not obj:
-            raise ParserError(f"Failed to create target class `{clazz.__name__}`")
+                    self.release_siblings(element)
+                else:
+                    self.dequeue(element, queue, objects)
 
-        return obj
+                tags.pop()
 
-    def add_namespace(self, namespace: Tuple):
+    @classmethod
+    def release_siblings(cls, element: Element):
+        """Detach the processed preceding siblings of the given element."""
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+    def parse_many(
+        self,
+        sources: Iterable[bytes],
+        clazz: Type,
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+    ) -> ParseResults:
+        """
+        Parse the input bytes arrays in a process pool and yield the
+        document index and the resulting object tree.
+
+        Every worker process builds its own parser once and reuses its
+        context for all of its documents. Failed documents yield the
+        raised exception instead of aborting the batch. The results are
+        yielded in the input order or as soon as they complete.
+        """
+        factory = partial(
+            type(self),
+            config=self.config,
+            handler=self.handler,
+            context=XmlContext(name_generator=self.context.name_generator),
+            projection=self.projection,
+        )
+        pool = ParserPool(factory, workers=workers, chunksize=chunksize)
+        return pool.parse(sources, clazz, ordered=ordered)
+
+    @classmethod
+    def add_namespace(cls, namespace: Tuple, namespaces: Namespaces):
         """Add the given namespace in the registry."""
         prefix, uri = namespace
-        self.namespaces.add(uri, prefix)
+        namespaces.add(uri, prefix)
 
     def queue(self, element: Element, queue: XmlNodes, objects: ParsedObjects):
         """Queue the next xml node for parsing based on the given element
@@ -84,13 +315,17 @@ class XmlParser(AbstractParser):
         queue_item = item.next_node(element, position, self.context)
 
         queue.append(queue_item)
-        self.emit_event(EventType.START, element.tag, item=item, element=element)
+        if self.hooks:
+            self.emit_event(EventType.START, element.tag, item=item, element=element)
 
     def dequeue(self, element: Element, queue: XmlNodes, objects: ParsedObjects) -> Any:
         """
         Use the last xml node to parse the given element and bind any child
         objects.
 
+        In low memory mode the processed preceding siblings are also
+        detached, the lxml tree is then bound by the document depth.
+
         :returns Any: A dataclass instance or a python primitive value or None
         """
         item = queue.pop()
@@ -98,18 +333,29 @@ class XmlParser(AbstractParser):
 
         if qname:
             objects.append((qname, obj))
-            self.emit_event(EventType.END, element.tag, obj=obj, element=element)
+            if self.hooks:
+                self.emit_event(EventType.END, element.tag, obj=obj, element=element)
 
         element.clear()
+        if self.config.low_memory:
+            self.release_siblings(element)
 
         return obj
 
     def emit_event(self, event: str, name: str, **kwargs: Any):
         """Call if exist the parser's hook for the given element and event."""
+        hooks = self.hooks.get(event)
+        if not hooks:
+            return
+
+        local_name = self.event_names.get(name)
+        if local_name is None:
+            if len(self.event_names) >= EVENT_NAMES_SIZE:
+                self.event_names.clear()
 
-        if name not in self.event_names:
-            self.event_names[name] = text.snake_case(QName(name).localname)
+            local_name = text.snake_case(QName(name).localname)
+            self.event_names[name] = local_name
 
-        method_name = f"{event}_{self.event_names[name]}"
-        if hasattr(self, method_name):
+        method_name = hooks.get(local_name)
+        if method_name:
             getattr(self, method_name)(**kwargs)
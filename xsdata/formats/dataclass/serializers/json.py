@@ -1,15 +1,22 @@
+import itertools
 import json
-from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
+from typing import TextIO
 from typing import Tuple
 from typing import Type
+from typing import Union
+
+from lxml.etree import QName
 
 from xsdata.formats.bindings import AbstractSerializer
 
@@ -18,8 +25,19 @@ def filter_none(x: Tuple) -> Dict:
     return dict((k, v) for k, v in x if v is not None)
 
 
+def filter_empty(x: Tuple) -> Dict:
+    return dict((k, v) for k, v in x if not is_empty(v))
+
+
+def is_empty(value: Any) -> bool:
+    """Return whether the value is None or an empty string, list or
+    dictionary."""
+    return value is None or (isinstance(value, (str, list, tuple, dict)) and not value)
+
+
 class DictFactory:
     FILTER_NONE = filter_none
+    FILTER_EMPTY = filter_empty
 
 
 class JsonEncoder(json.JSONEncoder):
@@ -32,14 +50,117 @@ class JsonEncoder(json.JSONEncoder):
         return super(JsonEncoder, self).default(obj)
 
 
+PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+EMPTY = object()
+CLASS_FIELDS: Dict[Type, Tuple[str, ...]] = {}
+
+
 @dataclass
 class DictSerializer(AbstractSerializer):
+    """
+    Convert dataclass trees to dictionaries like :func:`dataclasses.asdict`
+    without deep copying the leaf values.
+
+    The filters of the :class:`DictFactory` are applied while building
+    the dictionaries, any other dict factory is called with the list of
+    the field name and value pairs.
+
+    :ivar dict_factory: Callable to generate dictionary
+    """
+
     dict_factory: Callable = field(default=dict)
 
     def render(self, obj: object) -> Dict:
         """Convert the given object tree to dictionary with primitive
         values."""
-        return asdict(obj, dict_factory=self.dict_factory)
+        return self.convert(obj)
+
+    def convert(self, value: Any) -> Any:
+        """Convert the given value recursively, dataclasses become
+        dictionaries and the list, tuple and dict containers are
+        copied."""
+        tp = type(value)
+        if tp in PRIMITIVE_TYPES:
+            return value
+
+        if hasattr(tp, "__dataclass_fields__"):
+            return self.convert_dataclass(value)
+
+        if tp is list:
+            return [self.convert(val) for val in value]
+
+        if isinstance(value, tuple) and hasattr(value, "_fields"):
+            return tp(*[self.convert(val) for val in value])
+
+        if isinstance(value, (list, tuple)):
+            return tp(self.convert(val) for val in value)
+
+        if isinstance(value, dict):
+            return tp(
+                (self.convert(key), self.convert(val)) for key, val in value.items()
+            )
+
+        return self.convert_value(value)
+
+    def convert_dataclass(self, obj: Any) -> Any:
+        """Convert the fields of the given dataclass instance with the
+        dict factory."""
+        names = self.class_fields(type(obj))
+        factory = self.dict_factory
+        if factory is dict:
+            return {name: self.convert(getattr(obj, name)) for name in names}
+
+        if factory is filter_none:
+            result = {}
+            for name in names:
+                value = getattr(obj, name)
+                if value is not None:
+                    result[name] = self.convert(value)
+
+            return result
+
+        if factory is filter_empty:
+            result = {}
+            for name in names:
+                value = self.convert(getattr(obj, name))
+                if not is_empty(value):
+                    result[name] = value
+
+            return result
+
+        return factory([(name, self.convert(getattr(obj, name))) for name in names])
+
+    @classmethod
+    def convert_value(cls, value: Any) -> Any:
+        """Return the leaf values as they are."""
+        return value
+
+    @classmethod
+    def class_fields(cls, clazz: Type) -> Tuple[str, ...]:
+        """Return the cached field names of the given dataclass."""
+        names = CLASS_FIELDS.get(clazz)
+        if names is None:
+            names = CLASS_FIELDS[clazz] = tuple(var.name for var in fields(clazz))
+
+        return names
+
+
+class JsonDictSerializer(DictSerializer):
+    """Dict serializer that also converts the leaf values of the default
+    json encoder to json primitives."""
+
+    @classmethod
+    def convert_value(cls, value: Any) -> Any:
+        """Convert enumerations to their values, decimals and qualified
+        names to strings."""
+        if isinstance(value, Enum):
+            return cls.convert_value(value.value)
+        if isinstance(value, Decimal):
+            return str(value)
+        if isinstance(value, QName):
+            return value.text
+
+        return value
 
 
 @dataclass
@@ -56,8 +177,169 @@ class JsonSerializer(AbstractSerializer):
 
     def render(self, obj: object) -> str:
         """Convert the given object tree to json string."""
-        return json.dumps(
-            asdict(obj, dict_factory=self.dict_factory),
-            cls=self.encoder,
+        return json.dumps(self.convert(obj), cls=self.encoder, indent=self.indent)
+
+    def write(self, obj: object, fp: TextIO):
+        """
+        Write the given object tree as json to the given text stream.
+
+        The json output is written chunk by chunk while the tree is
+        walked, list fields are written item by item and may also be
+        iterators or generators.
+        """
+        for chunk in self.iterencode(obj):
+            fp.write(chunk)
+
+    def iterencode(self, obj: object) -> Iterator[str]:
+        """Encode the given object tree and yield the json output in
+        chunks."""
+        writer = JsonWriter(
+            dict_factory=self.dict_factory,
+            encoder=self.encoder(indent=self.indent),
+            serializer=self.dict_serializer(),
             indent=self.indent,
         )
+        return iter(writer.encode(obj, 0))
+
+    def convert(self, obj: object) -> Dict:
+        """Convert the given object tree to dictionary."""
+        return self.dict_serializer().render(obj)
+
+    def dict_serializer(self) -> DictSerializer:
+        """Return the dict serializer for the encoder, the leaf values are
+        converted inline unless a custom encoder is used."""
+        if self.encoder is JsonEncoder:
+            return JsonDictSerializer(dict_factory=self.dict_factory)
+
+        return DictSerializer(dict_factory=self.dict_factory)
+
+
+class JsonWriter:
+    """
+    Incremental json encoder of object trees.
+
+    The dataclass fields are filtered with the filters of the
+    :class:`DictFactory` while they are encoded, any other dict factory
+    is applied to the converted dataclass instance.
+
+    :ivar dict_factory: Callable to generate dictionary
+    :ivar encoder: The leaf values encoder
+    :ivar serializer: The dict serializer for the leaf values and the
+        custom dict factories
+    :ivar indent: Pretty print indent string
+    :ivar item_separator: The separator of the object and array items
+    """
+
+    __slots__ = ("dict_factory", "encoder", "serializer", "indent", "item_separator")
+
+    def __init__(
+        self,
+        dict_factory: Callable,
+        encoder: json.JSONEncoder,
+        serializer: DictSerializer,
+        indent: Optional[Union[int, str]],
+    ):
+        self.dict_factory = dict_factory
+        self.encoder = encoder
+        self.serializer = serializer
+        self.indent = " " * indent if isinstance(indent, int) else indent
+        self.item_separator = ", " if indent is None else ","
+
+    def encode(self, value: Any, level: int) -> Iterable[str]:
+        """Return the json chunks of the given value."""
+        tp = type(value)
+        if tp in PRIMITIVE_TYPES:
+            return (self.encoder.encode(value),)
+
+        if hasattr(tp, "__dataclass_fields__"):
+            if self.dict_factory in (dict, filter_none, filter_empty):
+                return self.encode_object(self.iter_members(value, level + 1), level)
+
+            return self.encode(self.serializer.convert(value), level)
+
+        if isinstance(value, dict):
+            return self.encode_object(self.iter_items(value, level + 1), level)
+
+        if isinstance(value, (list, tuple, Iterator)):
+            return self.encode_array(value, level)
+
+        return (self.encoder.encode(self.serializer.convert_value(value)),)
+
+    def encode_object(
+        self, members: Iterable[Tuple[str, Iterable[str]]], level: int
+    ) -> Iterator[str]:
+        """Yield the json chunks of the given object member names and value
+        chunks."""
+        newline = self.newline(level + 1)
+        separator = "{"
+        for key, chunks in members:
+            yield f"{separator}{newline}{self.encoder.encode(key)}: "
+            separator = self.item_separator
+            yield from chunks
+
+        yield "{}" if separator == "{" else f"{self.newline(level)}}}"
+
+    def encode_array(self, values: Iterable, level: int) -> Iterator[str]:
+        """Yield the json chunks of the given array values."""
+        newline = self.newline(level + 1)
+        separator = "["
+        for value in values:
+            yield f"{separator}{newline}"
+            separator = self.item_separator
+            yield from self.encode(value, level + 1)
+
+        yield "[]" if separator == "[" else f"{self.newline(level)}]"
+
+    def iter_members(self, obj: Any, level: int) -> Iterator[Tuple[str, Iterable[str]]]:
+        """Yield the field names and value chunks of the given dataclass
+        instance that pass the dict factory filter."""
+        factory = self.dict_factory
+        for name in self.serializer.class_fields(type(obj)):
+            value = getattr(obj, name)
+            if factory is filter_empty:
+                chunks = self.encode_non_empty(value, level)
+                if chunks is not None:
+                    yield name, chunks
+            elif factory is not filter_none or value is not None:
+                yield name, self.encode(value, level)
+
+    def iter_items(self, data: Dict, level: int) -> Iterator[Tuple[str, Iterable[str]]]:
+        """Yield the keys and value chunks of the given dictionary."""
+        for key, value in data.items():
+            if not isinstance(key, str):
+                key = self.serializer.convert_value(key)
+                if not isinstance(key, str):
+                    key = json.dumps(key)
+
+            yield key, self.encode(value, level)
+
+    def encode_non_empty(self, value: Any, level: int) -> Optional[Iterable[str]]:
+        """Return the json chunks of the given value or None if the value is
+        empty, nested dataclasses and iterators are inspected lazily."""
+        if is_empty(value):
+            return None
+
+        if hasattr(type(value), "__dataclass_fields__"):
+            members = self.iter_members(value, level + 1)
+            first = next(members, None)
+            if first is None:
+                return None
+
+            return self.encode_object(itertools.chain((first,), members), level)
+
+        if isinstance(value, Iterator):
+            values = iter(value)
+            item: Any = next(values, EMPTY)
+            if item is EMPTY:
+                return None
+
+            return self.encode_array(itertools.chain((item,), values), level)
+
+        return self.encode(value, level)
+
+    def newline(self, level: int) -> str:
+        """Return the line break and indentation of the given level."""
+        if self.indent is None:
+            return ""
+
+        return "\n" + self.indent * level
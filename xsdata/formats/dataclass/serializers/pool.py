@@ -0,0 +1,120 @@
+import os
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Type
+
+from lxml.etree import Element
+from lxml.etree import SubElement
+
+from xsdata.formats.bindings import AbstractSerializer
+from xsdata.formats.dataclass.serializers.writer import PLACEHOLDER
+
+__worker__: Dict[str, Any] = {}
+
+
+def init_worker(factory: Callable[[], AbstractSerializer]):
+    """Build the process serializer once, its context is reused for every
+    chunk the process handles."""
+    __worker__["serializer"] = factory()
+
+
+def render_chunk(
+    qname: str, clazz: Type, name: str, nsmap: Dict, ns_map: Dict, values: Sequence
+) -> Optional[bytes]:
+    """Render the given values of the named list field with the process
+    serializer."""
+    serializer = __worker__["serializer"]
+    return serializer.render_fragment(qname, clazz, name, nsmap, ns_map, values)
+
+
+class FragmentSlot(list):
+    """
+    Empty list value that marks the position of a list field in the
+    rendered tree.
+
+    Iterating the slot appends two placeholder children to the parent
+    element, the output between them is the separator of the fragments.
+    """
+
+    def __init__(self, parent: Element):
+        super().__init__()
+        self.parent = parent
+
+    def __iter__(self) -> Iterator:
+        SubElement(self.parent, PLACEHOLDER)
+        SubElement(self.parent, PLACEHOLDER)
+        return iter(())
+
+
+class SerializerPool:
+    """
+    Fan out the chunks of a list field to a process pool.
+
+    :ivar factory: Picklable callable that builds the worker serializer
+    :ivar workers: Number of worker processes, default: cpu count
+    :ivar chunksize: Number of values per task
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], AbstractSerializer],
+        workers: Optional[int] = None,
+        chunksize: int = 1000,
+    ):
+        self.factory = factory
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = max(chunksize, 1)
+
+    def render(
+        self, task: Callable[[Sequence], Optional[bytes]], values: Sequence
+    ) -> Optional[List[bytes]]:
+        """
+        Render the values in chunks and return the output of every chunk
+        in order.
+
+        The number of tasks in flight is bounded to twice the number of
+        workers. The pending tasks are cancelled and None is returned
+        as soon as a chunk can't be rendered by the workers.
+        """
+        limit = self.workers * 2
+        results: List[bytes] = []
+        queue: Deque[Future] = deque()
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers, initializer=init_worker, initargs=(self.factory,),
+        ) as executor:
+            try:
+                for start in range(0, len(values), self.chunksize):
+                    end = start + self.chunksize
+                    queue.append(executor.submit(task, values[start:end]))
+                    if len(queue) >= limit and not self.collect(queue, results):
+                        return None
+
+                while queue:
+                    if not self.collect(queue, results):
+                        return None
+            finally:
+                for future in queue:
+                    future.cancel()
+
+        return results
+
+    @classmethod
+    def collect(cls, queue: Deque[Future], results: List[bytes]) -> bool:
+        """Wait for the oldest task and append its output to the results,
+        return whether the chunk was rendered."""
+        output = queue.popleft().result()
+        if output is None:
+            return False
+
+        results.append(output)
+        return True
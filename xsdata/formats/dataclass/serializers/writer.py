@@ -0,0 +1,174 @@
+from typing import BinaryIO
+from typing import List
+from typing import Optional
+
+from lxml.etree import Element
+from lxml.etree import SubElement
+from lxml.etree import tostring
+
+PLACEHOLDER = "_"
+PLACEHOLDER_BYTES = b"<_/>"
+
+
+class XmlWriterFrame:
+    """
+    Open element of the xml writer.
+
+    :ivar element: The lxml element
+    :ivar head: The chain output up to the first child of the element
+    :ivar tail: The chain output after the last child of the element
+    :ivar separator: The output between two children of the element
+    :ivar count: Number of children written so far
+    """
+
+    __slots__ = ("element", "head", "tail", "separator", "count")
+
+    def __init__(self, element: Element):
+        self.element = element
+        self.head: Optional[bytes] = None
+        self.tail = b""
+        self.separator = b""
+        self.count = 0
+
+
+class XmlWriter:
+    """
+    Incremental xml writer of lxml element trees.
+
+    The open elements form a chain from the root element to the current
+    container and every open element keeps only its current child. The
+    output of every element is sliced from the serialization of the
+    chain, the formatting, escaping and namespace declarations are
+    exactly the ones of the complete tree.
+
+    Containers must never get text content, the start tag of a container
+    is written with its first child.
+
+    :ivar fp: The binary output stream
+    :ivar encoding: Result text encoding, compatible with ascii
+    :ivar pretty_print: Enable pretty output
+    :ivar frames: The open elements stack
+    """
+
+    __slots__ = ("fp", "encoding", "pretty_print", "frames")
+
+    def __init__(self, fp: BinaryIO, encoding: str, pretty_print: bool):
+        self.fp = fp
+        self.encoding = encoding
+        self.pretty_print = pretty_print
+        self.frames: List[XmlWriterFrame] = []
+
+    @classmethod
+    def supports(cls, encoding: str) -> bool:
+        """Return whether the output chunks of the given encoding can be
+        sliced and concatenated."""
+        output = tostring(
+            Element(PLACEHOLDER), encoding=encoding, xml_declaration=False
+        )
+        return output == PLACEHOLDER_BYTES
+
+    def write_declaration(self):
+        """Write the xml declaration."""
+        output = tostring(
+            Element(PLACEHOLDER), encoding=self.encoding, xml_declaration=True
+        )
+        self.fp.write(output[: -len(PLACEHOLDER_BYTES)])
+
+    def start(self, element: Element):
+        """Open the given element, it's either the root element or the last
+        child of the current container."""
+        self.frames.append(XmlWriterFrame(element))
+
+    @property
+    def empty(self) -> bool:
+        """Return whether the current container has no children so far."""
+        return self.frames[-1].count == 0
+
+    def container(self) -> Element:
+        """Return the current container element, the open elements that
+        weren't written yet are written first."""
+        frame = self.frames[-1]
+        if frame.head is None:
+            self.open()
+
+        return frame.element
+
+    def flush(self):
+        """Write and detach the children that were appended to the current
+        container."""
+        frame = self.frames[-1]
+        output = self.serialize(frame)
+        self.write_child(frame, self.strip(output, frame.head, frame.tail))
+        del frame.element[:]
+
+    def end(self):
+        """Close the current container, a container without children is
+        written as an empty element."""
+        frame = self.frames.pop()
+        parent = self.frames[-1] if self.frames else None
+        parent_head = parent.head if parent else b""
+        parent_tail = parent.tail if parent else b""
+
+        if frame.head is not None:
+            self.fp.write(self.strip(frame.tail, b"", parent_tail))
+        else:
+            output = self.serialize(frame)
+            self.write_child(parent, self.strip(output, parent_head, parent_tail))
+
+        if parent:
+            parent.element.remove(frame.element)
+
+    def open(self):
+        """Write the start tags of the open elements that weren't written
+        yet, outermost first, they are always at the top of the stack."""
+        start = len(self.frames)
+        while start and self.frames[start - 1].head is None:
+            start -= 1
+
+        for index in range(start, len(self.frames)):
+            frame = self.frames[index]
+            parent = self.frames[index - 1] if index else None
+            element = frame.element
+            SubElement(element, PLACEHOLDER)
+            single = self.serialize(frame)
+            SubElement(element, PLACEHOLDER)
+            double = self.serialize(frame)
+            del element[-2:]
+
+            frame.head = single[: single.rindex(PLACEHOLDER_BYTES)]
+            frame.tail = self.strip(single, frame.head + PLACEHOLDER_BYTES, b"")
+            frame.separator = self.strip(
+                double, frame.head + PLACEHOLDER_BYTES, PLACEHOLDER_BYTES + frame.tail
+            )
+
+            parent_head = parent.head if parent else b""
+            self.write_child(parent, self.strip(frame.head, parent_head, b""))
+
+    def write_child(self, parent: Optional[XmlWriterFrame], output: bytes):
+        """Write the output of a child of the given parent, preceded by the
+        separator of the previous child."""
+        if parent:
+            if parent.count:
+                self.fp.write(parent.separator)
+            parent.count += 1
+
+        self.fp.write(output)
+
+    @classmethod
+    def strip(cls, output: bytes, head: bytes, tail: bytes) -> bytes:
+        """Strip the given head and tail lengths from the output."""
+        start = len(head)
+        end = len(output) - len(tail)
+        return output[start:end]
+
+    def serialize(self, frame: XmlWriterFrame) -> bytes:
+        """Serialize the chain of the open elements, the root element is
+        the first frame or the given frame if there are no open
+        elements."""
+        root = self.frames[0] if self.frames else frame
+        return tostring(
+            root.element,
+            encoding=self.encoding,
+            pretty_print=self.pretty_print,
+            xml_declaration=False,
+        )
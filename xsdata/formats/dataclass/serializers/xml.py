@@ -1,9 +1,20 @@
+from copy import deepcopy
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import is_dataclass
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
 from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+from typing import Union
 
 from lxml.etree import cleanup_namespaces
 from lxml.etree import Element
@@ -14,11 +25,21 @@ from lxml.etree import tostring
 from xsdata.exceptions import SerializerError
 from xsdata.formats.bindings import AbstractSerializer
 from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.elements import RenderMode
 from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlNamespacePlan
+from xsdata.formats.dataclass.models.elements import XmlRenderStep
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.models.generics import Namespaces
+from xsdata.formats.dataclass.serializers.pool import FragmentSlot
+from xsdata.formats.dataclass.serializers.pool import render_chunk
+from xsdata.formats.dataclass.serializers.pool import SerializerPool
 from xsdata.formats.dataclass.serializers.utils import SerializeUtils
+from xsdata.formats.dataclass.serializers.writer import PLACEHOLDER
+from xsdata.formats.dataclass.serializers.writer import PLACEHOLDER_BYTES
+from xsdata.formats.dataclass.serializers.writer import XmlWriter
+from xsdata.logger import logger
 from xsdata.models.enums import QNames
 
 
@@ -43,93 +64,510 @@ class XmlSerializer(AbstractSerializer):
         Optionally provide a namespaces instance with a predefined list
         of namespace uris and prefixes.
         """
+        return self.render_bytes(obj, namespaces).decode(self.encoding)
+
+    def render_bytes(self, obj: Any, namespaces: Optional[Namespaces] = None) -> bytes:
+        """Convert the given object tree to xml bytes in the serializer
+        encoding."""
         tree = self.render_tree(obj, namespaces)
         return tostring(
             tree,
             xml_declaration=self.xml_declaration,
             encoding=self.encoding,
             pretty_print=self.pretty_print,
-        ).decode()
+        )
 
     def render_tree(self, obj: Any, namespaces: Optional[Namespaces] = None) -> Element:
         """
         Convert a dataclass instance to a nested Element structure.
 
         Optionally provide a namespaces instance with a predefined list
-        of namespace uris and prefixes.
+        of namespace uris and prefixes. The prefixes are declared on the
+        root element, lxml's global namespace registry is never modified.
+
+        The root declarations of the first tree of the class are reused,
+        the tree has to be cleaned up only if its namespaces don't match
+        them.
         """
         meta = self.context.build(obj.__class__)
         namespaces = namespaces or Namespaces()
-        namespaces.register()
+        registry = namespaces.registry
         namespaces.add(meta.qname.namespace)
-        root = Element(meta.qname)
+        plan = self.context.namespace_plan(meta.clazz)
+        if plan:
+            tree = Element(meta.qname, nsmap=plan.nsmap)
+            self.render_node(tree, obj, namespaces)
+            if plan.matches(registry, namespaces.ns_map):
+                return tree
+
+            # Move the content under a root without the planned
+            # declarations, the cleanup assigns the tree prefixes.
+            root = Element(meta.qname, attrib=tree.attrib, nsmap=registry)
+            root.text = tree.text
+            root.extend(tree)
+        else:
+            root = Element(meta.qname, nsmap=registry)
+            self.render_node(root, obj, namespaces)
 
-        self.render_node(root, obj, namespaces)
         cleanup_namespaces(
             root, top_nsmap=namespaces.ns_map, keep_ns_prefixes=namespaces.prefixes
         )
+        if not plan:
+            plan = XmlNamespacePlan(registry, namespaces.ns_map, root.nsmap)
+            self.context.save_namespace_plan(meta.clazz, plan)
+
         return root
 
+    def render_root(self, meta: XmlMeta, namespaces: Namespaces) -> Element:
+        """Create the root element of the given class metadata, the
+        predefined prefixes are declared on it."""
+        nsmap = namespaces.registry
+        namespaces.add(meta.qname.namespace)
+        return Element(meta.qname, nsmap=nsmap)
+
+    def render_parallel(
+        self,
+        obj: Any,
+        name: str,
+        workers: Optional[int] = None,
+        chunksize: int = 1000,
+        namespaces: Optional[Namespaces] = None,
+    ) -> bytes:
+        """
+        Convert the given object tree to xml bytes, the values of the named
+        list field are rendered in chunks in a process pool.
+
+        Every worker process builds its own serializer once and reuses its
+        context for all of its chunks. The chunks output is joined under
+        the root element that declares the namespaces of the whole tree,
+        the result is identical to :meth:`render_bytes`.
+
+        The whole object is rendered sequentially if the list values use
+        namespaces that the rest of the tree doesn't, e.g. the xsi
+        namespace of nil elements, if the class tree can use namespaces
+        outside its fields or if the list is sequential or surrounded by
+        mixed content. Every fallback is logged at debug level.
+        """
+        meta = self.context.build(obj.__class__)
+        if not any(var.name == name for var in meta.vars):
+            raise SerializerError(f"{meta.clazz.__name__} has no field `{name}`")
+
+        values = getattr(obj, name)
+        if (
+            not self.is_parallel(meta, name)
+            or not isinstance(values, list)
+            or len(values) <= chunksize
+            or not XmlWriter.supports(self.encoding)
+            or not self.context.is_qualified(meta.clazz)
+        ):
+            logger.debug("Rendering %s sequentially: unsupported", meta.clazz)
+            return self.render_bytes(obj, namespaces)
+
+        state = deepcopy(namespaces) if namespaces else Namespaces()
+        root = self.render_root(meta, state)
+        shell = replace(obj, **{name: FragmentSlot(root)})
+        self.render_node(root, shell, state)
+        cleanup_namespaces(
+            root, top_nsmap=state.ns_map, keep_ns_prefixes=state.prefixes
+        )
+        nsmap = root.nsmap
+        ns_map = state.ns_map
+        output = tostring(
+            root,
+            xml_declaration=self.xml_declaration,
+            encoding=self.encoding,
+            pretty_print=self.pretty_print,
+        )
+        if self.is_mixed(root) or output.count(PLACEHOLDER_BYTES) != 2:
+            logger.debug("Rendering %s sequentially: mixed content", meta.clazz)
+            return self.render_bytes(obj, namespaces)
+
+        factory = partial(
+            type(self),
+            xml_declaration=False,
+            encoding=self.encoding,
+            pretty_print=self.pretty_print,
+            context=XmlContext(name_generator=self.context.name_generator),
+        )
+        pool = SerializerPool(factory, workers=workers, chunksize=chunksize)
+        task = partial(render_chunk, root.tag, meta.clazz, name, nsmap, ns_map)
+        fragments = pool.render(task, values)
+        if fragments is None:
+            logger.debug("Rendering %s sequentially: unrenderable chunk", meta.clazz)
+            return self.render_bytes(obj, namespaces)
+
+        head, separator, tail = output.split(PLACEHOLDER_BYTES)
+        return head + separator.join(fragments) + tail
+
+    def render_fragment(
+        self,
+        qname: str,
+        clazz: Type,
+        name: str,
+        nsmap: Dict,
+        ns_map: Dict,
+        values: Sequence,
+    ) -> Optional[bytes]:
+        """
+        Render the given values of the named list field of the class as the
+        children of a root element with the given namespace declarations
+        and return their output.
+
+        The namespaces start from the given prefixes map, the output is
+        discarded if the values need new namespaces or put text and
+        attributes on the root element.
+        """
+        meta = self.context.build(clazz)
+        var = next(var for var in meta.vars if var.name == name)
+        mode = XmlRenderStep.mode_of(var)
+        namespaces = Namespaces()
+        namespaces.add_all(ns_map)
+        ns_map = namespaces.ns_map
+
+        root = Element(qname, nsmap=nsmap)
+        SubElement(root, PLACEHOLDER)
+        single = tostring(root, encoding=self.encoding, pretty_print=self.pretty_print)
+        head = single[: single.rindex(PLACEHOLDER_BYTES)]
+        tail = XmlWriter.strip(single, head + PLACEHOLDER_BYTES, b"")
+        del root[:]
+
+        for value in values:
+            if mode == RenderMode.SIMPLE:
+                self.render_simple_node(root, value, var, namespaces)
+                continue
+
+            if mode == RenderMode.ELEMENT:
+                node = self.render_element_node(root, value, var, namespaces)
+            else:
+                node = self.render_sub_node(root, value, var, namespaces)
+
+            if node:
+                self.render_nodes(node)
+
+        if namespaces.ns_map is not ns_map or len(root.attrib) or self.is_mixed(root):
+            return None
+
+        output = tostring(root, encoding=self.encoding, pretty_print=self.pretty_print)
+        return XmlWriter.strip(output, head, tail)
+
+    @classmethod
+    def is_parallel(cls, meta: XmlMeta, name: str) -> bool:
+        """Return whether the named field is a non sequential list of
+        elements or nodes that can be rendered in chunks."""
+        return any(
+            step.var.name == name
+            and step.var.is_list
+            and step.mode in (RenderMode.ELEMENT, RenderMode.SIMPLE, RenderMode.NODE)
+            for step in meta.render_steps
+        )
+
+    @classmethod
+    def is_mixed(cls, element: Element) -> bool:
+        """Return whether the given element has text or children with tail
+        text, the children of mixed elements are never indented."""
+        return element.text is not None or any(
+            child.tail is not None for child in element
+        )
+
+    def write(
+        self,
+        obj: Any,
+        fp: Union[str, Path, BinaryIO],
+        namespaces: Optional[Namespaces] = None,
+    ):
+        """
+        Write the given object tree as xml to the binary stream or the file
+        path.
+
+        Dataclasses with only attributes and elements are written element
+        by element and their list fields may also be iterators, the
+        memory footprint is bounded by their largest child of any other
+        kind.
+
+        The root element is written before its children are rendered, it
+        declares only the predefined prefixes and its own namespace. The
+        other namespaces are declared on the first element that uses them,
+        the output is then equivalent to but not identical with
+        :meth:`render_bytes`. Provide the namespaces upfront to get the
+        same declarations.
+        """
+        if isinstance(fp, (str, Path)):
+            with open(fp, "wb") as stream:
+                self.write(obj, stream, namespaces)
+            return
+
+        meta = self.context.build(obj.__class__)
+        if not self.is_container(meta) or not XmlWriter.supports(self.encoding):
+            fp.write(self.render_bytes(obj, namespaces))
+            return
+
+        namespaces = namespaces or Namespaces()
+        root = self.render_root(meta, namespaces)
+        writer = XmlWriter(fp, encoding=self.encoding, pretty_print=self.pretty_print)
+        if self.xml_declaration:
+            writer.write_declaration()
+
+        writer.start(root)
+        node = self.write_complex_node(writer, root, obj, meta, None, namespaces)
+        self.render_nodes(node)
+
+    def write_complex_node(
+        self,
+        writer: XmlWriter,
+        element: Element,
+        obj: Any,
+        meta: XmlMeta,
+        var: Optional[XmlVar],
+        namespaces: Namespaces,
+    ) -> Iterator[Iterator]:
+        """Write the given open container element, yield the nested
+        containers and close it, the attributes are set before any child
+        is written."""
+        for attr in meta.vars:
+            value = getattr(obj, attr.name)
+            if value is None:
+                continue
+            elif attr.is_attribute:
+                SerializeUtils.set_attribute(element, attr.qname, value, namespaces)
+            elif attr.is_attributes:
+                SerializeUtils.set_attributes(element, value, namespaces)
+
+        if var:
+            self.set_xsi_type(element, obj, var, namespaces)
+
+        self.declare_namespaces(element, namespaces)
+        for child_var, value in self.next_value(meta, obj):
+            if value is None or child_var.is_attribute or child_var.is_attributes:
+                continue
+
+            values = value if isinstance(value, (list, Iterator)) else (value,)
+            for val in values:
+                node = self.write_sub_node(writer, val, child_var, namespaces)
+                if node:
+                    yield node
+
+        if writer.empty:
+            SerializeUtils.set_nil_attribute(element, meta.nillable, namespaces)
+            if var:
+                SerializeUtils.set_nil_attribute(element, var.nillable, namespaces)
+
+        writer.end()
+
+    def write_sub_node(
+        self, writer: XmlWriter, value: Any, var: XmlVar, namespaces: Namespaces
+    ) -> Optional[Iterator]:
+        """Write the given child value in the current container, element
+        only dataclasses are opened as new containers and their node is
+        returned."""
+        parent = writer.container()
+        clazz: Type = value.__class__
+        if is_dataclass(clazz) and not isinstance(value, AnyElement):
+            qname = value.qname if hasattr(value, "qname") else var.qname
+            meta = self.context.build(clazz, QName(qname).namespace)
+            if self.is_container(meta):
+                if isinstance(qname, QName):
+                    namespaces.add(qname.namespace)
+
+                nsmap = self.missing_namespaces(parent, namespaces)
+                element = SubElement(parent, qname, nsmap=nsmap)
+                writer.start(element)
+                return self.write_complex_node(
+                    writer, element, value, meta, var, namespaces
+                )
+
+        node = self.render_sub_node(parent, value, var, namespaces)
+        if node:
+            self.render_nodes(node)
+
+        for child in parent:
+            self.declare_namespaces(child, namespaces)
+
+        writer.flush()
+        return None
+
+    @classmethod
+    def declare_namespaces(cls, element: Element, namespaces: Namespaces):
+        """Declare on the given element the registered namespaces that aren't
+        in its scope, qualified values depend on their prefixes."""
+        missing = cls.missing_namespaces(element, namespaces)
+        if missing:
+            cleanup_namespaces(
+                element, top_nsmap=missing, keep_ns_prefixes=list(missing)
+            )
+
+    @classmethod
+    def missing_namespaces(cls, element: Element, namespaces: Namespaces) -> Dict:
+        """Return the registered namespaces that aren't in the scope of the
+        given element."""
+        nsmap = element.nsmap
+        return {
+            prefix: uri
+            for prefix, uri in namespaces.ns_map.items()
+            if nsmap.get(prefix) != uri
+        }
+
+    @classmethod
+    def is_container(cls, meta: XmlMeta) -> bool:
+        """Return whether the class has only attributes and elements that
+        can't hold wildcards and at least one list or dataclass element."""
+        return all(
+            var.is_attribute
+            or var.is_attributes
+            or (var.is_element and not var.is_any_type)
+            for var in meta.vars
+        ) and any(
+            var.is_element and (var.is_list or var.dataclass) for var in meta.vars
+        )
+
     def render_node(self, parent: Element, obj: Any, namespaces: Namespaces):
-        """Recursively traverse the given object and build the xml tree."""
+        """Traverse the given object and build the xml tree."""
         if is_dataclass(obj):
-            self.render_complex_node(parent, obj, namespaces)
+            self.render_nodes(self.render_complex_node(parent, obj, namespaces))
         else:
             SerializeUtils.set_text(parent, obj, namespaces)
 
-    def render_complex_node(self, parent: Element, obj: Any, namespaces: Namespaces):
+    @classmethod
+    def render_nodes(cls, node: Iterator):
+        """
+        Exhaust the given node and its nested nodes with an explicit stack.
+
+        Nodes are generators that yield their nested nodes, a node is
+        resumed after its last yielded node is exhausted. The depth of
+        the object tree is only bounded by the memory.
+        """
+        stack = [node]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+            else:
+                stack.append(child)
+
+    def render_complex_node(
+        self,
+        parent: Element,
+        obj: Any,
+        namespaces: Namespaces,
+        var: Optional[XmlVar] = None,
+    ) -> Iterator[Iterator]:
+        """Execute the compiled render steps of the object class and yield
+        the nested nodes, the xsi type and nil attributes of the given
+        element var are set last."""
         meta = self.context.build(obj.__class__, QName(parent).namespace)
-        for var, value in self.next_value(meta, obj):
+        for step in meta.render_steps:
+            mode = step.mode
+            child_var = step.var
+            if mode == RenderMode.SEQUENCE:
+                for child_var, value in self.next_sequence_value(step.sequence, obj):
+                    node = self.render_sub_node(parent, value, child_var, namespaces)
+                    if node:
+                        yield node
+                continue
+
+            value = getattr(obj, child_var.name)
             if value is None:
                 continue
-            elif var.is_attribute:
-                SerializeUtils.set_attribute(parent, var.qname, value, namespaces)
-            elif var.is_attributes:
+            elif mode == RenderMode.SIMPLE:
+                if isinstance(value, list):
+                    for val in value:
+                        self.render_simple_node(parent, val, child_var, namespaces)
+                else:
+                    self.render_simple_node(parent, value, child_var, namespaces)
+            elif mode == RenderMode.ELEMENT:
+                values = value if isinstance(value, list) else (value,)
+                for val in values:
+                    node = self.render_element_node(parent, val, child_var, namespaces)
+                    if node:
+                        yield node
+            elif mode == RenderMode.ATTRIBUTE:
+                SerializeUtils.set_attribute(parent, child_var.qname, value, namespaces)
+            elif mode == RenderMode.ATTRIBUTES:
                 SerializeUtils.set_attributes(parent, value, namespaces)
-            elif var.is_text:
-                namespaces.add(var.qname.namespace)
+            elif mode == RenderMode.TEXT:
+                namespaces.add(child_var.qname.namespace)
                 SerializeUtils.set_text(parent, value, namespaces)
             elif isinstance(value, list):
-                self.render_sub_nodes(parent, value, var, namespaces)
+                yield self.render_sub_nodes(parent, value, child_var, namespaces)
             else:
-                self.render_sub_node(parent, value, var, namespaces)
+                node = self.render_sub_node(parent, value, child_var, namespaces)
+                if node:
+                    yield node
 
         SerializeUtils.set_nil_attribute(parent, meta.nillable, namespaces)
+        if var:
+            if var.dataclass:
+                self.set_xsi_type(parent, obj, var, namespaces)
+
+            if var.nillable:
+                SerializeUtils.set_nil_attribute(parent, True, namespaces)
 
     def render_sub_nodes(
         self, parent: Element, values: List, var: XmlVar, namespaces: Namespaces
-    ):
+    ) -> Iterator[Iterator]:
         for value in values:
-            self.render_sub_node(parent, value, var, namespaces)
+            node = self.render_sub_node(parent, value, var, namespaces)
+            if node:
+                yield node
 
     def render_sub_node(
         self, parent: Element, value: Any, var: XmlVar, namespaces: Namespaces
-    ):
+    ) -> Optional[Iterator]:
+        """Render the given value and return the node of its nested
+        values, if any."""
         if isinstance(value, AnyElement):
-            self.render_wildcard_node(parent, value, var, namespaces)
-        elif var.is_element or is_dataclass(value):
-            self.render_element_node(parent, value, var, namespaces)
-        elif not parent.text:
+            return self.render_wildcard_node(parent, value, var, namespaces)
+
+        if var.is_element or is_dataclass(value):
+            return self.render_element_node(parent, value, var, namespaces)
+
+        if not parent.text:
             SerializeUtils.set_text(parent, value, namespaces)
         else:
             SerializeUtils.set_tail(parent, value, namespaces)
 
-    def render_element_node(
+        return None
+
+    def render_simple_node(
         self, parent: Element, value: Any, var: XmlVar, namespaces: Namespaces
     ):
-        qname = value.qname if hasattr(value, "qname") else var.qname
+        """Render the value of an element of simple type as text."""
+        qname = var.qname
+        namespaces.add(qname.namespace)
+        sub_element = SubElement(parent, qname)
+        SerializeUtils.set_text(sub_element, value, namespaces)
+        if var.nillable:
+            SerializeUtils.set_nil_attribute(sub_element, True, namespaces)
+
+    def render_element_node(
+        self, parent: Element, value: Any, var: XmlVar, namespaces: Namespaces
+    ) -> Optional[Iterator]:
+        """Render the given element value and return the node of its
+        children if it's a dataclass."""
+        is_complex = is_dataclass(value)
+        if is_complex and hasattr(value, "qname"):
+            qname = value.qname
+        else:
+            qname = var.qname
 
         if isinstance(qname, QName):
             namespaces.add(qname.namespace)
 
         sub_element = SubElement(parent, qname)
-        self.render_node(sub_element, value, namespaces)
-        self.set_xsi_type(sub_element, value, var, namespaces)
-        SerializeUtils.set_nil_attribute(sub_element, var.nillable, namespaces)
+        if is_complex:
+            return self.render_complex_node(sub_element, value, namespaces, var)
+
+        SerializeUtils.set_text(sub_element, value, namespaces)
+        if var.dataclass:
+            self.set_xsi_type(sub_element, value, var, namespaces)
+
+        if var.nillable:
+            SerializeUtils.set_nil_attribute(sub_element, True, namespaces)
+
+        return None
 
     def render_wildcard_node(
         self, parent: Element, value: Any, var: XmlVar, namespaces: Namespaces
-    ):
+    ) -> Iterator[Iterator]:
         if value.qname:
             sub_element = SubElement(parent, value.qname)
         else:
@@ -140,7 +578,9 @@ class XmlSerializer(AbstractSerializer):
         SerializeUtils.set_tail(sub_element, value.tail, namespaces)
         SerializeUtils.set_attributes(sub_element, value.attributes, namespaces)
         for child in value.children:
-            self.render_sub_node(sub_element, child, var, namespaces)
+            node = self.render_sub_node(sub_element, child, var, namespaces)
+            if node:
+                yield node
 
         SerializeUtils.set_nil_attribute(sub_element, var.nillable, namespaces)
 
@@ -150,42 +590,39 @@ class XmlSerializer(AbstractSerializer):
         if not var.clazz or value.__class__ is var.clazz:
             return
 
-        if self.context.is_derived(value, var.clazz):
-            meta = self.context.fetch(value.__class__, QName(parent.tag).namespace)
-            SerializeUtils.set_attribute(
-                parent, QNames.XSI_TYPE, meta.source_qname, namespaces
-            )
+        xsi_type = self.context.xsi_type(
+            value.__class__, var.clazz, QName(parent.tag).namespace
+        )
+        if xsi_type:
+            SerializeUtils.set_attribute(parent, QNames.XSI_TYPE, xsi_type, namespaces)
         else:
             raise SerializerError(
                 f"{value.__class__.__name__} is not derived from {var.clazz.__name__}"
             )
 
     @classmethod
-    def next_value(cls, meta: XmlMeta, obj: Any):
-
-        index = 0
-        attrs = meta.vars
-        stop = len(attrs)
-        while index < stop:
-            var = attrs[index]
-            if not var.sequential:
-                yield var, getattr(obj, var.name)
-                index += 1
-                continue
+    def next_value(cls, meta: XmlMeta, obj: Any) -> Iterator[Tuple[XmlVar, Any]]:
+        """Return the vars and values of the given object in the render steps
+        order, the sequential values are interleaved."""
+        for step in meta.render_steps:
+            if step.mode == RenderMode.SEQUENCE:
+                yield from cls.next_sequence_value(step.sequence, obj)
+            else:
+                yield step.var, getattr(obj, step.var.name)
 
-            end = next(
-                (i for i in range(index + 1, stop) if not attrs[i].sequential), stop
-            )
-            sequence = attrs[index:end]
-            index = end
-            j = 0
-
-            rolling = True
-            while rolling:
-                rolling = False
-                for var in sequence:
-                    values = getattr(obj, var.name)
-                    if j < len(values):
-                        rolling = True
-                        yield var, values[j]
-                j += 1
+    @classmethod
+    def next_sequence_value(
+        cls, sequence: List[XmlVar], obj: Any
+    ) -> Iterator[Tuple[XmlVar, Any]]:
+        """Return the values of the given sequential vars round robin until
+        all of them are exhausted."""
+        j = 0
+        rolling = True
+        while rolling:
+            rolling = False
+            for var in sequence:
+                values = getattr(obj, var.name)
+                if j < len(values):
+                    rolling = True
+                    yield var, values[j]
+            j += 1
@@ -22,6 +22,10 @@ def collapse_whitespace(string: str) -> str:
     return " ".join([part for part in string.split(" ") if part.strip()])
 
 
+def identity(string: str) -> str:
+    return string
+
+
 def capitalize(string: str) -> str:
     return string[0].upper() + string[1:]
 